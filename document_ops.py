@@ -0,0 +1,925 @@
+"""
+document_ops.py — Multi-document operations (merge, split, image import) that scale to large file sets
+Runs outside the UI thread; pages are streamed in bounded batches and shared
+resources are stored once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+import fitz  # PyMuPDF
+from PyQt6.QtCore import QSettings, QThread, pyqtSignal
+
+from models import SaveProfile, save_profile
+from snapshots import DocumentSnapshot
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow missing → images are embedded as-is
+    Image = None
+
+
+_REF_RE = re.compile(r"\b(\d+) 0 R\b")
+
+
+# ─────────────────────────────────────────────
+# Resource Deduplication
+# ─────────────────────────────────────────────
+
+class ResourceDeduper:
+    """
+    Stores identical page resources (images, embedded fonts, ICC profiles,
+    form XObjects, resource dictionaries) once.
+
+    insert_pdf() copies every source's resources, so merging 400 statements
+    that all carry the same logo and fonts stores them 400 times. After pages
+    are added, `dedupe_pages()` hashes the objects reachable from their
+    /Resources (children before parents, with already-merged references
+    substituted), points duplicates at the first copy and empties them.
+
+    The seen-hashes table lives across calls, so one deduper can follow a
+    document through many batches — including after it was flushed to disk
+    and reopened, since flushing never renumbers objects. For a document that
+    is edited between calls, pass `verify=True`: a hit is then re-hashed
+    before it is reused, so an object changed since it was indexed is never
+    substituted.
+
+    Indexing existing pages reads only object dictionaries. Their streams
+    (images, fonts — the expensive part) are filed by /Length and hashed
+    only when a new stream of the same length shows up.
+    """
+
+    def __init__(self, doc: Optional[fitz.Document] = None, verify: bool = False):
+        self.doc = doc                    # document the xrefs in _seen belong to
+        self.verify = verify
+        self._seen: dict[str, int] = {}   # content hash → canonical xref
+        self._by_length: dict[int, list[int]] = {}   # raw length → indexed, unhashed streams
+        self._indexed = False
+        self.merged = 0                   # duplicate objects removed
+        self.bytes_saved = 0              # raw stream bytes no longer stored
+
+    @staticmethod
+    def _resource_roots(doc: fitz.Document, pages: Iterable[int]) -> list[int]:
+        roots: list[int] = []
+        for pno in pages:
+            kind, value = doc.xref_get_key(doc[pno].xref, "Resources")
+            if kind == "xref":
+                roots.append(int(value.split()[0]))
+            elif kind == "dict":
+                # Inline resource dict: only its children can be shared
+                roots.extend(int(ref) for ref in _REF_RE.findall(value))
+        return roots
+
+    @staticmethod
+    def _hash(doc: fitz.Document, xref: int, text: str) -> tuple[str, int]:
+        h = hashlib.sha1(text.encode("latin-1", "replace"))
+        size = 0
+        if doc.xref_is_stream(xref):
+            raw = doc.xref_stream_raw(xref) or b""
+            size = len(raw)
+            h.update(b"\0stream\0")
+            h.update(raw)
+        return h.hexdigest(), size
+
+    @staticmethod
+    def _raw_length(doc: fitz.Document, xref: int) -> int:
+        """Stream length from the dictionary, without reading the stream."""
+        kind, value = doc.xref_get_key(xref, "Length")
+        if kind == "int":
+            return int(value)
+        if kind == "xref":
+            return int(doc.xref_object(int(value.split()[0])).strip())
+        return len(doc.xref_stream_raw(xref) or b"")
+
+    def _hash_length(self, doc: fitz.Document, size: int):
+        """Hash the indexed streams of `size` raw bytes into the seen table."""
+        for xref in self._by_length.pop(size, ()):
+            try:
+                key = self._hash(doc, xref, doc.xref_object(xref, compressed=True))[0]
+            except Exception:
+                continue
+            self._seen.setdefault(key, xref)
+
+    def index_pages(self, doc: fitz.Document, pages: Iterable[int]):
+        """Register the resources of existing pages as reuse targets (no merging)."""
+        done: set[int] = set()
+
+        def visit(xref: int, stack: set):
+            if xref in done or xref in stack or not 0 < xref < doc.xref_length():
+                return
+            stack.add(xref)
+            text = doc.xref_object(xref, compressed=True)
+            for ref in _REF_RE.findall(text):
+                visit(int(ref), stack)
+            stack.discard(xref)
+            done.add(xref)
+            if doc.xref_is_stream(xref):
+                self._by_length.setdefault(self._raw_length(doc, xref), []).append(xref)
+            else:
+                self._seen.setdefault(self._hash(doc, xref, text)[0], xref)
+
+        for root in self._resource_roots(doc, pages):
+            visit(root, set())
+        self._indexed = True
+
+    def dedupe_inserted(self, doc: fitz.Document, pages: Iterable[int], first_xref: int):
+        """dedupe_pages() for pages just inserted into a live document.
+
+        The first call indexes the pages that were already there (streams
+        are hashed on demand, see the class docs); later calls reuse that
+        index (verified on hit), so repeated inserts only hash the new objects.
+        """
+        pages = list(pages)
+        if not self._indexed:
+            inserted = set(pages)
+            self.index_pages(doc, (p for p in range(doc.page_count) if p not in inserted))
+        self.dedupe_pages(doc, pages, first_xref)
+
+    def dedupe_pages(self, doc: fitz.Document, pages: Iterable[int], first_xref: int):
+        """Dedupe resources of `pages` against everything seen so far.
+
+        Only objects numbered >= first_xref (i.e. created since the previous
+        call) are merged away; older objects are either canonical already or
+        belong to pages that were in the document before.
+        """
+        mapping: dict[int, int] = {}
+        keys: dict[int, str] = {}
+
+        def remap(text: str) -> str:
+            return _REF_RE.sub(lambda m: f"{mapping.get(int(m[1]), int(m[1]))} 0 R", text)
+
+        def still_matches(xref: int, key: str) -> bool:
+            if not 0 < xref < doc.xref_length():
+                return False
+            try:
+                return self._hash(doc, xref, doc.xref_object(xref, compressed=True))[0] == key
+            except Exception:
+                return False
+
+        def visit(xref: int, stack: set):
+            if xref in keys or xref in stack or xref < first_xref:
+                return
+            stack.add(xref)
+            text = doc.xref_object(xref, compressed=True)
+            for ref in _REF_RE.findall(text):
+                visit(int(ref), stack)
+            stack.discard(xref)
+
+            key, size = self._hash(doc, xref, remap(text))
+            keys[xref] = key
+            if key not in self._seen and size in self._by_length:
+                self._hash_length(doc, size)
+            canonical = self._seen.setdefault(key, xref)
+            if canonical != xref and canonical < first_xref and self.verify \
+                    and not still_matches(canonical, key):
+                self._seen[key] = canonical = xref
+            if canonical != xref:
+                mapping[xref] = canonical
+                self.bytes_saved += size
+
+        for root in self._resource_roots(doc, pages):
+            visit(root, set())
+
+        if not mapping:
+            return
+
+        # Repoint every object created in this batch (pages included)
+        for xref in range(first_xref, doc.xref_length()):
+            if xref in mapping:
+                continue
+            text = doc.xref_object(xref, compressed=True)
+            new = remap(text)
+            if new != text:
+                doc.update_object(xref, new)
+        # Empty the duplicates so neither memory nor an incremental flush keeps them
+        for xref in mapping:
+            if doc.xref_is_stream(xref):
+                doc.update_stream(xref, b"", compress=False)
+            doc.update_object(xref, "null")
+        self.merged += len(mapping)
+
+
+# ─────────────────────────────────────────────
+# Stamp Images
+# ─────────────────────────────────────────────
+
+class StampImageCache:
+    """
+    Embeds each stamp image once per document and references that xref from
+    every page it is burned onto.
+
+    The first use of a file in a document looks for an identical image
+    already in it (e.g. the same seal burned before the last save, after
+    which the document was reopened with fresh object numbers): the file is
+    embedded into a scratch document and its raw stream (and soft mask) are
+    compared against the page images of the same length. Later uses skip
+    reading and decoding the file entirely.
+    """
+
+    def __init__(self):
+        self.doc: Optional[fitz.Document] = None
+        self._xrefs: dict[tuple[str, float], int] = {}   # (path, mtime) → image xref
+        self._page_images: Optional[dict[str, list[int]]] = None   # /Length → image xrefs
+
+    def insert(self, page: fitz.Page, rect: fitz.Rect, path: str) -> int:
+        doc = page.parent
+        if doc is not self.doc:
+            self.doc = doc
+            self._xrefs.clear()
+            self._page_images = None
+        try:
+            key = (os.path.abspath(path), os.path.getmtime(path))
+        except OSError:
+            key = (os.path.abspath(path), 0.0)
+
+        xref = self._xrefs.get(key, 0)
+        if not (xref and self._is_image(doc, xref)):
+            xref = self._find_identical(doc, path)
+        if xref:
+            page.insert_image(rect, xref=xref)
+        else:
+            xref = page.insert_image(rect, filename=path)
+        self._xrefs[key] = xref
+        return xref
+
+    @staticmethod
+    def _is_image(doc: fitz.Document, xref: int) -> bool:
+        return 0 < xref < doc.xref_length() and doc.xref_get_key(xref, "Subtype") == ("name", "/Image")
+
+    @classmethod
+    def _same_image(cls, doc: fitz.Document, xref: int, other: fitz.Document, oxref: int) -> bool:
+        if doc.xref_stream_raw(xref) != other.xref_stream_raw(oxref):
+            return False
+        mask = doc.xref_get_key(xref, "SMask")
+        omask = other.xref_get_key(oxref, "SMask")
+        if mask[0] != omask[0]:
+            return False
+        if mask[0] != "xref":
+            return True
+        return cls._same_image(doc, int(mask[1].split()[0]), other, int(omask[1].split()[0]))
+
+    def _images_by_length(self, doc: fitz.Document) -> dict[str, list[int]]:
+        """Images referenced by pages, by /Length (collected once per document).
+
+        Images added to pages later are not listed; a stamp that matches one
+        of them is embedded again, which costs space but never correctness.
+        """
+        if self._page_images is None:
+            self._page_images = {}
+            seen: set[int] = set()
+            for page in doc:
+                for img in page.get_images(full=True):
+                    xref = img[0]
+                    if xref not in seen:
+                        seen.add(xref)
+                        length = doc.xref_get_key(xref, "Length")[1]
+                        self._page_images.setdefault(length, []).append(xref)
+        return self._page_images
+
+    def _find_identical(self, doc: fitz.Document, path: str) -> int:
+        try:
+            with fitz.open() as scratch:
+                sx = scratch.new_page().insert_image(fitz.Rect(0, 0, 1, 1), filename=path)
+                length = scratch.xref_get_key(sx, "Length")[1]
+                for xref in self._images_by_length(doc).get(length, ()):
+                    if self._is_image(doc, xref) and self._same_image(doc, xref, scratch, sx):
+                        return xref
+        except Exception:
+            pass
+        return 0
+
+
+# ─────────────────────────────────────────────
+# Streaming Merge
+# ─────────────────────────────────────────────
+
+class MergeCancelled(Exception):
+    pass
+
+
+def flush_to_disk(doc: fitz.Document, path: str, deflate: bool = True) -> fitz.Document:
+    """Write `doc` to `path` and return it reopened from there.
+
+    The first flush of a new document is a full save, later ones (`doc` was
+    opened from `path`) append incrementally. Reopening is what bounds
+    memory: an incremental save keeps every object it wrote alive in the
+    open document, a freshly opened one loads them only on demand.
+    """
+    if os.path.normcase(os.path.abspath(doc.name or "")) == os.path.normcase(os.path.abspath(path)):
+        doc.saveIncr()
+    else:
+        doc.save(path, deflate=deflate)
+    doc.close()
+    return fitz.open(path)
+
+
+class PDFMerger:
+    """
+    Merge many PDFs into `dest` with bounded memory.
+
+    Sources are opened one at a time and appended in batches of
+    `batch_size`. When there are more sources than one batch, each batch is
+    flushed to a temporary file next to `dest` (first as a full save, then as
+    incremental updates) and the document is reopened from disk, so only the
+    current batch's objects are held in memory. The final write applies the
+    chosen SaveProfile; for profiles without garbage collection the
+    temporary file is moved into place as-is.
+    """
+
+    def __init__(
+        self,
+        paths: list[str],
+        dest: str,
+        profile: Optional[SaveProfile] = None,
+        batch_size: int = 20,
+        progress: Optional[Callable[[int, int, str], None]] = None,
+    ):
+        self.paths = list(paths)
+        self.dest = dest
+        self.profile = profile or save_profile()
+        self.batch_size = max(1, int(batch_size))
+        self._progress = progress
+        self._cancelled = False
+        self.deduper = ResourceDeduper()
+        self.page_count = 0
+        self.skipped: list[tuple[str, str]] = []   # (path, error)
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self) -> str:
+        dest_dir = os.path.dirname(os.path.abspath(self.dest))
+        fd, tmp_path = tempfile.mkstemp(prefix=".~merge-", suffix=".pdf.tmp", dir=dest_dir)
+        os.close(fd)
+        streaming = len(self.paths) > self.batch_size
+        flushed = False
+        merged = fitz.open()
+        try:
+            total = len(self.paths)
+            for start in range(0, total, self.batch_size):
+                first_page = merged.page_count
+                first_xref = merged.xref_length()
+                for i, path in enumerate(self.paths[start:start + self.batch_size], start):
+                    if self._cancelled:
+                        raise MergeCancelled()
+                    self._report(i, total, os.path.basename(path))
+                    try:
+                        with fitz.open(path) as src:
+                            if src.needs_pass:
+                                raise ValueError("암호로 보호된 문서")
+                            merged.insert_pdf(src)
+                    except Exception as e:
+                        self.skipped.append((path, str(e)))
+                self.deduper.dedupe_pages(merged, range(first_page, merged.page_count), first_xref)
+
+                if streaming and start + self.batch_size < total:
+                    self._report(min(start + self.batch_size, total), total, "디스크에 기록 중…")
+                    merged = flush_to_disk(merged, tmp_path, self.profile.deflate)
+                    flushed = True
+
+            if merged.page_count == 0:
+                raise ValueError("합칠 수 있는 페이지가 없습니다.")
+            self.page_count = merged.page_count
+            self._report(total, total, "저장 중…")
+
+            if flushed and self.profile.garbage == 0 and not self.profile.use_objstms:
+                merged.saveIncr()
+                merged.close()
+                os.replace(tmp_path, self.dest)
+                return self.dest
+
+            out_path = tmp_path
+            if flushed:
+                # The flushed file is open; the compacting write needs its own target
+                fd, out_path = tempfile.mkstemp(prefix=".~merge-", suffix=".pdf.tmp", dir=dest_dir)
+                os.close(fd)
+            try:
+                self.profile.save(merged, out_path)
+                merged.close()
+                os.replace(out_path, self.dest)
+            finally:
+                if out_path != tmp_path and os.path.exists(out_path):
+                    os.unlink(out_path)
+            return self.dest
+        finally:
+            if not merged.is_closed:
+                merged.close()
+            if os.path.exists(tmp_path):
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _report(self, done: int, total: int, label: str):
+        if self._progress:
+            self._progress(done, total, label)
+
+
+class MergeWorker(QThread):
+    """Runs PDFMerger off the UI thread."""
+    progress = pyqtSignal(int, int, str)   # done, total, current file
+    finished_merge = pyqtSignal(bool, str)  # success, dest path or error message
+
+    def __init__(self, paths: list[str], dest: str, profile: Optional[SaveProfile] = None):
+        super().__init__()
+        self.merger = PDFMerger(paths, dest, profile, progress=self.progress.emit)
+
+    def cancel(self):
+        self.merger.cancel()
+
+    def run(self):
+        try:
+            self.finished_merge.emit(True, self.merger.run())
+        except MergeCancelled:
+            self.finished_merge.emit(False, "취소됨")
+        except Exception as e:
+            self.finished_merge.emit(False, str(e))
+
+
+# ─────────────────────────────────────────────
+# Split Planning
+# ─────────────────────────────────────────────
+
+@dataclass
+class SplitPart:
+    start: int      # 0-based, inclusive
+    end: int        # 0-based, inclusive
+    name: str = ""  # file name stem; empty → numbered
+
+    @property
+    def pages(self) -> int:
+        return self.end - self.start + 1
+
+
+def parse_page_ranges(text: str, page_count: int) -> list[SplitPart]:
+    """"1-3, 5, 8-" → one part per comma-separated item (1-based, inclusive).
+
+    Raises ValueError with a user-facing message on malformed input.
+    """
+    parts: list[SplitPart] = []
+    for item in text.replace(";", ",").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        m = re.fullmatch(r"(\d*)\s*[-~]\s*(\d*)|(\d+)", item)
+        if not m:
+            raise ValueError(f"잘못된 범위: {item}")
+        if m[3]:
+            start = end = int(m[3])
+        else:
+            start = int(m[1]) if m[1] else 1
+            end = int(m[2]) if m[2] else page_count
+        if not (1 <= start <= end <= page_count):
+            raise ValueError(f"범위를 벗어남: {item} (1~{page_count})")
+        parts.append(SplitPart(start - 1, end - 1))
+    if not parts:
+        raise ValueError("분할할 범위를 입력하세요.")
+    return parts
+
+
+def split_every(n: int, page_count: int) -> list[SplitPart]:
+    n = max(1, int(n))
+    return [SplitPart(s, min(s + n, page_count) - 1) for s in range(0, page_count, n)]
+
+
+def split_by_outline(toc: list, page_count: int, level: int = 1) -> list[SplitPart]:
+    """One part per outline entry at `level` or above (doc.get_toc() format).
+
+    Pages before the first entry form an untitled leading part; an entry on
+    the same page as (or before) the previous one is folded into that part.
+    """
+    starts: list[tuple[int, str]] = []
+    for lvl, title, page in toc:
+        if lvl <= level and 1 <= page <= page_count:
+            if not starts or page - 1 > starts[-1][0]:
+                starts.append((page - 1, title))
+    if not starts:
+        return []
+    parts: list[SplitPart] = []
+    if starts[0][0] > 0:
+        parts.append(SplitPart(0, starts[0][0] - 1))
+    for i, (start, title) in enumerate(starts):
+        end = starts[i + 1][0] - 1 if i + 1 < len(starts) else page_count - 1
+        parts.append(SplitPart(start, end, title))
+    return parts
+
+
+# Gray levels that do not count as ink for is_blank_page().
+_LIGHT_GRAY = bytes(range(160, 256))
+
+
+def is_blank_page(page: fitz.Page, ink_ratio: float = 0.003) -> bool:
+    """True for a page with no visible content (scanned separator sheets included).
+
+    Text or vector drawings mean "not blank" straight away; image-only pages
+    are rendered small in grayscale and count as blank when less than
+    `ink_ratio` of the pixels are dark.
+    """
+    if page.get_text("text").strip():
+        return False
+    if not page.get_images(full=False):
+        return not page.get_drawings()
+    pix = page.get_pixmap(matrix=fitz.Matrix(0.25, 0.25), colorspace=fitz.csGRAY, alpha=False)
+    data = pix.samples
+    if not data:
+        return True
+    # Deleting the light bytes leaves only the dark ones, counted in C.
+    dark = len(data.translate(None, _LIGHT_GRAY))
+    return dark / len(data) < ink_ratio
+
+
+def split_at_blank_pages(doc: fitz.Document, progress: Optional[Callable[[int, int], None]] = None,
+                         cancelled: Callable[[], bool] = lambda: False) -> list[SplitPart]:
+    """Parts separated by blank pages; the separators themselves are dropped."""
+    parts: list[SplitPart] = []
+    start = None
+    for pno in range(doc.page_count):
+        if cancelled():
+            raise SplitCancelled()
+        if progress:
+            progress(pno, doc.page_count)
+        if is_blank_page(doc[pno]):
+            if start is not None:
+                parts.append(SplitPart(start, pno - 1))
+                start = None
+        elif start is None:
+            start = pno
+    if start is not None:
+        parts.append(SplitPart(start, doc.page_count - 1))
+    return parts
+
+
+# ─────────────────────────────────────────────
+# Batch Split
+# ─────────────────────────────────────────────
+
+class SplitCancelled(Exception):
+    pass
+
+
+_UNSAFE_NAME_RE = re.compile(r'[\\/:*?"<>|\x00-\x1f]+')
+
+
+def _safe_stem(name: str, limit: int = 80) -> str:
+    return _UNSAFE_NAME_RE.sub("_", name).strip(" .")[:limit]
+
+
+class PDFSplitter:
+    """
+    Write every SplitPart of one document in a single pass.
+
+    The source is a PDF file — for an open tab, its published snapshot — so
+    the live document of the tab is never touched from a worker. Each writer
+    thread opens the source once and builds/saves parts from it; with
+    `blank_pages=True` the parts are planned on a worker as well.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        output_dir: str,
+        stem: str,
+        parts: Optional[list[SplitPart]] = None,
+        blank_pages: bool = False,
+        profile: Optional[SaveProfile] = None,
+        workers: int = 0,
+        progress: Optional[Callable[[int, int, str], None]] = None,
+    ):
+        self.source = source
+        self.output_dir = output_dir
+        self.stem = _safe_stem(stem) or "split"
+        self.parts = list(parts or [])
+        self.blank_pages = blank_pages
+        self.profile = profile or save_profile()
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self._progress = progress
+        self._cancelled = False
+        self._local = threading.local()
+        self.written: list[str] = []
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self) -> list[str]:
+        if self.blank_pages:
+            with fitz.open(self.source) as doc:
+                self.parts = split_at_blank_pages(
+                    doc,
+                    lambda done, total: self._report(done, total, "빈 페이지 찾는 중…"),
+                    lambda: self._cancelled,
+                )
+        if not self.parts:
+            raise ValueError("분할할 부분이 없습니다.")
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        targets = self._plan_targets()
+        total = len(targets)
+        self._report(0, total, "")
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        opened: list[fitz.Document] = []
+        lock = threading.Lock()
+        try:
+            futures = [pool.submit(self._write_part, part, path, opened, lock)
+                       for part, path in targets]
+            for n, fut in enumerate(as_completed(futures), start=1):
+                path = fut.result()
+                self.written.append(path)
+                self._report(n, total, os.path.basename(path))
+        except BaseException:
+            self._cancelled = True
+            raise
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            for doc in opened:
+                doc.close()
+        self.written.sort()
+        return self.written
+
+    def _plan_targets(self) -> list[tuple[SplitPart, str]]:
+        width = max(3, len(str(len(self.parts))))
+        used: set[str] = set()
+        targets = []
+        for i, part in enumerate(self.parts, start=1):
+            label = _safe_stem(part.name) if part.name else ""
+            base = f"{self.stem}_{i:0{width}d}" + (f"_{label}" if label else "")
+            path = os.path.join(self.output_dir, base + ".pdf")
+            n = 2
+            while path.lower() in used or os.path.exists(path):
+                path = os.path.join(self.output_dir, f"{base} ({n}).pdf")
+                n += 1
+            used.add(path.lower())
+            targets.append((part, path))
+        return targets
+
+    def _write_part(self, part: SplitPart, path: str, opened: list, lock: threading.Lock) -> str:
+        if self._cancelled:
+            raise SplitCancelled()
+        src = getattr(self._local, "src", None)
+        if src is None:
+            # One parsed copy per writer thread — MuPDF documents are not shared across threads
+            src = fitz.open(self.source)
+            self._local.src = src
+            with lock:
+                opened.append(src)
+        out = fitz.open()
+        try:
+            out.insert_pdf(src, from_page=part.start, to_page=part.end)
+            tmp = path + ".tmp"
+            try:
+                self.profile.save(out, tmp)
+                os.replace(tmp, path)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+                raise
+        finally:
+            out.close()
+        return path
+
+    def _report(self, done: int, total: int, label: str):
+        if self._progress:
+            self._progress(done, total, label)
+
+
+class SplitWorker(QThread):
+    """Runs PDFSplitter on a document snapshot off the UI thread (releases it when done)."""
+    progress = pyqtSignal(int, int, str)    # done, total, label
+    finished_split = pyqtSignal(bool, str)  # success, output dir or error message
+
+    def __init__(self, snapshot: DocumentSnapshot, output_dir: str, stem: str,
+                 parts: Optional[list[SplitPart]] = None, blank_pages: bool = False,
+                 profile: Optional[SaveProfile] = None):
+        super().__init__()
+        self._snapshot = snapshot
+        self.splitter = PDFSplitter(snapshot.path, output_dir, stem, parts, blank_pages,
+                                    profile, progress=self.progress.emit)
+
+    def cancel(self):
+        self.splitter.cancel()
+
+    def run(self):
+        try:
+            self.splitter.run()
+            self.finished_split.emit(True, self.splitter.output_dir)
+        except SplitCancelled:
+            self.finished_split.emit(False, "취소됨")
+        except Exception as e:
+            self.finished_split.emit(False, str(e))
+        finally:
+            self._snapshot.release()
+
+
+# ─────────────────────────────────────────────
+# Image Import
+# ─────────────────────────────────────────────
+
+PAGE_SIZES = {
+    "a4": (595.0, 842.0),
+    "letter": (612.0, 792.0),
+}
+
+
+@dataclass
+class ImageImportOptions:
+    page_size: str = "a4"    # "a4" | "letter" | "image" (page = image at its own DPI)
+    target_dpi: int = 200    # downsample above this effective resolution; 0 = never
+    jpeg_quality: int = 85
+
+
+def image_import_options() -> ImageImportOptions:
+    """Options chosen in settings (환경설정 → 이미지 가져오기)."""
+    settings = QSettings("PDFProTool", "Settings")
+    page_size = settings.value("image_import_page_size", "a4", type=str)
+    return ImageImportOptions(
+        page_size=page_size if page_size in (*PAGE_SIZES, "image") else "a4",
+        target_dpi=settings.value("image_import_dpi", 200, type=int),
+    )
+
+
+@dataclass
+class PreparedImage:
+    path: str
+    data: bytes
+    page_w: float    # points
+    page_h: float
+    rect: fitz.Rect  # where the image goes on the page
+
+
+def prepare_image(path: str, opts: ImageImportOptions) -> PreparedImage:
+    """Decode, orient, size and (re)encode one image — thread-safe, no fitz objects shared."""
+    if Image is None:
+        with open(path, "rb") as f:
+            data = f.read()
+        pix = fitz.Pixmap(path)
+        w, h = pix.width, pix.height
+        return PreparedImage(path, data, w, h, fitz.Rect(0, 0, w, h))
+
+    with Image.open(path) as im:
+        src_format = im.format
+        dpi = im.info.get("dpi", (72, 72))[0] or 72
+        oriented = ImageOps.exif_transpose(im)  # phone photos are stored sideways
+        transposed = oriented is not im
+        im = oriented
+        px_w, px_h = im.size
+
+        # Page size in points
+        if opts.page_size in PAGE_SIZES:
+            pw, ph = PAGE_SIZES[opts.page_size]
+            if (px_w > px_h) != (pw > ph):
+                pw, ph = ph, pw  # follow the image orientation
+            scale = min(pw / px_w, ph / px_h)
+            iw, ih = px_w * scale, px_h * scale
+            rect = fitz.Rect((pw - iw) / 2, (ph - ih) / 2, (pw + iw) / 2, (ph + ih) / 2)
+        else:
+            pw, ph = px_w * 72.0 / float(dpi), px_h * 72.0 / float(dpi)
+            rect = fitz.Rect(0, 0, pw, ph)
+
+        # Downsample to target_dpi at the size it is printed on the page
+        factor = 1.0
+        if opts.target_dpi:
+            factor = min(1.0, opts.target_dpi * rect.width / 72.0 / px_w)
+        resized = factor < 0.98
+        if resized:
+            im = im.resize((max(1, round(px_w * factor)), max(1, round(px_h * factor))),
+                           Image.LANCZOS)
+
+        if src_format == "JPEG" and not resized and not transposed:
+            with open(path, "rb") as f:
+                data = f.read()  # untouched JPEG: no generational loss
+        else:
+            has_alpha = im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info)
+            buf = io.BytesIO()
+            if has_alpha or (im.mode in ("1", "P") and not resized):
+                # Transparency / line art / palette: lossless
+                im.save(buf, "PNG", optimize=False)
+            else:
+                im = im.convert("L" if im.mode in ("L", "1", "I", "I;16") else "RGB")
+                im.save(buf, "JPEG", quality=opts.jpeg_quality, optimize=True)
+            data = buf.getvalue()
+    return PreparedImage(path, data, pw, ph, rect)
+
+
+class ImportCancelled(Exception):
+    pass
+
+
+class ImageImporter:
+    """
+    Build a PDF from many images with bounded memory.
+
+    Images are decoded, oriented, downsampled and re-encoded on a thread pool
+    (Pillow releases the GIL for the heavy parts); pages are appended to the
+    output in input order as results arrive, with at most a few prepared
+    images in flight. Every `flush_every` pages the document is written to
+    `dest` + ".part" (full save, then incremental updates) and reopened, like
+    PDFMerger, so photos never accumulate in memory. `dest` is only replaced
+    once the import succeeds; a cancelled or failed one leaves it untouched.
+    """
+
+    def __init__(self, paths: list[str], dest: str, options: Optional[ImageImportOptions] = None,
+                 profile: Optional[SaveProfile] = None, workers: int = 0, flush_every: int = 50,
+                 progress: Optional[Callable[[int, int, str], None]] = None):
+        self.paths = list(paths)
+        self.dest = dest
+        self.options = options or ImageImportOptions()
+        self.profile = profile or save_profile()
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.flush_every = max(1, flush_every)
+        self._progress = progress
+        self._cancelled = False
+        self.skipped: list[tuple[str, str]] = []
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self) -> str:
+        total = len(self.paths)
+        part_path = self.dest + ".part"
+        compact_path = self.dest + ".part.tmp"
+        doc = fitz.open()
+        flushed = False
+        pending = 0
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            window = self.workers * 2
+            futures = {}
+            for i in range(min(window, total)):
+                futures[i] = pool.submit(prepare_image, self.paths[i], self.options)
+            for i in range(total):
+                if self._cancelled:
+                    raise ImportCancelled()
+                nxt = i + window
+                if nxt < total:
+                    futures[nxt] = pool.submit(prepare_image, self.paths[nxt], self.options)
+                try:
+                    img = futures.pop(i).result()
+                    page = doc.new_page(width=img.page_w, height=img.page_h)
+                    page.insert_image(img.rect, stream=img.data)
+                    pending += 1
+                except Exception as e:
+                    self.skipped.append((self.paths[i], str(e)))
+                self._report(i + 1, total, os.path.basename(self.paths[i]))
+
+                if pending >= self.flush_every and i + 1 < total:
+                    doc = flush_to_disk(doc, part_path, self.profile.deflate)
+                    flushed = True
+                    pending = 0
+
+            if doc.page_count == 0:
+                raise ValueError("가져올 수 있는 이미지가 없습니다.")
+            if flushed and not (self.profile.garbage or self.profile.use_objstms):
+                doc.saveIncr()
+                doc.close()
+                os.replace(part_path, self.dest)
+            else:
+                # The flushed file is open; the compacting write needs its own target
+                out_path = compact_path if flushed else part_path
+                self.profile.save(doc, out_path)
+                doc.close()
+                os.replace(out_path, self.dest)
+            return self.dest
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            if not doc.is_closed:
+                doc.close()
+            for path in (part_path, compact_path):
+                if os.path.exists(path):
+                    try:
+                        os.unlink(path)
+                    except OSError:
+                        pass
+
+    def _report(self, done: int, total: int, label: str):
+        if self._progress:
+            self._progress(done, total, label)
+
+
+class ImageImportWorker(QThread):
+    """Runs ImageImporter off the UI thread."""
+    progress = pyqtSignal(int, int, str)     # done, total, current file
+    finished_import = pyqtSignal(bool, str)  # success, output path or error message
+
+    def __init__(self, paths: list[str], dest: str, options: Optional[ImageImportOptions] = None,
+                 profile: Optional[SaveProfile] = None):
+        super().__init__()
+        self.importer = ImageImporter(paths, dest, options, profile, progress=self.progress.emit)
+
+    def cancel(self):
+        self.importer.cancel()
+
+    def run(self):
+        try:
+            self.finished_import.emit(True, self.importer.run())
+        except ImportCancelled:
+            self.finished_import.emit(False, "취소됨")
+        except Exception as e:
+            self.finished_import.emit(False, str(e))
@@ -5,6 +5,7 @@ Converted from Swift/macOS to Python/PyQt6/PyMuPDF
 
 import sys
 import os
+import time
 import ctypes
 import logging
 
@@ -19,14 +20,15 @@ _winmm = None
 try:
     _winmm = ctypes.WinDLL("winmm")
     _winmm.timeBeginPeriod(1)
-except OSError:
+except (OSError, AttributeError):  # AttributeError: non-Windows (headless batch runs)
     _winmm = None
 
 from PyQt6.QtCore import Qt, QTimer, QSettings
 from PyQt6.QtGui import QFont, QIcon, QPixmap, QColor
-from PyQt6.QtWidgets import QApplication, QSplashScreen
+from PyQt6.QtWidgets import QApplication, QMessageBox, QSplashScreen
 
 from main_window import MainWindow
+from recovery import RecoveryJournal
 from panels import preload_fonts
 from updater import UpdateManager, cleanup_old_files, is_update_in_progress
 from ui_theme import apply_app_theme
@@ -255,7 +257,94 @@ def apply_theme(app: QApplication, is_dark: bool):
         apply_app_theme(app, is_dark=False)
 
 
+def run_batch_ocr_cli(argv: list[str]) -> int:
+    """`PDFProTool --ocr-batch IN... -o OUT` — OCR files/folders without the GUI."""
+    import argparse
+    from models import SAVE_PROFILES, save_profile
+    from ocr_manager import (
+        DEFAULT_OCR_STATS_LOG, OCR_RENDER_SCALE, BatchOCRRunner, OCRLanguage,
+        OCRPageCache, OCRStatsLog,
+    )
+
+    lang_keys = [lang.lang_codes[0] for lang in OCRLanguage.all_cases()]
+    parser = argparse.ArgumentParser(
+        prog="PDFProTool --ocr-batch",
+        description="스캔 PDF를 일괄 OCR하여 검색 가능한 PDF로 저장합니다.",
+    )
+    parser.add_argument("inputs", nargs="*", help="PDF 파일 또는 폴더")
+    parser.add_argument("-o", "--output", help="출력 폴더")
+    parser.add_argument("--lang", choices=lang_keys, default="ko", help="OCR 언어 (기본: ko)")
+    parser.add_argument("--workers", type=int, default=2, help="동시 처리 파일 수 (기본: 2)")
+    parser.add_argument("--overwrite", action="store_true", help="이미 있는 출력 파일 덮어쓰기")
+    parser.add_argument("--profile", choices=list(SAVE_PROFILES), default=None,
+                        help="저장 프로필 (기본: 설정에서 선택한 프로필)")
+    parser.add_argument("--no-cache", action="store_true", help="페이지별 OCR 캐시 사용 안 함")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="페이지별 OCR 캐시를 비움 (입력이 없으면 비우고 종료)")
+    parser.add_argument("--dpi", type=int, default=round(72 * OCR_RENDER_SCALE),
+                        help=f"인식용 렌더링 해상도 (기본: {round(72 * OCR_RENDER_SCALE)})")
+    parser.add_argument("--stats-log", default=DEFAULT_OCR_STATS_LOG,
+                        help="페이지별 처리 시간/신뢰도 JSON 로그 경로")
+    parser.add_argument("--no-stats", action="store_true", help="통계 로그 기록 안 함")
+    args = parser.parse_args(argv)
+    if args.clear_cache:
+        OCRPageCache().clear()
+        print("OCR 캐시를 비웠습니다.", flush=True)
+        if not args.inputs:
+            return 0
+    if not args.inputs or not args.output:
+        parser.error("입력 파일과 -o/--output 이 필요합니다")
+
+    runner = BatchOCRRunner(
+        OCRLanguage.from_key(args.lang),
+        args.output,
+        workers=args.workers,
+        cache=None if args.no_cache else OCRPageCache(),
+        overwrite=args.overwrite,
+        log=lambda msg: print(msg, flush=True),
+        scale=max(args.dpi, 36) / 72,
+        stats_log=None if args.no_stats else OCRStatsLog(args.stats_log),
+        profile=save_profile(args.profile),
+    )
+    try:
+        results = runner.run(args.inputs)
+    except KeyboardInterrupt:
+        runner.cancel()
+        return 130
+    return 1 if any(r.error for r in results) else 0
+
+
+def _offer_recovery(window: MainWindow):
+    """Ask whether to restore tabs journaled by a session that did not exit cleanly."""
+    try:
+        entries = RecoveryJournal().pending()
+    except OSError:
+        return
+    if not entries:
+        return
+    lines = "\n".join(
+        f"• {e.display_name}  ({time.strftime('%Y-%m-%d %H:%M', time.localtime(e.saved_at))})"
+        for e in entries[:10]
+    )
+    if len(entries) > 10:
+        lines += f"\n… 외 {len(entries) - 10}개"
+    reply = QMessageBox.question(
+        window, "문서 복구",
+        f"이전 세션이 비정상 종료되어 저장되지 않은 문서가 있습니다.\n\n{lines}\n\n"
+        "복구하시겠습니까? (아니오를 선택하면 복구본이 삭제됩니다)",
+        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+    )
+    if reply == QMessageBox.StandardButton.Yes:
+        window.restore_recovered(entries)
+    else:
+        window.discard_recovered(entries)
+
+
 def main():
+    # Headless entry points run before any QApplication/GUI is created.
+    if len(sys.argv) > 1 and sys.argv[1] == "--ocr-batch":
+        sys.exit(run_batch_ocr_cli(sys.argv[2:]))
+
     app = QApplication(sys.argv)
     app.setApplicationName("PDF Pro Tool")
     app.setOrganizationName("PDFProTool")
@@ -304,6 +393,8 @@ def main():
     cleanup_old_files()
 
     window = MainWindow()
+    if "--perf-trace" in sys.argv[1:]:
+        window.start_perf_trace()
 
     # Open files passed as command-line arguments
     for arg in sys.argv[1:]:
@@ -314,6 +405,9 @@ def main():
     if splash:
         splash.finish(window)
 
+    # 비정상 종료로 남은 저장 안 된 탭 복구
+    _offer_recovery(window)
+
     # MainWindow 표시 직후 비동기로 업데이트 확인
     updater = UpdateManager(parent=window)
     QTimer.singleShot(1500, updater.check_for_updates)
@@ -5,19 +5,22 @@ Windows version of PDFProTool (converted from ContentView.swift + PDFProToolApp.
 
 from __future__ import annotations
 
+import io
 import os
 import tempfile
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 import fitz  # PyMuPDF
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QSettings, QByteArray, QSize
 from PyQt6.QtGui import (
-    QAction, QColor, QFont, QIcon, QKeySequence, QShortcut,
+    QAction, QColor, QFont, QIcon, QImage, QKeySequence, QShortcut,
 )
 from PyQt6.QtPrintSupport import QPrinter, QPrintDialog
 from PyQt6.QtWidgets import (
-    QApplication, QDialog, QDialogButtonBox, QFileDialog,
+    QApplication, QComboBox, QDialog, QDialogButtonBox, QFileDialog,
     QFrame, QGridLayout, QHBoxLayout, QInputDialog,
     QLabel, QLineEdit, QMainWindow, QMessageBox, QProgressBar,
     QPushButton, QScrollArea, QSizePolicy, QSpinBox,
@@ -27,16 +30,44 @@ from PyQt6.QtWidgets import (
 
 from models import (
     BookmarkManager, PDFTab, StampManager, AnnotationOverlayManager,
+    SAVE_PROFILES, SaveProfile, save_profile, save_profile_filters, save_profile_from_filter,
+)
+from ocr_manager import OCRLanguage, OCRManager, apply_text_layer, summarize_stats
+from panels import (
+    AIToolPanel, OCRStatsPanel, SearchResultsPanel, StampPanel, TextToolConfig, TextToolPanel,
+)
+from document_ops import (
+    ImageImportWorker, MergeWorker, ResourceDeduper, SplitPart, SplitWorker,
+    image_import_options, parse_page_ranges, split_by_outline, split_every,
 )
-from ocr_manager import OCRLanguage, OCRManager
-from panels import SearchResultsPanel, StampPanel, TextToolConfig, TextToolPanel, AIToolPanel
 from pdf_viewer import PDFScrollView
+from perf_trace import perf_tracer
+from recovery import AutosaveScheduler, JournalWriteWorker, RecoveryEntry, RecoveryJournal
+from snapshots import DocumentSnapshot, edit_state, mark_edited, snapshot_service
+from tab_cache import tab_cache
 from sidebar import SidebarWidget, PageGridView
 from ai_manager import AIManager
 from icons import icon as svg_icon
 from version import __version__
 
 
+# ─────────────────────────────────────────────
+# OCR run state
+# ─────────────────────────────────────────────
+
+@dataclass
+class OCRRun:
+    """One OCR run of a tab: where its results go and what it has measured."""
+    tab: PDFTab
+    language: OCRLanguage
+    page_xrefs: dict[int, int]      # page index → xref when the run started
+    started: float
+    log_context: dict
+    merged_pages: int = 0
+    write_ms: dict[int, float] = field(default_factory=dict)  # UI-side merge time per page
+    stats: list = field(default_factory=list)
+
+
 # ─────────────────────────────────────────────
 # Settings Dialog
 # ─────────────────────────────────────────────
@@ -71,6 +102,68 @@ class SettingsDialog(QDialog):
 
         vl.addSpacing(8)
 
+        # ── Save profile section ──
+        save_frame = QFrame()
+        save_frame.setStyleSheet("background: white; border-radius: 5px; border: 1px solid #d0d0d0;")
+        sf_layout = QVBoxLayout(save_frame)
+
+        save_lbl = QLabel("기본 저장 방식:")
+        save_lbl.setStyleSheet("font-weight: bold; border: none;")
+        sf_layout.addWidget(save_lbl)
+
+        self._save_profile_combo = QComboBox()
+        for profile in SAVE_PROFILES.values():
+            self._save_profile_combo.addItem(profile.label, profile.key)
+        self._save_profile_combo.setCurrentIndex(
+            self._save_profile_combo.findData(save_profile().key)
+        )
+        sf_layout.addWidget(self._save_profile_combo)
+
+        save_desc = QLabel(
+            "빠르게: 변경분만 덧붙여 저장 · 균형: 중복 객체 정리 · "
+            "최대 압축: 이미지 재압축·글꼴 서브셋 (느림). "
+            "다른 이름으로 저장 시 파일 형식에서 개별 선택할 수 있습니다."
+        )
+        save_desc.setWordWrap(True)
+        save_desc.setStyleSheet("font-size: 11px; color: #666; border: none;")
+        sf_layout.addWidget(save_desc)
+        vl.addWidget(save_frame)
+
+        vl.addSpacing(8)
+
+        # ── Image import section ──
+        img_frame = QFrame()
+        img_frame.setStyleSheet("background: white; border-radius: 5px; border: 1px solid #d0d0d0;")
+        if_layout = QVBoxLayout(img_frame)
+
+        img_lbl = QLabel("이미지 → PDF 변환:")
+        img_lbl.setStyleSheet("font-weight: bold; border: none;")
+        if_layout.addWidget(img_lbl)
+
+        opts = image_import_options()
+        img_row = QHBoxLayout()
+        self._img_page_combo = QComboBox()
+        for key, label in (("a4", "A4에 맞춤"), ("letter", "Letter에 맞춤"), ("image", "원본 크기")):
+            self._img_page_combo.addItem(label, key)
+        self._img_page_combo.setCurrentIndex(self._img_page_combo.findData(opts.page_size))
+        img_row.addWidget(self._img_page_combo)
+        self._img_dpi_combo = QComboBox()
+        for dpi in (150, 200, 300):
+            self._img_dpi_combo.addItem(f"{dpi} dpi", dpi)
+        self._img_dpi_combo.addItem("축소 안 함", 0)
+        idx = self._img_dpi_combo.findData(opts.target_dpi)
+        self._img_dpi_combo.setCurrentIndex(idx if idx >= 0 else 1)
+        img_row.addWidget(self._img_dpi_combo)
+        if_layout.addLayout(img_row)
+
+        img_desc = QLabel("사진은 지정한 해상도로 줄이고 JPEG로 다시 압축합니다. 회전 정보(EXIF)는 반영됩니다.")
+        img_desc.setWordWrap(True)
+        img_desc.setStyleSheet("font-size: 11px; color: #666; border: none;")
+        if_layout.addWidget(img_desc)
+        vl.addWidget(img_frame)
+
+        vl.addSpacing(8)
+
         # ── Gemini API Key section ──
         gb = QFrame()
         gb.setStyleSheet("background: white; border-radius: 5px; border: 1px solid #d0d0d0;")
@@ -108,6 +201,10 @@ class SettingsDialog(QDialog):
         self._settings.setValue("dark_mode", is_dark)
         self.theme_changed.emit(is_dark)
 
+        self._settings.setValue("save_profile", self._save_profile_combo.currentData())
+        self._settings.setValue("image_import_page_size", self._img_page_combo.currentData())
+        self._settings.setValue("image_import_dpi", self._img_dpi_combo.currentData())
+
         super().accept()
 
 
@@ -184,10 +281,10 @@ class SearchWorker(QThread):
     error = pyqtSignal(str)
 
     def __init__(self, file_path: str, query: str,
-                 doc_bytes: Optional[bytes] = None):
+                 snapshot: Optional[DocumentSnapshot] = None):
         super().__init__()
         self._file_path = file_path
-        self._doc_bytes = doc_bytes
+        self._snapshot = snapshot  # reference owned by the worker
         self.query = query
         self._cancelled = False
 
@@ -197,8 +294,8 @@ class SearchWorker(QThread):
     def run(self):
         doc = None
         try:
-            if self._doc_bytes:
-                doc = fitz.open(stream=self._doc_bytes, filetype="pdf")
+            if self._snapshot:
+                doc = self._snapshot.open()
             else:
                 doc = fitz.open(self._file_path)  # 스레드 전용 인스턴스
             total_count = 0
@@ -221,34 +318,202 @@ class SearchWorker(QThread):
         finally:
             if doc:
                 doc.close()
+            if self._snapshot:
+                self._snapshot.release()
+                self._snapshot = None
+
+
+# Files at least this large are opened on a worker thread with a progress bar
+ASYNC_OPEN_MIN_BYTES = 16 * 1024 * 1024
+
+
+class DocumentOpenWorker(QThread):
+    """Opens a PDF and measures its pages off the UI thread.
+
+    fitz.open(path) reads objects from the file on demand, so the document
+    never exists as one heap buffer and every reader of the same file shares
+    the OS page cache. The first page is rendered right after the xref is
+    read — before the page tree is walked for the layout — so a large file
+    shows something immediately (for a linearized file MuPDF finds page 1
+    from the hint table without touching the rest of the tree).
+
+    The document is only touched by this thread until finished_open hands it
+    to the UI thread.
+    """
+
+    preview_ready = pyqtSignal(QImage)          # first page at 100% zoom
+    progress = pyqtSignal(int, int)             # pages measured, page count
+    finished_open = pyqtSignal(object, list, str)  # doc (or None), page rects, error
+
+    PROGRESS_EVERY = 200
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.preview: Optional[QImage] = None
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        doc = None
+        try:
+            doc = fitz.open(self.path)
+            if doc.page_count and not doc.needs_pass:
+                pix = doc.load_page(0).get_pixmap(alpha=False)
+                self.preview = QImage(pix.samples, pix.width, pix.height, pix.stride,
+                                      QImage.Format.Format_RGB888).copy()
+                self.preview_ready.emit(self.preview)
+            count = doc.page_count
+            rects = []
+            for i in range(count):
+                if self._cancelled:
+                    doc.close()
+                    self.finished_open.emit(None, [], "취소됨")
+                    return
+                rects.append(doc[i].rect)
+                if i % self.PROGRESS_EVERY == 0:
+                    self.progress.emit(i, count)
+            self.finished_open.emit(doc, rects, "")
+        except Exception as e:
+            if doc is not None:
+                doc.close()
+            self.finished_open.emit(None, [], str(e))
+
+
+# Appended updates before the next save compacts the file with a full rewrite
+MAX_INCREMENTAL_SAVES = 20
+
+# Background tabs idle this long close their document until reactivated
+HIBERNATE_AFTER_S = 10 * 60
+HIBERNATE_CHECK_MS = 60 * 1000
+
+
+class _ProgressWriter(io.RawIOBase):
+    """Write-through wrapper around a binary file that reports bytes written
+    against an expected size (PyMuPDF only needs write/seek/tell)."""
+
+    def __init__(self, raw, expected: int, on_progress):
+        super().__init__()
+        self._raw = raw
+        self._expected = max(expected, 1)
+        self._on_progress = on_progress
+        self._written = 0
+        self._last_pct = -1
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        n = self._raw.write(b)
+        self._written += n
+        # The estimate comes from the snapshot size; hold at 99 until done.
+        pct = min(99, self._written * 100 // self._expected)
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self._on_progress(pct)
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._raw.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._raw.tell()
+
+    def truncate(self, size=None) -> int:
+        return self._raw.truncate(size)
+
+    def flush(self):
+        self._raw.flush()
+
+
+def replace_file(src: str, dest: str, attempts: int = 5):
+    """os.replace with a short retry — on Windows a reader (thumbnail/render
+    worker, antivirus) can hold `dest` open for a moment."""
+    for i in range(attempts):
+        try:
+            os.replace(src, dest)
+            return
+        except PermissionError:
+            if i == attempts - 1:
+                raise
+            time.sleep(0.1)
 
 
 class FileSaveWorker(QThread):
+    """Serializes a document snapshot (garbage collection + compression) off the UI thread.
+
+    Output streams into a temp file next to the target and is renamed over it,
+    so the result never exists as one in-memory bytes object and a crash
+    mid-save leaves the original untouched.
+    """
+
     finished = pyqtSignal(bool, str) # success, message
+    progress = pyqtSignal(int)  # -1 while collecting objects, then 0–100 while writing
 
-    def __init__(self, doc_bytes: bytes, save_path: str, orig_path: str):
+    def __init__(self, snapshot: DocumentSnapshot, save_path: str, orig_path: str,
+                 profile: Optional[SaveProfile] = None):
         super().__init__()
-        self._doc_bytes = doc_bytes
+        self._snapshot = snapshot  # reference owned by the worker
+        # Document state being written; edits merged after it (OCR keeps
+        # running during a save) are not in the file.
+        self.state = snapshot.state
         self._save_path = save_path
         self._orig_path = orig_path
-        self.saved_bytes: Optional[bytes] = None
+        self._profile = profile or save_profile()
+        # Same-file saves: finished temp file, moved over the original by the
+        # UI thread once it has closed its own handle on that file.
+        self.temp_path = ""
 
     def run(self):
+        try:
+            self._write()
+        finally:
+            self._snapshot.release()
+
+    def _write(self):
+        tmp_path = ""
         try:
             same_file = (
                 self._orig_path
                 and os.path.normpath(os.path.abspath(self._save_path))
                    == os.path.normpath(os.path.abspath(self._orig_path))
             )
+            target_dir = os.path.dirname(os.path.abspath(self._save_path))
+            fd, tmp_path = tempfile.mkstemp(prefix=".~", suffix=".pdf.tmp", dir=target_dir)
+            os.close(fd)
+
+            # 불변 스냅샷에서 워커 전용 문서를 열어 직렬화 — UI의 doc은 건드리지 않는다
+            self.progress.emit(-1)
+            src = self._snapshot.open()
+            expected = self._snapshot.size
+            try:
+                self._profile.prepare(src)
+                with open(tmp_path, "wb") as raw:
+                    src.save(_ProgressWriter(raw, expected, self.progress.emit),
+                             **self._profile.save_kwargs())
+                    raw.flush()
+                    os.fsync(raw.fileno())
+            finally:
+                src.close()
+
             if same_file:
-                # 동일 파일 저장: 바이트를 콜백에서 파일에 쓰고 reopen
-                self.saved_bytes = self._doc_bytes
+                self.temp_path = tmp_path
             else:
-                with open(self._save_path, "wb") as f:
-                    f.write(self._doc_bytes)
-            self._doc_bytes = None  # 메모리 해제
+                replace_file(tmp_path, self._save_path)
+            tmp_path = ""
+            self.progress.emit(100)
             self.finished.emit(True, self._save_path)
         except Exception as e:
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
             self.finished.emit(False, str(e))
 
 
@@ -259,20 +524,22 @@ class ChatWorker(QThread):
     session_created = pyqtSignal(object)   # Chat session object
 
     def __init__(self, ai_mgr, text: str, session=None,
-                 context_text: str = "", file_path: str = ""):
+                 context_text: str = "", file_path: str = "",
+                 snapshot: Optional[DocumentSnapshot] = None):
         super().__init__()
         self._ai_mgr = ai_mgr
         self._text = text
         self._session = session
         self._context_text = context_text
         self._file_path = file_path  # 세션 생성 시 스레드에서 텍스트 추출
+        self._snapshot = snapshot    # 수정된 문서면 파일 대신 스냅샷에서 추출 (워커 소유 참조)
 
     def run(self):
         try:
             if self._session is None:
                 # 컨텍스트 텍스트를 스레드에서 추출 (메인 스레드 블로킹 방지)
                 context = self._context_text
-                if not context and self._file_path:
+                if not context and (self._file_path or self._snapshot):
                     context = self._extract_context()
                 self._session = self._ai_mgr.create_chat_session(context)
                 self.session_created.emit(self._session)
@@ -281,12 +548,16 @@ class ChatWorker(QThread):
             self.response_ready.emit(response.text)
         except Exception as e:
             self.error_occurred.emit(str(e))
+        finally:
+            if self._snapshot:
+                self._snapshot.release()
+                self._snapshot = None
 
     def _extract_context(self) -> str:
         """스레드 전용 doc으로 PDF 텍스트 추출."""
         doc = None
         try:
-            doc = fitz.open(self._file_path)
+            doc = self._snapshot.open() if self._snapshot else fitz.open(self._file_path)
             MAX_CHARS = 80000
             full_text = []
             total_chars = 0
@@ -347,6 +618,19 @@ class MainWindow(QMainWindow):
         self._annot_overlay_mgr = AnnotationOverlayManager()
         self._ai_mgr = AIManager()
 
+        # Crash recovery: unsaved edits are journaled in the background
+        self._journal = RecoveryJournal()
+        self._journal_workers: dict[str, JournalWriteWorker] = {}
+        self._journaled_versions: dict[str, int] = {}  # tab_id → snapshot version last journaled
+        self._autosave = AutosaveScheduler(parent=self)
+        self._autosave.flush_due.connect(self._write_recovery_journal)
+
+        # Memory: long-inactive tabs release their document (see _hibernate_idle_tabs)
+        self._hibernate_timer = QTimer(self)
+        self._hibernate_timer.setInterval(HIBERNATE_CHECK_MS)
+        self._hibernate_timer.timeout.connect(self._hibernate_idle_tabs)
+        self._hibernate_timer.start()
+
         # Tabs
         self._tabs: list[PDFTab] = [PDFTab()]
         self._active_tab_idx: int = 0
@@ -602,6 +886,7 @@ class MainWindow(QMainWindow):
         self._pdf_scroll.page_changed.connect(self._on_pdf_page_changed)
         self._pdf_scroll.zoom_changed.connect(self._on_zoom_changed)
         self._pdf_scroll.doc_modified.connect(self._on_doc_modified)
+        self._pdf_scroll.content_removed.connect(self._on_content_removed)
         self._pdf_scroll.annot_edit_requested.connect(self._edit_annot_in_panel)
         self._pdf_scroll.pdf_widget.text_copied.connect(self._on_text_copied)
 
@@ -697,6 +982,20 @@ class MainWindow(QMainWindow):
         self._ocr_progress_bar.hide()
         right_vl.addWidget(self._ocr_progress_bar)
 
+        # Save progress bar
+        self._save_progress_bar = QProgressBar()
+        self._save_progress_bar.setFixedHeight(4)
+        self._save_progress_bar.setTextVisible(False)
+        self._save_progress_bar.hide()
+        right_vl.addWidget(self._save_progress_bar)
+
+        # Merge/split progress bar
+        self._task_progress_bar = QProgressBar()
+        self._task_progress_bar.setFixedHeight(4)
+        self._task_progress_bar.setTextVisible(False)
+        self._task_progress_bar.hide()
+        right_vl.addWidget(self._task_progress_bar)
+
         root_hl.addWidget(right_container, 1)
 
         # Initialize state properties usually set at the end of build UI
@@ -704,6 +1003,15 @@ class MainWindow(QMainWindow):
         self._stamp_panel = None
         self._text_panel = None
         self._search_panel = None
+        self._ocr_stats_panel = None
+        self._ocr_run: Optional[OCRRun] = None   # the run whose progress the UI shows
+        self._save_worker = None
+        self._save_tab: Optional[PDFTab] = None
+        self._close_after_save = False
+        self._merge_worker: Optional[MergeWorker] = None
+        self._split_worker: Optional[SplitWorker] = None
+        self._import_worker: Optional[ImageImportWorker] = None
+        self._open_workers: dict[str, DocumentOpenWorker] = {}  # tab_id → 여는 중인 대용량 파일
         self._editing_annot = None
         self._editing_annot_page = -1
 
@@ -711,14 +1019,20 @@ class MainWindow(QMainWindow):
         self._tab_bar.currentChanged.connect(self._on_tab_changed)
         self._splitter.splitterMoved.connect(self._on_splitter_moved)
 
-        # Keyboard shortcuts
-        QShortcut(QKeySequence("Ctrl+O"), self).activated.connect(self._open_file)
-        QShortcut(QKeySequence("Ctrl+S"), self).activated.connect(self._save_file)
-        QShortcut(QKeySequence("Ctrl+Shift+S"), self).activated.connect(self._save_as)
+        # Keyboard shortcuts (file shortcuts are paused while a save is running)
+        self._file_shortcuts = [
+            QShortcut(QKeySequence("Ctrl+O"), self),
+            QShortcut(QKeySequence("Ctrl+S"), self),
+            QShortcut(QKeySequence("Ctrl+Shift+S"), self),
+        ]
+        self._file_shortcuts[0].activated.connect(self._open_file)
+        self._file_shortcuts[1].activated.connect(self._save_file)
+        self._file_shortcuts[2].activated.connect(self._save_as)
         QShortcut(QKeySequence("Ctrl+P"), self).activated.connect(self._print_document)
         QShortcut(QKeySequence("Ctrl+F"), self).activated.connect(
             lambda: self._search_input.setFocus()
         )
+        QShortcut(QKeySequence("Ctrl+Shift+F12"), self).activated.connect(self._toggle_perf_trace)
 
 
     # ── Tab Management ────────────────────────
@@ -739,20 +1053,29 @@ class MainWindow(QMainWindow):
         self._tab_bar.setCurrentIndex(len(self._tabs) - 1)
 
     def _close_tab(self, index: int):
+        self._discard_recovery(self._tabs[index])
+        opening = self._open_workers.pop(self._tabs[index].id, None)
+        if opening:
+            opening.cancel()  # _on_open_finished closes the document
+            if not self._open_workers:
+                self._task_progress_bar.hide()
         if len(self._tabs) <= 1:
             # Reset rather than close last tab
             tab = self._tabs[0]
             tab.close()
             tab.file_path = ""
+            tab.is_modified = False
             self._pdf_scroll.set_document(None)
             self._sidebar.load_document(None)
             self._tab_bar.setTabText(0, "새 탭")
             self._update_toolbar_state()
             self._set_status("문서를 열어 시작하세요")
             self._update_welcome_page()
+            tab_cache().forget(tab.id)
             return
 
-        self._tabs[index].close()
+        closed = self._tabs[index]
+        closed.close()
         self._tabs.pop(index)
         self._tab_bar.removeTab(index)
         # Switch to adjacent tab
@@ -760,8 +1083,15 @@ class MainWindow(QMainWindow):
         self._active_tab_idx = new_idx
         self._tab_bar.setCurrentIndex(new_idx)
         self._load_active_tab()
+        tab_cache().forget(closed.id)  # after the switch parked what it was showing
 
     def _on_tab_changed(self, index: int):
+        prev = self._active_tab()
+        if prev and prev.document and self._pdf_scroll.pdf_widget._doc is prev.document:
+            prev.zoom = self._pdf_scroll.pdf_widget.zoom
+            prev.scroll_y = self._pdf_scroll.verticalScrollBar().value()
+        if prev:
+            prev.last_active = time.monotonic()
         self._active_tab_idx = index
         self._load_active_tab()
 
@@ -769,23 +1099,226 @@ class MainWindow(QMainWindow):
         tab = self._active_tab()
         if not tab:
             return
+        tab.last_active = time.monotonic()
+        if tab.hibernated:
+            self._wake_tab(tab)
         # Switch back to PDF view when changing tabs
         if self._content_stack.currentWidget() == self._grid_view:
             self._content_stack.setCurrentWidget(self._pdf_scroll)
             self._grid_view_btn.setStyleSheet(TOPBAR_BUTTON_STYLE)
-        self._pdf_scroll.set_document(tab.document, tab.file_path)
-        self._sidebar.load_document(tab.document, tab.file_path)
+        self._pdf_scroll.set_document(tab.document, tab.file_path, cache_key=tab.id)
+        opening = self._open_workers.get(tab.id)
+        if opening and opening.preview is not None:
+            self._pdf_scroll.pdf_widget.show_loading_preview(opening.preview)
+        snapshot = None
+        if tab.is_modified and tab.document:
+            # 저장 안 된 변경은 파일에 없다 — 렌더/썸네일이 메모리 상태를 보도록 스냅샷
+            # (보관된 스냅샷이 돌아왔고 그 사이 수정이 없으면 그대로 쓴다)
+            self._pdf_scroll.pdf_widget._ensure_snapshot()
+            snapshot = self._pdf_scroll.pdf_widget._snapshot
+        self._sidebar.load_document(tab.document, tab.file_path, snapshot=snapshot,
+                                    cache_key=tab.id)
         self._sidebar.set_current_page(tab.current_page)
-        self._pdf_scroll.scroll_to_page(tab.current_page)
+        if tab.document and tab.scroll_y >= 0:
+            # 탭을 떠날 때의 줌·스크롤 위치로 복원
+            self._pdf_scroll.set_zoom(tab.zoom)
+            vbar = self._pdf_scroll.verticalScrollBar()
+            y = tab.scroll_y
+            vbar.setValue(y)
+            QTimer.singleShot(0, lambda: vbar.setValue(y))  # after the zoom relayout
+            tab.scroll_y = -1
+        else:
+            self._pdf_scroll.scroll_to_page(tab.current_page)
         self._update_toolbar_state()
 
+    # ── Tab Hibernation ───────────────────────
+
+    def _hibernate_idle_tabs(self):
+        """Close the documents of tabs that have been in the background for a while."""
+        now = time.monotonic()
+        active = self._active_tab()
+        for tab in self._tabs:
+            if (tab is active or tab.hibernated or tab.document is None
+                    or now - tab.last_active < HIBERNATE_AFTER_S):
+                continue
+            if self._tab_busy(tab):
+                continue
+            self._hibernate_tab(tab)
+
+    def _tab_busy(self, tab: PDFTab) -> bool:
+        """A worker still reads or will write back into this tab's document."""
+        journal = self._journal_workers.get(tab.id)
+        return ((self._is_saving() and tab is self._save_tab)
+                or (journal is not None and journal.isRunning())
+                or tab.id in self._open_workers
+                or (self._ocr_run is not None and tab is self._ocr_run.tab))
+
+    def _hibernate_tab(self, tab: PDFTab):
+        doc = tab.document
+        if tab.is_modified:
+            # Unsaved edits survive as a snapshot file; journal it too, since the
+            # pending autosave for this tab can no longer run.
+            try:
+                snapshot = snapshot_service().current_or_publish(doc)
+            except Exception:
+                return
+            tab.hibernated_snapshot = snapshot
+            self._autosave.forget(tab.id)
+            meta = {
+                "file_path": tab.file_path,
+                "title": tab.display_name,
+                "current_page": tab.current_page,
+            }
+            if self._journaled_versions.get(tab.id) != snapshot.version:
+                self._journaled_versions[tab.id] = snapshot.version
+                worker = JournalWriteWorker(self._journal, tab.id, snapshot.acquire(), meta)
+                worker.finished_write.connect(self._on_journal_written)
+                self._journal_workers[tab.id] = worker
+                worker.start()
+        elif not tab.file_path or not os.path.exists(tab.file_path):
+            return  # nothing to reopen it from
+        tab_cache().forget(tab.id)  # parked renders/snapshot refer to the closing document
+        doc.close()
+        tab.document = None
+        tab.resource_deduper = None
+        tab.hibernated = True
+
+    def _wake_tab(self, tab: PDFTab):
+        """Reopen a hibernated tab's document (from its snapshot or its file)."""
+        snapshot = tab.hibernated_snapshot
+        try:
+            if snapshot is not None:
+                # bytes, like a recovered journal: the tab owns no temp file afterwards
+                doc = fitz.open(stream=snapshot.read_bytes(), filetype="pdf")
+                tab.needs_full_save = True
+            else:
+                doc = fitz.open(tab.file_path)
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"문서를 다시 열 수 없습니다:\n{e}")
+            if snapshot is None:
+                # File gone: the tab has nothing left to show
+                tab.close()
+                tab.file_path = ""
+                tab.is_modified = False
+                self._tab_bar.setTabText(self._tabs.index(tab), tab.display_name)
+            return
+        tab.hibernated = False
+        tab.hibernated_snapshot = None
+        if snapshot is not None:
+            snapshot.release()
+        tab.document = doc
+        tab.current_page = min(tab.current_page, max(0, doc.page_count - 1))
+
     def _update_tab_title(self, tab: PDFTab):
+        """Refresh the tab label. Every modified/saved transition passes through
+        here, so it also feeds the autosave journal."""
         idx = self._tabs.index(tab)
         title = tab.display_name
         if tab.is_modified:
             title = "● " + title
+            self._autosave.note_edit(tab.id)
+        else:
+            self._discard_recovery(tab)
         self._tab_bar.setTabText(idx, title)
 
+    # ── Crash Recovery ────────────────────────
+
+    def _write_recovery_journal(self, tab_ids: list):
+        """Journal the given tabs (called by AutosaveScheduler when edits go idle)."""
+        for tab in self._tabs:
+            if tab.id not in tab_ids or not tab.is_modified or not tab.document:
+                continue
+            busy = self._journal_workers.get(tab.id)
+            if (busy and busy.isRunning()) or (self._is_saving() and tab is self._save_tab):
+                self._autosave.note_edit(tab.id)  # retry after the next idle period
+                continue
+            snapshot = self._snapshot_for(tab.document)
+            if not snapshot:
+                continue
+            if self._journaled_versions.get(tab.id) == snapshot.version:
+                snapshot.release()  # this state is already in the journal
+                continue
+            self._journaled_versions[tab.id] = snapshot.version
+            meta = {
+                "file_path": tab.file_path,
+                "title": tab.display_name,
+                "current_page": tab.current_page,
+            }
+            worker = JournalWriteWorker(self._journal, tab.id, snapshot, meta)
+            worker.finished_write.connect(self._on_journal_written)
+            self._journal_workers[tab.id] = worker
+            worker.start()
+
+    def _on_journal_written(self, tab_id: str, ok: bool):
+        worker = self._journal_workers.pop(tab_id, None)
+        if worker:
+            worker.deleteLater()
+        if not ok:
+            self._journaled_versions.pop(tab_id, None)  # write it again next time
+        # Saved or closed while the write was in flight → the entry is stale
+        tab = next((t for t in self._tabs if t.id == tab_id), None)
+        if tab is None or not tab.is_modified:
+            self._journal.discard(tab_id)
+
+    def _snapshot_for(self, doc: fitz.Document) -> Optional[DocumentSnapshot]:
+        """A current snapshot of `doc` with one reference for the caller to hand to a worker.
+
+        Serializing is only needed when `doc` was edited since its newest
+        snapshot; otherwise that one is reused. The viewer's document shares
+        the viewer snapshot (so rendering sees the same state).
+        """
+        pw = self._pdf_scroll.pdf_widget
+        try:
+            if pw._doc is doc:
+                pw._ensure_snapshot()
+                return pw._snapshot.acquire() if pw._snapshot else None
+            return snapshot_service().current_or_publish(doc)
+        except Exception:
+            return None
+
+    def _discard_recovery(self, tab: PDFTab):
+        self._autosave.forget(tab.id)
+        self._journaled_versions.pop(tab.id, None)
+        if tab.id not in self._journal_workers:
+            self._journal.discard(tab.id)
+
+    def restore_recovered(self, entries: list[RecoveryEntry]):
+        """Reopen journaled documents as modified tabs (startup recovery prompt)."""
+        restored = 0
+        for entry in entries:
+            try:
+                # bytes, not the journal path: the next autosave replaces that file
+                data = Path(entry.pdf_path).read_bytes()
+                doc = fitz.open(stream=data, filetype="pdf")
+            except Exception:
+                self._journal.discard(entry.tab_id)
+                continue
+
+            tab = self._active_tab()
+            if not tab or not tab.is_empty:
+                tab = PDFTab()
+                self._tabs.append(tab)
+                self._tab_bar.addTab("...")
+            tab.id = entry.tab_id  # keeps journaling into the same entry
+            tab.document = doc
+            tab.file_path = entry.file_path if os.path.exists(entry.file_path) else ""
+            tab.current_page = min(entry.current_page, doc.page_count - 1)
+            tab.is_modified = True
+            tab.needs_full_save = True
+            self._update_tab_title(tab)
+            restored += 1
+
+        if restored:
+            self._active_tab_idx = len(self._tabs) - 1
+            self._tab_bar.setCurrentIndex(self._active_tab_idx)
+            self._load_active_tab()
+            self._update_welcome_page()
+            self._set_status(f"{restored}개 문서 복구됨 — 저장하기 전까지는 복구본입니다")
+
+    def discard_recovered(self, entries: list[RecoveryEntry]):
+        for entry in entries:
+            self._journal.discard(entry.tab_id)
+
     # ── File Operations ───────────────────────
 
     def _open_file(self):
@@ -803,15 +1336,16 @@ class MainWindow(QMainWindow):
             self.load_file(path)
 
     def load_file(self, path: str):
-        # Check if already open
+        # Check if already open (or still opening)
         for i, tab in enumerate(self._tabs):
-            if tab.file_path == path:
+            worker = self._open_workers.get(tab.id)
+            if tab.file_path == path or (worker and worker.path == path):
                 self._tab_bar.setCurrentIndex(i)
                 return
 
         # Use current empty tab or create new one
         tab = self._active_tab()
-        if not tab or (tab.document is not None or tab.file_path):
+        if not tab or not tab.is_empty or tab.id in self._open_workers:
             tab = PDFTab()
             self._tabs.append(tab)
             self._tab_bar.addTab("...")
@@ -819,25 +1353,81 @@ class MainWindow(QMainWindow):
             self._active_tab_idx = len(self._tabs) - 1
 
         try:
-            doc = fitz.open(path)
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"파일을 열 수 없습니다:\n{e}")
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        if size < ASYNC_OPEN_MIN_BYTES:
+            try:
+                doc = fitz.open(path)
+            except Exception as e:
+                QMessageBox.critical(self, "오류", f"파일을 열 수 없습니다:\n{e}")
+                return
+            self._show_opened_file(tab, doc, path)
             return
 
+        # 대용량 파일: 워커가 열고 페이지 크기를 재는 동안 첫 페이지 미리보기 표시
+        worker = DocumentOpenWorker(path)
+        worker.preview_ready.connect(lambda img, t=tab: self._on_open_preview(t, img))
+        worker.progress.connect(self._on_open_progress)
+        worker.finished_open.connect(
+            lambda doc, rects, err, t=tab, w=worker: self._on_open_finished(t, w, doc, rects, err))
+        self._open_workers[tab.id] = worker
+        self._tab_bar.setTabText(self._tabs.index(tab), f"{Path(path).stem} (여는 중)")
+        self._pdf_scroll.set_document(None)
+        self._sidebar.load_document(None)
+        self._update_welcome_page()
+        self._task_progress_bar.setRange(0, 0)
+        self._task_progress_bar.show()
+        self._set_status(f"{Path(path).name} 여는 중... ({size / 1048576:.0f} MB)")
+        worker.start()
+
+    def _show_opened_file(self, tab: PDFTab, doc: fitz.Document, path: str,
+                          page_rects: Optional[list] = None):
         tab.document = doc
         tab.file_path = path
         tab.current_page = 0
         tab.is_modified = False
 
-        self._pdf_scroll.set_document(doc, path)
-        self._pdf_scroll.set_zoom(1.0)
-        self._sidebar.load_document(doc, path)
         self._update_tab_title(tab)
+        self._add_recent_file(path)
+        if tab is not self._active_tab():
+            return  # 백그라운드에서 열린 탭 — 전환할 때 표시된다
+        self._pdf_scroll.set_document(doc, path, page_rects=page_rects, cache_key=tab.id)
+        self._pdf_scroll.set_zoom(1.0)
+        self._sidebar.load_document(doc, path, cache_key=tab.id)
         self._update_toolbar_state()
         self._set_status(f"{Path(path).name} — {doc.page_count}p")
-        self._add_recent_file(path)
         self._update_welcome_page()
 
+    def _on_open_preview(self, tab: PDFTab, image: QImage):
+        if tab is self._active_tab():
+            self._pdf_scroll.pdf_widget.show_loading_preview(image)
+
+    def _on_open_progress(self, done: int, total: int):
+        self._task_progress_bar.setRange(0, total)
+        self._task_progress_bar.setValue(done)
+
+    def _on_open_finished(self, tab: PDFTab, worker: DocumentOpenWorker,
+                          doc: Optional[fitz.Document], page_rects: list, error: str):
+        worker.deleteLater()
+        if self._open_workers.get(tab.id) is not worker:  # tab closed while opening
+            if doc is not None:
+                doc.close()
+            return
+        del self._open_workers[tab.id]
+        if not self._open_workers:
+            self._task_progress_bar.hide()
+        if doc is None:
+            self._tab_bar.setTabText(self._tabs.index(tab), tab.display_name)
+            if tab is self._active_tab():
+                self._pdf_scroll.pdf_widget.show_loading_preview(None)
+                self._update_welcome_page()
+            if error != "취소됨":
+                self._set_status("파일 열기 실패")
+                QMessageBox.critical(self, "오류", f"파일을 열 수 없습니다:\n{error}")
+            return
+        self._show_opened_file(tab, doc, worker.path, page_rects)
+
     def _save_file(self):
         tab = self._active_tab()
         doc = self._active_doc()
@@ -852,50 +1442,154 @@ class MainWindow(QMainWindow):
         # Burn overlay stamps first (on main thread as it modifies widgets/pixmaps)
         self._pdf_scroll.pdf_widget.burn_overlay_stamps()
 
+        # Append only the changed objects when possible; otherwise rewrite.
+        profile = save_profile()
+        if (profile.incremental and self._can_save_incrementally(tab, doc, path)
+                and self._save_incremental(tab, doc)):
+            return
+
         # Start async save
-        self._start_save_worker(doc, path)
+        self._start_save_worker(doc, path, profile)
 
-    def _start_save_worker(self, doc: fitz.Document, path: str):
+    @staticmethod
+    def _can_save_incrementally(tab: PDFTab, doc: fitz.Document, path: str) -> bool:
+        """True when `path` is the file `doc` was opened from and the edits can be appended."""
+        if tab.needs_full_save or tab.incremental_saves >= MAX_INCREMENTAL_SAVES:
+            return False
+        if not doc.name or not os.path.exists(path):
+            return False
+        if os.path.normcase(os.path.abspath(doc.name)) != os.path.normcase(os.path.abspath(path)):
+            return False
+        try:
+            return bool(doc.can_save_incrementally())
+        except Exception:
+            return False
+
+    def _save_incremental(self, tab: PDFTab, doc: fitz.Document) -> bool:
+        """Append the changes to the original file. Returns False to request a full rewrite."""
         self._set_status("저장 중...")
-        # Disable UI to prevent modification during save
-        self.setEnabled(False)
+        try:
+            doc.save(doc.name, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+        except Exception:
+            return False
+        tab.incremental_saves += 1
+        tab.is_modified = False
+        self._update_tab_title(tab)
+        self._set_status("저장 완료")
+        return True
+
+    def _start_save_worker(self, doc: fitz.Document, path: str,
+                           profile: Optional[SaveProfile] = None):
+        if self._is_saving():
+            return
+        self._set_status("저장 중...")
+        self._save_tab = self._active_tab()
 
-        # 메인 스레드에서 바이트로 직렬화 후 워커에 전달 (스레드 안전)
-        doc_bytes = doc.tobytes(garbage=3, deflate=True)
+        # 일관된 사본: 뷰어의 bytes 스냅샷(직인 굽기 등 최신 반영)을 워커에 넘기고,
+        # 비용이 큰 garbage 정리·압축은 워커에서 수행한다.
+        snapshot = self._snapshot_for(doc)
+        if not snapshot:
+            QMessageBox.critical(self, "저장 오류", "문서를 직렬화하지 못했습니다.")
+            return
         orig_path = doc.name or ""
-        self._save_worker = FileSaveWorker(doc_bytes, path, orig_path)
+
+        # 저장 중에는 보기(스크롤·줌·텍스트 선택)만 허용
+        self._set_saving_ui(True)
+        self._save_worker = FileSaveWorker(snapshot, path, orig_path, profile)
+        self._save_worker.progress.connect(self._on_save_progress)
         self._save_worker.finished.connect(self._on_save_finished)
         self._save_worker.start()
 
+    def _is_saving(self) -> bool:
+        return self._save_worker is not None and self._save_worker.isRunning()
+
+    def _set_saving_ui(self, saving: bool):
+        """Read-only mode while a save runs: viewing stays live, editing is blocked."""
+        for w in (self._top_tools_widget, self._top_tab_widget, self._sidebar,
+                  self._right_panel_container, self._grid_view):
+            w.setEnabled(not saving)
+        for sc in self._file_shortcuts:
+            sc.setEnabled(not saving)
+        self._pdf_scroll.setAcceptDrops(not saving)
+        self._pdf_scroll.pdf_widget.set_read_only(saving)
+        if saving:
+            self._save_progress_bar.setRange(0, 0)  # busy until writing starts
+            self._save_progress_bar.show()
+        else:
+            self._save_progress_bar.hide()
+
+    def _on_save_progress(self, pct: int):
+        if pct < 0:
+            self._save_progress_bar.setRange(0, 0)
+            self._set_status("저장 준비 중 (객체 정리)...")
+        else:
+            self._save_progress_bar.setRange(0, 100)
+            self._save_progress_bar.setValue(pct)
+            self._set_status(f"저장 중... {pct}%")
+
     def _on_save_finished(self, success: bool, msg: str):
-        self.setEnabled(True)
-        tab = self._active_tab()
+        self._set_saving_ui(False)
+        tab = self._save_tab
+        self._save_tab = None
+        if tab not in self._tabs:
+            tab = None
         if success:
             worker = self._save_worker
-            if worker and worker.saved_bytes:
-                # Same-file save: write bytes to file, reopen doc
+            # Edits that arrived while the worker wrote (OCR pages) keep the
+            # tab modified; the saved file does not contain them.
+            still_modified = bool(tab and tab.document and worker
+                                  and worker.state != edit_state(tab.document))
+            if worker and worker.temp_path and tab:
+                # Same-file save: release our handle on the original, move
+                # the finished temp file over it, reopen from disk.
+                current_page = tab.current_page
+                current_zoom = self._pdf_scroll.pdf_widget._zoom
+                tmp_path = worker.temp_path
+                worker.temp_path = ""
+
+                # The rewritten file renumbers objects. With later edits, or
+                # an OCR run still merging pages by xref, reopen the live
+                # document's own bytes (object numbers unchanged) instead.
+                keep_live = still_modified or (self._ocr_run is not None
+                                               and self._ocr_run.tab is tab)
+                live_data = tab.document.tobytes() if keep_live else None
+                tab.document.close()
                 try:
-                    data = worker.saved_bytes
-                    worker.saved_bytes = None  # free memory
-
-                    current_page = tab.current_page if tab else 0
-                    current_zoom = self._pdf_scroll.pdf_widget._zoom
-
-                    tab.document.close()
-
-                    with open(msg, "wb") as f:
-                        f.write(data)
+                    replace_file(tmp_path, msg)
+                except Exception as e:
+                    # The original is intact; keep editing from the saved copy
+                    # so no change is lost, and leave the tab marked modified.
+                    tab.document = (fitz.open(stream=live_data, filetype="pdf") if keep_live
+                                    else fitz.open(tmp_path))
+                    if tab is self._active_tab():
+                        self._load_active_tab()
+                        # tab.file_path still names the old file; render from the copy
+                        self._pdf_scroll.pdf_widget._refresh_snapshot()
+                    QMessageBox.critical(
+                        self, "저장 오류",
+                        f"파일 교체 중 오류:\n{e}\n\n저장된 사본: {tmp_path}",
+                    )
+                    self._set_status("저장 실패")
+                    self._resume_pending_close()
+                    return
 
-                    new_doc = fitz.open(msg)
-                    tab.document = new_doc
-                    self._pdf_scroll.set_document(new_doc, msg)
-                    self._pdf_scroll.set_zoom(current_zoom)
-                    self._sidebar.load_document(new_doc, msg)
-                    self._go_to_page(current_page)
+                try:
+                    new_doc = fitz.open(stream=live_data, filetype="pdf") if keep_live else fitz.open(msg)
                 except Exception as e:
-                    QMessageBox.critical(self, "저장 오류", f"파일 교체 중 오류:\n{e}")
+                    tab.document = None
+                    QMessageBox.critical(self, "저장 오류", f"저장한 파일을 다시 열 수 없습니다:\n{e}")
                     self._set_status("저장 실패")
+                    self._resume_pending_close()
                     return
+                tab.document = new_doc
+                if tab is self._active_tab():
+                    self._pdf_scroll.set_document(new_doc, msg, cache_key=tab.id)
+                    self._pdf_scroll.set_zoom(current_zoom)
+                    self._sidebar.load_document(new_doc, msg, cache_key=tab.id)
+                    self._go_to_page(current_page)
+                    if still_modified:
+                        # The file on disk lacks the newest edits; render these
+                        self._pdf_scroll.pdf_widget._refresh_snapshot()
 
             # Handle save-as path update
             pending = getattr(self, "_pending_save_as_path", None)
@@ -904,13 +1598,23 @@ class MainWindow(QMainWindow):
                 self._pending_save_as_path = None
 
             if tab:
-                tab.is_modified = False
+                tab.is_modified = still_modified
+                tab.needs_full_save = still_modified and tab.needs_full_save
+                tab.incremental_saves = 0
                 self._update_tab_title(tab)
-            self._set_status("저장 완료")
+            self._set_status("저장 완료" if not still_modified
+                             else "저장 완료 (저장 중 추가된 OCR 결과는 아직 저장되지 않음)")
         else:
             self._pending_save_as_path = None
             QMessageBox.critical(self, "저장 오류", msg)
             self._set_status("저장 실패")
+        self._resume_pending_close()
+
+    def _resume_pending_close(self):
+        """Retry a window close that was deferred until the save finished."""
+        if self._close_after_save:
+            self._close_after_save = False
+            QTimer.singleShot(0, self.close)
 
     def _save_as(self):
         tab = self._active_tab()
@@ -919,8 +1623,9 @@ class MainWindow(QMainWindow):
             return
 
         default_name = Path(tab.file_path).name if tab.file_path else "document.pdf"
-        path, _ = QFileDialog.getSaveFileName(
-            self, "다른 이름으로 저장", default_name, "PDF Files (*.pdf)"
+        filters, initial = save_profile_filters()
+        path, chosen = QFileDialog.getSaveFileName(
+            self, "다른 이름으로 저장", default_name, filters, initial
         )
         if not path:
             return
@@ -936,7 +1641,7 @@ class MainWindow(QMainWindow):
         # or just assume active tab is same (modal block ensures this).
         
         self._pending_save_as_path = path # Store to update tab later
-        self._start_save_worker(doc, path)
+        self._start_save_worker(doc, path, save_profile_from_filter(chosen))
 
     # ── Print ─────────────────────────────────
 
@@ -1025,6 +1730,35 @@ class MainWindow(QMainWindow):
         finally:
             self._zoom_input_busy = False
 
+    # ── Performance Trace ─────────────────────
+
+    def start_perf_trace(self):
+        """Record frame timings and show the overlay (Ctrl+Shift+F12 stops and exports)."""
+        perf_tracer().start()
+        self._pdf_scroll.set_perf_overlay(True)
+        self._set_status("성능 기록 중 — Ctrl+Shift+F12를 누르면 종료하고 트레이스를 저장합니다")
+
+    def _toggle_perf_trace(self):
+        tracer = perf_tracer()
+        if not tracer.enabled:
+            self.start_perf_trace()
+            return
+        tracer.stop()
+        self._pdf_scroll.set_perf_overlay(False)
+        default_name = time.strftime("pdfprotool-trace-%Y%m%d-%H%M%S.json")
+        path, _ = QFileDialog.getSaveFileName(
+            self, "성능 트레이스 저장", default_name, "Chrome Trace (*.json)"
+        )
+        if not path:
+            self._set_status("성능 기록 종료 (저장 안 함)")
+            return
+        try:
+            count = tracer.export_chrome_trace(path)
+        except OSError as e:
+            QMessageBox.warning(self, "오류", f"트레이스 저장 실패: {e}")
+            return
+        self._set_status(f"성능 트레이스 저장 완료 ({count:,}개 이벤트) — chrome://tracing 또는 Perfetto에서 열 수 있습니다")
+
     # ── Page Operations ───────────────────────
 
     def _delete_current_page(self):
@@ -1044,6 +1778,7 @@ class MainWindow(QMainWindow):
             doc.delete_page(p)
         tab.current_page = min(tab.current_page, doc.page_count - 1)
         tab.is_modified = True
+        tab.needs_full_save = True
         self._on_doc_changed()
         self._set_status(f"{len(pages)}페이지 삭제됨")
 
@@ -1073,9 +1808,13 @@ class MainWindow(QMainWindow):
         try:
             extra = fitz.open(path)
             insert_at = tab.current_page + 1
+            added = extra.page_count
+            first_xref = doc.xref_length()
             doc.insert_pdf(extra, start_at=insert_at)
             extra.close()
+            self._dedupe_inserted(tab, range(insert_at, insert_at + added), first_xref)
             tab.is_modified = True
+            tab.needs_full_save = True
             self._on_doc_changed()
             self._set_status(f"페이지 삽입 완료")
         except Exception as e:
@@ -1090,60 +1829,147 @@ class MainWindow(QMainWindow):
         try:
             extra = fitz.open(file_path)
             added = extra.page_count
+            first_xref = doc.xref_length()
             doc.insert_pdf(extra, start_at=insert_before)
             extra.close()
+            self._dedupe_inserted(tab, range(insert_before, insert_before + added), first_xref)
             tab.is_modified = True
+            tab.needs_full_save = True
             self._on_doc_changed()
             self._set_status(f"{added}페이지 삽입 완료 (위치: {insert_before + 1})")
         except Exception as e:
             QMessageBox.critical(self, "오류", f"PDF 삽입 실패:\n{e}")
 
+    def _dedupe_inserted(self, tab: PDFTab, pages: range, first_xref: int):
+        """Point resources of freshly inserted pages at identical ones already in the tab."""
+        doc = tab.document
+        dd = tab.resource_deduper
+        if dd is None or dd.doc is not doc:
+            # New or reopened document (a full save renumbers objects) → fresh index
+            dd = tab.resource_deduper = ResourceDeduper(doc, verify=True)
+        try:
+            dd.dedupe_inserted(doc, pages, first_xref)
+        except Exception:
+            pass  # 최적화일 뿐 — 삽입 자체는 이미 끝났다
+
     def _merge_pdfs(self):
         paths, _ = QFileDialog.getOpenFileNames(self, "합칠 PDF 선택 (2개 이상)", "", "PDF (*.pdf)")
         if len(paths) < 2:
             QMessageBox.information(self, "알림", "2개 이상의 PDF를 선택하세요.")
             return
-        dest, _ = QFileDialog.getSaveFileName(self, "저장 위치", "merged.pdf", "PDF (*.pdf)")
+        if self._merge_worker and self._merge_worker.isRunning():
+            QMessageBox.information(self, "알림", "이전 합치기 작업이 아직 진행 중입니다.")
+            return
+        filters, initial = save_profile_filters()
+        dest, chosen = QFileDialog.getSaveFileName(self, "저장 위치", "merged.pdf", filters, initial)
         if not dest:
             return
-        try:
-            merged = fitz.open()
-            for p in paths:
-                src = fitz.open(p)
-                merged.insert_pdf(src)
-                src.close()
-            merged.save(dest, garbage=3, deflate=True)
-            merged.close()
-            self._set_status(f"합치기 완료: {Path(dest).name}")
-            self.load_file(dest)
-        except Exception as e:
-            QMessageBox.critical(self, "오류", str(e))
+        dest_abs = os.path.abspath(dest)
+        if any(t.file_path and os.path.abspath(t.file_path) == dest_abs for t in self._tabs):
+            QMessageBox.warning(self, "알림", "열려 있는 문서에는 덮어쓸 수 없습니다. 탭을 닫거나 다른 이름을 선택하세요.")
+            return
+
+        # 대량 병합은 백그라운드에서 배치 단위로 처리 (UI는 계속 사용 가능)
+        self._merge_worker = MergeWorker(paths, dest, save_profile_from_filter(chosen))
+        self._merge_worker.progress.connect(self._on_merge_progress)
+        self._merge_worker.finished_merge.connect(self._on_merge_finished)
+        self._task_progress_bar.setRange(0, len(paths))
+        self._task_progress_bar.setValue(0)
+        self._task_progress_bar.show()
+        self._merge_worker.start()
+
+    def _on_merge_progress(self, done: int, total: int, label: str):
+        self._task_progress_bar.setRange(0, total)
+        self._task_progress_bar.setValue(done)
+        self._set_status(f"합치는 중... {done}/{total} — {label}")
+
+    def _on_merge_finished(self, success: bool, msg: str):
+        self._task_progress_bar.hide()
+        worker = self._merge_worker
+        self._merge_worker = None
+        if not success:
+            self._set_status(f"합치기 실패: {msg}")
+            if msg != "취소됨":
+                QMessageBox.critical(self, "오류", msg)
+            return
+        merger = worker.merger
+        status = f"합치기 완료: {Path(msg).name} ({merger.page_count}페이지"
+        if merger.deduper.merged:
+            status += f", 중복 리소스 {merger.deduper.merged}개 공유"
+        status += ")"
+        self._set_status(status)
+        if merger.skipped:
+            names = "\n".join(f"• {Path(p).name}: {err}" for p, err in merger.skipped[:10])
+            QMessageBox.warning(self, "일부 파일 제외", f"다음 파일은 합치지 못했습니다:\n{names}")
+        self.load_file(msg)
 
     def _show_split_dialog(self):
+        tab = self._active_tab()
         doc = self._active_doc()
         if not doc:
             return
+        if self._split_worker and self._split_worker.isRunning():
+            QMessageBox.information(self, "알림", "이전 분할 작업이 아직 진행 중입니다.")
+            return
+        n_pages = doc.page_count
+        toc = doc.get_toc()
 
         dlg = QDialog(self)
         dlg.setWindowTitle("PDF 분할")
         vl = QVBoxLayout(dlg)
-        vl.addWidget(QLabel(f"총 {doc.page_count}페이지"))
-
-        row1 = QHBoxLayout()
-        row1.addWidget(QLabel("시작:"))
-        start_spin = QSpinBox()
-        start_spin.setRange(1, doc.page_count)
-        start_spin.setValue(1)
-        row1.addWidget(start_spin)
-        vl.addLayout(row1)
-
-        row2 = QHBoxLayout()
-        row2.addWidget(QLabel("끝:"))
-        end_spin = QSpinBox()
-        end_spin.setRange(1, doc.page_count)
-        end_spin.setValue(doc.page_count)
-        row2.addWidget(end_spin)
-        vl.addLayout(row2)
+        vl.addWidget(QLabel(f"총 {n_pages}페이지"))
+
+        mode_combo = QComboBox()
+        mode_combo.addItems(["페이지 범위", "N페이지마다", "목차(책갈피) 기준", "빈 페이지로 구분"])
+        vl.addWidget(mode_combo)
+
+        stack = QStackedWidget()
+        # 0: 범위 목록
+        w = QWidget(); wl = QVBoxLayout(w); wl.setContentsMargins(0, 0, 0, 0)
+        ranges_edit = QLineEdit(f"1-{n_pages}")
+        ranges_edit.setPlaceholderText("예: 1-3, 5, 8-")
+        wl.addWidget(ranges_edit)
+        hint = QLabel("쉼표로 구분한 범위마다 파일 하나가 만들어집니다.")
+        hint.setStyleSheet("font-size: 11px; color: #666;")
+        wl.addWidget(hint)
+        stack.addWidget(w)
+        # 1: N페이지마다
+        w = QWidget(); wl = QHBoxLayout(w); wl.setContentsMargins(0, 0, 0, 0)
+        every_spin = QSpinBox()
+        every_spin.setRange(1, n_pages)
+        every_spin.setValue(min(10, n_pages))
+        wl.addWidget(every_spin)
+        wl.addWidget(QLabel("페이지마다 나누기"))
+        wl.addStretch()
+        stack.addWidget(w)
+        # 2: 목차 기준
+        w = QWidget(); wl = QHBoxLayout(w); wl.setContentsMargins(0, 0, 0, 0)
+        level_spin = QSpinBox()
+        level_spin.setRange(1, max((lvl for lvl, _, _ in toc), default=1))
+        wl.addWidget(QLabel("목차 수준:"))
+        wl.addWidget(level_spin)
+        wl.addWidget(QLabel("까지의 항목마다 나누기" if toc else "(목차 없음)"))
+        wl.addStretch()
+        stack.addWidget(w)
+        # 3: 빈 페이지
+        w = QWidget(); wl = QVBoxLayout(w); wl.setContentsMargins(0, 0, 0, 0)
+        blank_lbl = QLabel("빈 페이지(구분지)를 기준으로 나누고, 빈 페이지는 결과에서 제외합니다.")
+        blank_lbl.setWordWrap(True)
+        wl.addWidget(blank_lbl)
+        stack.addWidget(w)
+        vl.addWidget(stack)
+        mode_combo.currentIndexChanged.connect(stack.setCurrentIndex)
+        if not toc:
+            mode_combo.model().item(2).setEnabled(False)
+
+        row = QHBoxLayout()
+        row.addWidget(QLabel("저장 방식:"))
+        profile_combo = QComboBox()
+        for profile in SAVE_PROFILES.values():
+            profile_combo.addItem(profile.label, profile.key)
+        profile_combo.setCurrentIndex(profile_combo.findData(save_profile().key))
+        row.addWidget(profile_combo)
+        vl.addLayout(row)
 
         btns = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
@@ -1155,20 +1981,74 @@ class MainWindow(QMainWindow):
         if dlg.exec() != QDialog.DialogCode.Accepted:
             return
 
-        start = start_spin.value() - 1
-        end = end_spin.value() - 1
+        mode = mode_combo.currentIndex()
+        profile = save_profile(profile_combo.currentData())
+        parts: list[SplitPart] = []
+        try:
+            if mode == 0:
+                parts = parse_page_ranges(ranges_edit.text(), n_pages)
+            elif mode == 1:
+                parts = split_every(every_spin.value(), n_pages)
+            elif mode == 2:
+                parts = split_by_outline(toc, n_pages, level_spin.value())
+        except ValueError as e:
+            QMessageBox.warning(self, "알림", str(e))
+            return
 
-        dest, _ = QFileDialog.getSaveFileName(self, "저장 위치", "split.pdf", "PDF (*.pdf)")
-        if not dest:
+        if len(parts) == 1:
+            # 범위 하나는 기존처럼 바로 파일 하나로 저장
+            part = parts[0]
+            filters, initial = save_profile_filters(profile)
+            dest, chosen = QFileDialog.getSaveFileName(self, "저장 위치", "split.pdf", filters, initial)
+            if not dest:
+                return
+            try:
+                new_doc = fitz.open()
+                new_doc.insert_pdf(doc, from_page=part.start, to_page=part.end)
+                save_profile_from_filter(chosen).save(new_doc, dest)
+                new_doc.close()
+                self._set_status(f"분할 완료 ({part.start+1}~{part.end+1}p)")
+            except Exception as e:
+                QMessageBox.critical(self, "오류", str(e))
             return
-        try:
-            new_doc = fitz.open()
-            new_doc.insert_pdf(doc, from_page=start, to_page=end)
-            new_doc.save(dest, garbage=3, deflate=True)
-            new_doc.close()
-            self._set_status(f"분할 완료 ({start+1}~{end+1}p)")
-        except Exception as e:
-            QMessageBox.critical(self, "오류", str(e))
+        if mode != 3 and not parts:
+            QMessageBox.information(self, "알림", "나눌 부분이 없습니다.")
+            return
+
+        start_dir = str(Path(tab.file_path).parent) if tab.file_path else ""
+        out_dir = QFileDialog.getExistingDirectory(self, "분할 파일을 저장할 폴더", start_dir)
+        if not out_dir:
+            return
+
+        snapshot = self._snapshot_for(doc)
+        if not snapshot:
+            QMessageBox.critical(self, "오류", "문서를 직렬화하지 못했습니다.")
+            return
+        stem = Path(tab.file_path).stem if tab.file_path else "split"
+
+        # 모든 결과 파일을 백그라운드에서 한 번에 기록 (병렬 저장)
+        self._split_worker = SplitWorker(snapshot, out_dir, stem, parts, mode == 3, profile)
+        self._split_worker.progress.connect(self._on_split_progress)
+        self._split_worker.finished_split.connect(self._on_split_finished)
+        self._task_progress_bar.setRange(0, 0)
+        self._task_progress_bar.show()
+        self._split_worker.start()
+
+    def _on_split_progress(self, done: int, total: int, label: str):
+        self._task_progress_bar.setRange(0, total)
+        self._task_progress_bar.setValue(done)
+        self._set_status(f"분할 중... {done}/{total}" + (f" — {label}" if label else ""))
+
+    def _on_split_finished(self, success: bool, msg: str):
+        self._task_progress_bar.hide()
+        worker = self._split_worker
+        self._split_worker = None
+        if not success:
+            self._set_status(f"분할 실패: {msg}")
+            if msg != "취소됨":
+                QMessageBox.critical(self, "오류", msg)
+            return
+        self._set_status(f"분할 완료: {len(worker.splitter.written)}개 파일 → {msg}")
 
     # ── AI Features ───────────────────────────
 
@@ -1227,18 +2107,23 @@ class MainWindow(QMainWindow):
         ai_panel.append_chat_message("👤", text)
         ai_panel.set_input_enabled(False)
 
-        # file_path를 전달하면 ChatWorker가 스레드에서 텍스트를 추출
+        # file_path/스냅샷을 전달하면 ChatWorker가 스레드에서 텍스트를 추출
         file_path = ""
+        snapshot = None
         if not getattr(self, "_active_chat_session", None):
             tab = self._active_tab()
             if tab and tab.file_path:
                 file_path = tab.file_path
+            pw = self._pdf_scroll.pdf_widget
+            if tab and pw._snapshot and pw._doc is tab.document:
+                snapshot = pw._snapshot.acquire()
 
         self._stop_worker(getattr(self, "_chat_worker", None))
         self._chat_worker = ChatWorker(
             self._ai_mgr, text,
             session=getattr(self, "_active_chat_session", None),
             file_path=file_path,
+            snapshot=snapshot,
         )
         self._chat_worker.session_created.connect(self._on_chat_session_created)
         self._chat_worker.response_ready.connect(self._on_chat_response)
@@ -1597,8 +2482,8 @@ class MainWindow(QMainWindow):
             
             # Pass document to grid view
             pw = self._pdf_scroll.pdf_widget
-            doc_bytes = pw._doc_bytes_snapshot
-            self._grid_view.load_document(tab.document, tab.current_page, file_path=tab.file_path, doc_bytes=doc_bytes)
+            self._grid_view.load_document(tab.document, tab.current_page, file_path=tab.file_path,
+                                          snapshot=pw._snapshot)
             if hasattr(self, '_grid_view_btn'):
                 self._grid_view_btn.setStyleSheet(TOPBAR_BUTTON_ACTIVE_STYLE)
             self._set_status("그리드 보기 — 더블클릭으로 페이지 이동")
@@ -1650,10 +2535,11 @@ class MainWindow(QMainWindow):
         toc.append([1, title.strip(), page_num])
         toc.sort(key=lambda e: e[2])
         doc.set_toc(toc)
+        mark_edited(doc)
 
         tab.is_modified = True
         self._update_tab_title(tab)
-        self._sidebar.load_document(doc, tab.file_path)
+        self._sidebar.load_document(doc, tab.file_path, cache_key=tab.id)
         self._set_status(f"목차 추가: \"{title.strip()}\" → Page {page_num}")
 
     def _remove_outline_entry(self, page: int, title: str):
@@ -1669,80 +2555,232 @@ class MainWindow(QMainWindow):
         doc.set_toc(new_toc)
         tab.is_modified = True
         self._update_tab_title(tab)
-        self._sidebar.load_document(doc, tab.file_path)
-        self._pdf_scroll.pdf_widget._snapshot_doc_bytes()
+        self._sidebar.load_document(doc, tab.file_path, cache_key=tab.id)
+        self._pdf_scroll.pdf_widget._refresh_snapshot()
         self._set_status(f"목차 제거: \"{title}\"")
 
     # ── OCR ───────────────────────────────────
 
+    # OCR page scopes offered in the dialog: (label, key)
+    _OCR_SCOPES = [
+        ("텍스트 레이어 없는 모든 페이지", "untexted"),
+        ("현재 페이지", "current"),
+        ("화면에 보이는 페이지", "visible"),
+        ("썸네일에서 선택한 페이지", "selected"),
+    ]
+
     def _show_ocr_dialog(self):
         tab = self._active_tab()
         if not tab or not tab.document:
             return
 
+        dlg = QDialog(self)
+        dlg.setWindowTitle("OCR")
+        vl = QVBoxLayout(dlg)
+
+        row1 = QHBoxLayout()
+        row1.addWidget(QLabel("언어:"))
+        lang_combo = QComboBox()
         langs = OCRLanguage.all_cases()
-        lang_names = [str(l) for l in langs]
-        choice, ok = QInputDialog.getItem(
-            self, "OCR 언어 선택", "언어:", lang_names, 0, False
+        for lang in langs:
+            lang_combo.addItem(str(lang))
+        row1.addWidget(lang_combo, 1)
+        vl.addLayout(row1)
+
+        row2 = QHBoxLayout()
+        row2.addWidget(QLabel("범위:"))
+        scope_combo = QComboBox()
+        selected = self._sidebar.selected_pages()
+        for label, key in self._OCR_SCOPES:
+            if key == "selected" and selected:
+                label = f"{label} ({len(selected)}p)"
+            scope_combo.addItem(label, key)
+        if len(selected) > 1:
+            scope_combo.setCurrentIndex(scope_combo.findData("selected"))
+        row2.addWidget(scope_combo, 1)
+        vl.addLayout(row2)
+
+        hint = QLabel("이미 텍스트가 있는 페이지는 건너뜁니다.")
+        hint.setStyleSheet("font-size: 11px; color: #666;")
+        vl.addWidget(hint)
+
+        from PyQt6.QtWidgets import QCheckBox
+        stats_chk = QCheckBox("처리 통계 패널 표시 (페이지별 시간·신뢰도·메모리)")
+        stats_chk.setChecked(self._settings.value("ocr_show_stats", False, type=bool))
+        vl.addWidget(stats_chk)
+
+        btns = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
         )
-        if not ok:
+        btns.accepted.connect(dlg.accept)
+        btns.rejected.connect(dlg.reject)
+        vl.addWidget(btns)
+
+        if dlg.exec() != QDialog.DialogCode.Accepted:
             return
-        lang = langs[lang_names.index(choice)]
-        self._run_ocr(tab.file_path, tab.document, lang)
+        lang = langs[lang_combo.currentIndex()]
+        pages = self._ocr_scope_pages(tab, scope_combo.currentData())
+        if pages is not None and not pages:
+            QMessageBox.information(self, "OCR", "OCR할 페이지가 없습니다.")
+            return
+        self._settings.setValue("ocr_show_stats", stats_chk.isChecked())
+        if stats_chk.isChecked():
+            self._show_ocr_stats_panel()
+        self._run_ocr(tab, lang, pages)
+
+    def _show_ocr_stats_panel(self):
+        self._clear_right_panel()
+        panel = OCRStatsPanel(self._ocr_mgr.stats_log.path)
+        panel.closed.connect(self._clear_right_panel)
+        self._set_right_panel(panel)
+        self._ocr_stats_panel = panel
+
+    def _ocr_scope_pages(self, tab: PDFTab, scope: str) -> Optional[list[int]]:
+        """Resolve an OCR scope key to page indices (None = whole document)."""
+        if scope == "current":
+            return [tab.current_page]
+        if scope == "visible":
+            return self._pdf_scroll.pdf_widget.visible_pages()
+        if scope == "selected":
+            return self._sidebar.selected_pages()
+        return None
 
-    def _run_ocr(self, file_path: str, doc: fitz.Document, language: OCRLanguage):
-        self._ocr_progress_bar.setMaximum(doc.page_count)
+    def _run_ocr(self, tab: PDFTab, language: OCRLanguage,
+                 pages: Optional[list[int]] = None):
+        doc = tab.document
+        self._ocr_progress_bar.setMaximum(len(pages) if pages is not None else doc.page_count)
         self._ocr_progress_bar.setValue(0)
         self._ocr_progress_bar.show()
         self._set_status("OCR 실행 중...")
 
-        worker = self._ocr_mgr.start(file_path, language)
-        worker.progress.connect(self._on_ocr_progress)
-        worker.page_done.connect(self._on_ocr_page_done)
-        worker.finished_ocr.connect(self._on_ocr_finished)
-        worker.error.connect(self._on_ocr_error)
-        worker.status.connect(self._on_ocr_status)
-
-    def _on_ocr_progress(self, current: int, total: int):
+        # Results are merged into the run's own tab and page map, even if the
+        # user switches tabs or starts another OCR meanwhile.
+        targets = pages if pages is not None else range(doc.page_count)
+        run = OCRRun(
+            tab=tab,
+            language=language,
+            page_xrefs={i: doc.page_xref(i) for i in targets},
+            started=time.perf_counter(),
+            log_context={
+                "mode": "gui",
+                "file": os.path.basename(tab.file_path) if tab.file_path else "",
+                "lang": language.lang_codes[0],
+                "workers": 1,
+            },
+        )
+        self._ocr_run = run
+        if self._ocr_stats_panel:
+            self._ocr_stats_panel.reset(run.started)
+
+        snapshot = None
+        if tab.is_modified or not tab.file_path:
+            snapshot = self._snapshot_for(doc)
+        # Cancels the previous worker; its late signals are tied to its own run
+        worker = self._ocr_mgr.start(tab.file_path, language, pages=pages, snapshot=snapshot)
+        worker.progress.connect(lambda cur, total, r=run: self._on_ocr_progress(r, cur, total))
+        worker.page_results.connect(lambda i, res, r=run: self._on_ocr_page_results(r, i, res))
+        worker.page_stats.connect(lambda st, r=run: self._on_ocr_page_stats(r, st))
+        worker.finished_ocr.connect(lambda chars, _res, r=run: self._on_ocr_finished(r, chars))
+        worker.error.connect(lambda msg, r=run: self._on_ocr_error(r, msg))
+        worker.status.connect(lambda msg, r=run: self._on_ocr_status(r, msg))
+
+    def _on_ocr_progress(self, run: OCRRun, current: int, total: int):
+        if run is not self._ocr_run:
+            return
         self._ocr_progress_bar.setMaximum(total)
         self._ocr_progress_bar.setValue(current)
         self._set_status(f"OCR {current}/{total}...")
 
-    def _on_ocr_status(self, msg: str):
-        self._set_status(msg)
+    def _on_ocr_status(self, run: OCRRun, msg: str):
+        if run is self._ocr_run:
+            self._set_status(msg)
 
-    def _on_ocr_page_done(self, page_index: int, text: str):
-        """OCR 텍스트가 PDF 페이지에 투명 텍스트로 삽입됨 — 뷰어 갱신."""
-        pass  # 텍스트는 이미 ocr_manager에서 PDF에 삽입됨
+    def _on_ocr_page_results(self, run: OCRRun, page_index: int, results: list):
+        """Merge one finished page into the live document as it arrives.
 
-    def _on_ocr_finished(self, total_chars: int, doc_bytes: bytes):
-        self._ocr_progress_bar.hide()
-        self._set_status(f"OCR 완료 — {total_chars}자 인식")
-        tab = self._active_tab()
-        if not tab:
+        render_mode=3 text is invisible, so the page looks identical: render
+        and thumbnail caches are left alone instead of reloading the document.
+        Pages of a superseded run are still merged — they were recognized
+        against that run's own page map.
+        """
+        tab = run.tab
+        if tab not in self._tabs or not tab.document:
             return
-
-        # OCR 워커가 자체 doc에 텍스트를 삽입하고 bytes로 직렬화했으므로,
-        # 메인 스레드의 doc을 이 bytes로부터 다시 열어야 OCR 결과가 반영된다.
         try:
-            current_page = tab.current_page
-            if tab.document:
-                tab.document.close()
-            new_doc = fitz.open(stream=doc_bytes, filetype="pdf")
-            tab.document = new_doc
-            tab.is_modified = True
-            self._pdf_scroll.pdf_widget.set_document(new_doc, tab.file_path)
-            self._pdf_scroll.pdf_widget._doc_bytes_snapshot = doc_bytes
-            self._sidebar.load_document(new_doc, tab.file_path, doc_bytes=doc_bytes)
-            self._update_tab_title(tab)
-            self._go_to_page(current_page)
+            t0 = time.perf_counter()
+            merged = self._merge_ocr_page(run, tab.document, page_index, results)
+            run.write_ms[page_index] = (time.perf_counter() - t0) * 1000
         except Exception as e:
             self._set_status(f"OCR 결과 적용 오류: {e}")
+            return
+        if not merged:
+            return
+        mark_edited(tab.document)
+        run.merged_pages += 1
+        self._autosave.note_edit(tab.id)
+        if not tab.is_modified:
+            tab.is_modified = True
+            self._update_tab_title(tab)
+        if tab is self._active_tab():
+            # 텍스트 편집/선택 캐시만 무효화 (렌더 캐시는 유지)
+            self._pdf_scroll.pdf_widget._text_edit_lines_cache.pop(page_index, None)
 
-    def _on_ocr_error(self, msg: str):
-        self._ocr_progress_bar.hide()
+    @staticmethod
+    def _merge_ocr_page(run: OCRRun, doc: fitz.Document, page_index: int, results: list) -> bool:
+        """Write one page of OCR results into the live document as invisible text."""
+        expected_xref = run.page_xrefs.get(page_index)
+        # Skip pages that were deleted/reordered while OCR was running.
+        if page_index >= doc.page_count or doc.page_xref(page_index) != expected_xref:
+            return False
+        apply_text_layer(doc[page_index], results, run.language)
+        return True
+
+    def _on_ocr_page_stats(self, run: OCRRun, stats):
+        """Join the UI-side write time, then log and display one page record."""
+        stats.write_ms = run.write_ms.pop(stats.page, 0.0)
+        run.stats.append(stats)
+        self._ocr_mgr.stats_log.page(run.log_context, stats)
+        if self._ocr_stats_panel and run is self._ocr_run:
+            self._ocr_stats_panel.add_page(stats, time.perf_counter())
+
+    def _on_ocr_finished(self, run: OCRRun, total_chars: int):
+        summary = self._end_ocr_run(run)
+        if summary is None:
+            return
+        msg = f"OCR 완료 — {run.merged_pages}페이지, {total_chars}자 인식"
+        if summary["avg_conf"] is not None:
+            msg += f", 평균 신뢰도 {summary['avg_conf']:.2f}"
+        self._set_status(msg)
+
+    def _on_ocr_error(self, run: OCRRun, msg: str):
+        if self._end_ocr_run(run) is None:
+            return
         QMessageBox.critical(self, "OCR 오류", msg)
 
+    def _end_ocr_run(self, run: OCRRun) -> Optional[dict]:
+        """Wrap up the current run (finished or failed) → stats summary;
+        None if a newer run has replaced it."""
+        if run is not self._ocr_run:
+            return None
+        self._ocr_run = None
+        self._ocr_progress_bar.hide()
+        tab = run.tab
+        if run.merged_pages and tab is self._active_tab():
+            # 검색/AI 워커가 OCR 텍스트를 보도록 스냅샷만 한 번 갱신한다.
+            # 보이는 모습은 같으므로 렌더·썸네일 캐시는 그대로 둔다.
+            self._pdf_scroll.pdf_widget._refresh_snapshot()
+        elif run.merged_pages and tab in self._tabs:
+            # 백그라운드 탭: 보관된 스냅샷에는 OCR 텍스트가 없다
+            tab_cache().forget(tab.id)
+
+        now = time.perf_counter()
+        summary = summarize_stats(run.stats, now - run.started)
+        if run.stats:
+            self._ocr_mgr.stats_log.run(run.log_context, summary)
+        if self._ocr_stats_panel:
+            self._ocr_stats_panel.finish(now)
+        return summary
+
     # ── Search ────────────────────────────────
 
     # ── Search ────────────────────────────────
@@ -1764,10 +2802,11 @@ class MainWindow(QMainWindow):
         self._set_status(f"'{query}' 검색 중...")
         self._search_input.setEnabled(False)
 
-        # Start async search — 수정된 doc이 있으면 bytes 스냅샷 사용
+        # Start async search — 수정된 doc이 있으면 스냅샷 사용
         self._stop_worker(getattr(self, "_search_worker", None))
-        doc_bytes = self._pdf_scroll.pdf_widget._doc_bytes_snapshot
-        self._search_worker = SearchWorker(tab.file_path, query, doc_bytes=doc_bytes)
+        snap = self._pdf_scroll.pdf_widget._snapshot
+        self._search_worker = SearchWorker(tab.file_path, query,
+                                           snapshot=snap.acquire() if snap else None)
         self._search_results_buf = []
         self._search_worker.result_found.connect(self._on_search_result_found)
         self._search_worker.finished_search.connect(self._on_search_finished)
@@ -1893,6 +2932,7 @@ class MainWindow(QMainWindow):
             self._text_panel = None
             self._stamp_panel = None
             self._search_panel = None
+            self._ocr_stats_panel = None
             self._editing_annot = None
             self._editing_annot_page = -1
             # 현재 활성 모드를 안전하게 종료 (TEXT_EDIT, TEXT_PLACEMENT, CROP 모두 처리)
@@ -1976,6 +3016,11 @@ class MainWindow(QMainWindow):
             tab.is_modified = True
             self._update_tab_title(tab)
 
+    def _on_content_removed(self):
+        tab = self._active_tab()
+        if tab:
+            tab.needs_full_save = True
+
     def _on_text_copied(self, char_count: int):
         self._set_status(f"{char_count}자 클립보드에 복사됨")
 
@@ -1985,18 +3030,18 @@ class MainWindow(QMainWindow):
         tab = self._active_tab()
         if not doc or not tab:
             return
-        # 스냅샷을 set_document 전에 만들어야 update() 시 최신 doc_bytes로 렌더링
+        # 스냅샷을 set_document 전에 만들어야 update() 시 최신 스냅샷으로 렌더링
         self._pdf_scroll.pdf_widget._doc = doc
-        self._pdf_scroll.pdf_widget._snapshot_doc_bytes()
-        doc_bytes = self._pdf_scroll.pdf_widget._doc_bytes_snapshot
+        self._pdf_scroll.pdf_widget._refresh_snapshot()
+        snapshot = self._pdf_scroll.pdf_widget._snapshot
         self._pdf_scroll.pdf_widget.set_document(doc, tab.file_path,
-                                                  keep_snapshot=True)
+                                                  keep_snapshot=True, cache_key=tab.id)
         self._pdf_scroll.pdf_widget.invalidate_all_pages()
-        self._sidebar.reload_thumbnails(doc_bytes=doc_bytes)
+        self._sidebar.reload_thumbnails(snapshot=snapshot)
         # Refresh grid view if it's currently visible
         if self._content_stack.currentWidget() == self._grid_view:
             self._grid_view.load_document(doc, tab.current_page,
-                                          file_path=tab.file_path, doc_bytes=doc_bytes)
+                                          file_path=tab.file_path, snapshot=snapshot)
         self._update_tab_title(tab)
         self._update_toolbar_state()
 
@@ -2066,29 +3111,50 @@ class MainWindow(QMainWindow):
 
     def _import_images_as_pdf(self, image_paths: list[str]):
         """이미지 파일(들)을 PDF로 변환하여 새 탭에 열기."""
-        try:
-            doc = fitz.open()
-            for img_path in image_paths:
-                pix = fitz.Pixmap(img_path)
-                w, h = pix.width, pix.height
-                pix = None  # free memory
-                page = doc.new_page(width=w, height=h)
-                page.insert_image(page.rect, filename=img_path)
-
-            # 임시 파일로 저장 후 열기
-            base = os.path.splitext(os.path.basename(image_paths[0]))[0]
-            if len(image_paths) > 1:
-                base += f"_외_{len(image_paths)-1}건"
-            tmp_path = os.path.join(tempfile.gettempdir(), f"{base}.pdf")
-            doc.save(tmp_path, garbage=3, deflate=True)
-            doc.close()
-
-            self.load_file(tmp_path)
-            self._set_status(
-                f"이미지 → PDF 변환 완료 ({len(image_paths)}장)"
-            )
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"이미지 변환 실패:\n{e}")
+        if self._import_worker and self._import_worker.isRunning():
+            QMessageBox.information(self, "알림", "이전 이미지 변환이 아직 진행 중입니다.")
+            return
+        base = os.path.splitext(os.path.basename(image_paths[0]))[0]
+        if len(image_paths) > 1:
+            base += f"_외_{len(image_paths)-1}건"
+        tmp_path = os.path.join(tempfile.gettempdir(), f"{base}.pdf")
+        n = 2
+        while os.path.exists(tmp_path) or any(t.file_path == tmp_path for t in self._tabs):
+            tmp_path = os.path.join(tempfile.gettempdir(), f"{base} ({n}).pdf")
+            n += 1
+
+        # 디코딩·축소·재압축은 병렬로, 페이지는 순서대로 백그라운드에서 추가
+        self._import_worker = ImageImportWorker(image_paths, tmp_path, image_import_options())
+        self._import_worker.progress.connect(self._on_import_progress)
+        self._import_worker.finished_import.connect(self._on_import_finished)
+        self._task_progress_bar.setRange(0, len(image_paths))
+        self._task_progress_bar.setValue(0)
+        self._task_progress_bar.show()
+        self._import_worker.start()
+
+    def _on_import_progress(self, done: int, total: int, label: str):
+        self._task_progress_bar.setRange(0, total)
+        self._task_progress_bar.setValue(done)
+        self._set_status(f"이미지 변환 중... {done}/{total} — {label}")
+
+    def _on_import_finished(self, success: bool, msg: str):
+        self._task_progress_bar.hide()
+        worker = self._import_worker
+        self._import_worker = None
+        if not success:
+            self._set_status(f"이미지 변환 실패: {msg}")
+            if msg != "취소됨":
+                QMessageBox.critical(self, "오류", f"이미지 변환 실패:\n{msg}")
+            return
+        importer = worker.importer
+        self.load_file(msg)
+        self._set_status(
+            f"이미지 → PDF 변환 완료 ({len(importer.paths) - len(importer.skipped)}장, "
+            f"{os.path.getsize(msg) / 1048576:.1f} MB)"
+        )
+        if importer.skipped:
+            names = "\n".join(f"• {Path(p).name}: {err}" for p, err in importer.skipped[:10])
+            QMessageBox.warning(self, "일부 이미지 제외", f"다음 이미지는 변환하지 못했습니다:\n{names}")
 
     # ── Window State Persistence ────────────────
 
@@ -2216,7 +3282,8 @@ class MainWindow(QMainWindow):
         if not hasattr(self, '_welcome_page'):
             return
         doc = self._active_doc()
-        if doc is None:
+        tab = self._active_tab()
+        if doc is None and not (tab and tab.id in self._open_workers):
             self._update_welcome_recent_list()
             self._welcome_page.setGeometry(self._pdf_scroll.viewport().rect())
             self._welcome_page.show()
@@ -2228,6 +3295,24 @@ class MainWindow(QMainWindow):
     # ── Close ─────────────────────────────────
 
     def closeEvent(self, event):
+        if self._is_saving():
+            # 저장이 끝나면(_on_save_finished) 다시 닫기를 시도한다
+            self._close_after_save = True
+            self._set_status("저장이 끝나면 종료합니다...")
+            event.ignore()
+            return
+        if self._merge_worker and self._merge_worker.isRunning():
+            reply = QMessageBox.question(
+                self, "합치기 진행 중",
+                "PDF 합치기가 진행 중입니다. 취소하고 종료하시겠습니까?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            )
+            if reply == QMessageBox.StandardButton.No:
+                event.ignore()
+                return
+            self._merge_worker.finished_merge.disconnect()
+            self._merge_worker.cancel()
+            self._merge_worker.wait()
         modified = [t for t in self._tabs if t.is_modified]
         if modified:
             reply = QMessageBox.question(
@@ -2238,7 +3323,32 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.StandardButton.No:
                 event.ignore()
                 return
+        if self._import_worker and self._import_worker.isRunning():
+            self._import_worker.finished_import.disconnect()
+            self._import_worker.cancel()
+            self._import_worker.wait()
+        if self._split_worker and self._split_worker.isRunning():
+            # 이미 기록된 파일은 남고 나머지는 취소된다
+            self._split_worker.finished_split.disconnect()
+            self._split_worker.cancel()
+            self._split_worker.wait()
+        for worker in self._open_workers.values():
+            worker.finished_open.disconnect()
+            worker.cancel()
+            worker.wait()
+        self._open_workers.clear()
         self._save_window_state()
+        closed_ids = [tab.id for tab in self._tabs]
         for tab in self._tabs:
+            self._discard_recovery(tab)
             tab.close()
+        # A write still in flight would recreate the entry after the discard
+        # above, and _on_journal_written no longer runs once the window is
+        # gone: let it finish, then discard here.
+        for worker in list(self._journal_workers.values()):
+            worker.finished_write.disconnect()
+            worker.wait()
+        self._journal_workers.clear()
+        for tab_id in closed_ids:
+            self._journal.discard(tab_id)
         event.accept()
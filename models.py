@@ -1,5 +1,5 @@
 """
-models.py — Data models: PDFTab, StampManager, BookmarkManager
+models.py — Data models: PDFTab, SaveProfile, StampManager, BookmarkManager
 Windows version of PDFProTool (converted from Swift/macOS)
 """
 
@@ -13,7 +13,7 @@ from typing import Optional
 from uuid import uuid4
 
 import fitz  # PyMuPDF
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QSettings, pyqtSignal
 
 
 # ─────────────────────────────────────────────
@@ -29,6 +29,21 @@ class PDFTab:
         self.file_path: str = ""
         self.current_page: int = 0
         self.is_modified: bool = False
+        # Set by edits that remove content or restructure pages (delete, insert,
+        # text-edit redactions); the next save must rewrite the whole file.
+        self.needs_full_save: bool = False
+        # Incremental updates appended since the last full rewrite
+        self.incremental_saves: int = 0
+        # document_ops.ResourceDeduper indexing this document's resources for inserts
+        self.resource_deduper = None
+        # View state, kept while the tab is in the background
+        self.zoom: float = 1.0
+        self.scroll_y: int = -1           # -1: not recorded yet (scroll to current_page)
+        self.last_active: float = time.monotonic()
+        # Hibernation: document closed while inactive. Unsaved edits live in a
+        # snapshots.DocumentSnapshot held here; clean tabs reopen file_path.
+        self.hibernated: bool = False
+        self.hibernated_snapshot = None
 
     @property
     def display_name(self) -> str:
@@ -36,10 +51,106 @@ class PDFTab:
             return "새 탭"
         return Path(self.file_path).stem
 
+    @property
+    def is_empty(self) -> bool:
+        """No document, open or hibernated — the tab can take the next opened file."""
+        return self.document is None and not self.file_path and not self.hibernated
+
     def close(self):
         if self.document:
             self.document.close()
             self.document = None
+        self.resource_deduper = None
+        self.hibernated = False
+        if self.hibernated_snapshot is not None:
+            self.hibernated_snapshot.release()
+            self.hibernated_snapshot = None
+
+
+# ─────────────────────────────────────────────
+# Save Profiles
+# ─────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class SaveProfile:
+    """How a PDF is written: speed vs. output size.
+
+    `save_kwargs()` goes to fitz.Document.save(); `prepare()` applies the
+    in-document optimizations and must only be called on a document that is
+    about to be written (a worker copy or a freshly built output document),
+    never on the live document of a tab.
+    """
+    key: str
+    label: str
+    garbage: int
+    deflate: bool
+    incremental: bool = False        # append to the original file instead of rewriting it
+    use_objstms: bool = False        # pack objects into compressed object streams
+    recompress_images: bool = False  # downsample/re-encode oversized images
+    subset_fonts: bool = False       # drop unused glyphs from embedded fonts
+
+    def save_kwargs(self) -> dict:
+        kwargs = {"garbage": self.garbage, "deflate": self.deflate}
+        if self.deflate:
+            kwargs["deflate_images"] = True
+            kwargs["deflate_fonts"] = True
+        if self.use_objstms:
+            kwargs["use_objstms"] = True
+        return kwargs
+
+    def prepare(self, doc: fitz.Document):
+        if self.subset_fonts:
+            try:
+                doc.subset_fonts()
+            except Exception:
+                pass
+        if self.recompress_images:
+            try:
+                # Only images above 200 dpi on the page are touched
+                doc.rewrite_images(dpi_threshold=200, dpi_target=150, quality=80)
+            except Exception:
+                pass  # older PyMuPDF without rewrite_images
+
+    def save(self, doc: fitz.Document, filename):
+        """prepare() + save() for an output document built just for this write."""
+        self.prepare(doc)
+        doc.save(filename, **self.save_kwargs())
+
+
+SAVE_PROFILES: dict[str, SaveProfile] = {
+    p.key: p for p in (
+        # Only "fast" appends edits to the original; the others always
+        # rewrite the file so their garbage collection actually runs.
+        SaveProfile("fast", "빠르게", garbage=0, deflate=True, incremental=True),
+        SaveProfile("balanced", "균형", garbage=3, deflate=True),
+        SaveProfile(
+            "compact", "최대 압축", garbage=4, deflate=True,
+            use_objstms=True, recompress_images=True, subset_fonts=True,
+        ),
+    )
+}
+DEFAULT_SAVE_PROFILE = "balanced"
+
+
+def save_profile(key: Optional[str] = None) -> SaveProfile:
+    """Profile by key; None → the one chosen in settings (default: balanced)."""
+    if key is None:
+        key = QSettings("PDFProTool", "Settings").value("save_profile", DEFAULT_SAVE_PROFILE, type=str)
+    return SAVE_PROFILES.get(key, SAVE_PROFILES[DEFAULT_SAVE_PROFILE])
+
+
+def save_profile_filters(selected: Optional[SaveProfile] = None) -> tuple[str, str]:
+    """Save-dialog name filters, one per profile → (filters, initial filter)."""
+    selected = selected or save_profile()
+    filters = [f"PDF — {p.label} (*.pdf)" for p in SAVE_PROFILES.values()]
+    return ";;".join(filters), f"PDF — {selected.label} (*.pdf)"
+
+
+def save_profile_from_filter(name_filter: str) -> SaveProfile:
+    for p in SAVE_PROFILES.values():
+        if name_filter == f"PDF — {p.label} (*.pdf)":
+            return p
+    return save_profile()
 
 
 # ─────────────────────────────────────────────
@@ -221,11 +332,13 @@ class AnnotationOverlayManager:
 
     def burn_into(self, doc: fitz.Document) -> fitz.Document:
         """Burn all overlay stamps into document pages and clear."""
+        from document_ops import StampImageCache
+        images = StampImageCache()  # each image file embedded once
         for stamp in self.stamps:
             if stamp.page_index < doc.page_count:
                 page = doc[stamp.page_index]
                 try:
-                    page.insert_image(stamp.rect, filename=stamp.image_path)
+                    images.insert(page, stamp.rect, stamp.image_path)
                 except Exception:
                     pass
         self.stamps.clear()
@@ -6,19 +6,38 @@ Runs OCR in a background QThread to avoid blocking the UI.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import shutil
 import sys
 import tempfile
+import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 import fitz  # PyMuPDF
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from models import SaveProfile, save_profile
+
+if TYPE_CHECKING:
+    from snapshots import DocumentSnapshot
+
 
 # Store OCR models in user profile so first download is reused forever.
 DEFAULT_OCR_MODEL_DIR = os.path.join(os.path.expanduser("~"), ".PDFProTool", "easyocr", "model")
+# Per-page OCR results live next to the models so reruns skip finished pages.
+DEFAULT_OCR_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".PDFProTool", "ocr_cache")
+
+# Page → image scale used for recognition (boxes are stored in page coords).
+OCR_RENDER_SCALE = 3.0
+# Per-page timing/accuracy records (JSON lines) for tuning workers and DPI.
+DEFAULT_OCR_STATS_LOG = os.path.join(os.path.expanduser("~"), ".PDFProTool", "ocr_stats.jsonl")
 
 
 # ─────────────────────────────────────────────
@@ -42,22 +61,467 @@ class OCRLanguage(Enum):
     def all_cases(cls) -> list["OCRLanguage"]:
         return list(cls)
 
+    @classmethod
+    def from_key(cls, key: str) -> "OCRLanguage":
+        """Look up a language by its primary code ("ko", "en", "ja", "ch_sim")."""
+        for lang in cls:
+            if lang.lang_codes[0] == key:
+                return lang
+        raise ValueError(f"unknown OCR language: {key}")
+
+
+# ─────────────────────────────────────────────
+# Per-page OCR Results Cache
+# ─────────────────────────────────────────────
+
+class OCRPageCache:
+    """
+    Persistent OCR results, one JSON file per page, keyed by a hash of the
+    page content (content stream + embedded images + geometry + languages).
+
+    Each page is written as soon as it is recognized, so a cancelled or
+    crashed run resumes from the last completed page on the next attempt.
+    Boxes are stored in PDF page coordinates: [[x0, y0, x1, y1], text, conf].
+
+    The directory is capped at `max_bytes`: hits refresh an entry's mtime and
+    `prune()` (run on the first write and every PRUNE_EVERY writes after)
+    deletes the least recently used entries. `clear()` empties it; from the
+    command line, `--ocr-batch --clear-cache`.
+    """
+
+    VERSION = 1
+    MAX_BYTES = 200 * 1024 * 1024
+    PRUNE_EVERY = 500
+
+    def __init__(self, cache_dir: str = DEFAULT_OCR_CACHE_DIR,
+                 max_bytes: int = MAX_BYTES):
+        self._dir = cache_dir
+        self.max_bytes = max_bytes
+        self._puts = 0
+        self._prune_lock = threading.Lock()
+
+    @classmethod
+    def page_key(cls, page: fitz.Page, lang_codes: list[str],
+                 scale: float = OCR_RENDER_SCALE) -> str:
+        doc = page.parent
+        h = hashlib.sha256()
+        header = f"v{cls.VERSION}|{','.join(lang_codes)}|{page.rotation}|{tuple(page.mediabox)}"
+        # Non-default render scales recognize differently; keep them apart
+        # without invalidating entries made at the default scale.
+        if scale != OCR_RENDER_SCALE:
+            header += f"|s{scale:g}"
+        h.update(header.encode("utf-8"))
+        try:
+            h.update(page.read_contents())
+        except Exception:
+            pass
+        # Scanned pages usually share an identical "/Im0 Do" content stream,
+        # so the image (and form) streams are what actually tell them apart.
+        xrefs = [img[0] for img in page.get_images(full=True)]
+        xrefs += [xo[0] for xo in page.get_xobjects()]
+        for xref in sorted(set(xrefs)):
+            try:
+                h.update(doc.xref_stream_raw(xref) or b"")
+            except Exception:
+                h.update(str(xref).encode("ascii"))
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[list]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION:
+                return None
+            os.utime(path)   # mark as recently used for prune()
+            return [(tuple(bbox), text, float(conf)) for bbox, text, conf in data["results"]]
+        except Exception:
+            return None
+
+    def put(self, key: str, results: list):
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": self.VERSION,
+                        "results": [[list(bbox), text, conf] for bbox, text, conf in results],
+                    },
+                    f, ensure_ascii=False,
+                )
+            # Atomic replace: a crash mid-write never leaves a truncated entry.
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._prune_lock:
+            self._puts += 1
+            due = self._puts % self.PRUNE_EVERY == 1
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        """Delete least recently used entries until the cache fits in 90% of
+        `max_bytes`. Returns the number of files removed."""
+        if not self._prune_lock.acquire(blocking=False):
+            return 0   # another worker is already pruning
+        try:
+            entries = []
+            total = 0
+            for root, _dirs, files in os.walk(self._dir):
+                for name in files:
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, path))
+                    total += st.st_size
+            if total <= self.max_bytes:
+                return 0
+            entries.sort()
+            target = self.max_bytes * 0.9
+            removed = 0
+            for _mtime, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+            return removed
+        finally:
+            self._prune_lock.release()
+
+    def clear(self):
+        """Delete every cached page (the next run recognizes everything again)."""
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+
+# ─────────────────────────────────────────────
+# OCR Instrumentation
+# ─────────────────────────────────────────────
+
+@dataclass
+class OCRPageStats:
+    """Timing/accuracy record for one page. All durations are milliseconds."""
+    page: int
+    source: str = "ocr"         # "ocr" (recognized) | "cache" (replayed)
+    dpi: int = 0
+    cache_ms: float = 0.0       # content hash + cache lookup
+    wait_ms: float = 0.0        # waiting for a shared reader (batch mode)
+    rasterize_ms: float = 0.0
+    encode_ms: float = 0.0
+    detect_ms: float = 0.0
+    recognize_ms: float = 0.0   # includes detection when the split API is unavailable
+    write_ms: float = 0.0       # invisible text layer insertion
+    boxes: int = 0
+    chars: int = 0
+    avg_conf: Optional[float] = None
+    peak_rss_mb: float = 0.0
+
+    @property
+    def total_ms(self) -> float:
+        return (self.cache_ms + self.wait_ms + self.rasterize_ms + self.encode_ms
+                + self.detect_ms + self.recognize_ms + self.write_ms)
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        d["total_ms"] = round(self.total_ms, 2)
+        for k, v in d.items():
+            if isinstance(v, float):
+                d[k] = round(v, 4 if k == "avg_conf" else 2)
+        return d
+
+
+def peak_rss_mb() -> float:
+    """Process memory high-water mark in MB (0.0 when unavailable)."""
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            psapi = ctypes.WinDLL("psapi")
+            kernel32 = ctypes.WinDLL("kernel32")
+            kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+            ok = psapi.GetProcessMemoryInfo(
+                kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb
+            )
+            return counters.PeakWorkingSetSize / (1024 * 1024) if ok else 0.0
+        except Exception:
+            return 0.0
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except Exception:
+        return 0.0
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def summarize_stats(stats: list[OCRPageStats], seconds: float = 0.0) -> dict:
+    """Aggregate page records: per-stage means over recognized pages, mean confidence."""
+    recognized = [s for s in stats if s.source == "ocr"]
+    summary: dict = {
+        "pages": len(stats),
+        "ocr_pages": len(recognized),
+        "cached_pages": len(stats) - len(recognized),
+        "chars": sum(s.chars for s in stats),
+        "seconds": round(seconds, 2),
+        "pages_per_sec": round(len(stats) / seconds, 3) if seconds > 0 else 0.0,
+        "peak_rss_mb": round(max((s.peak_rss_mb for s in stats), default=0.0), 1),
+    }
+    for stage in ("cache_ms", "wait_ms", "rasterize_ms", "encode_ms",
+                  "detect_ms", "recognize_ms", "write_ms", "total_ms"):
+        values = [getattr(s, stage) for s in recognized]
+        summary[f"avg_{stage}"] = round(sum(values) / len(values), 2) if values else 0.0
+    # Box-weighted mean, so a page with one word doesn't count like a full page
+    boxes = sum(s.boxes for s in stats if s.avg_conf is not None)
+    weighted = sum(s.avg_conf * s.boxes for s in stats if s.avg_conf is not None)
+    summary["avg_conf"] = round(weighted / boxes, 4) if boxes else None
+    return summary
+
+
+class OCRStatsLog:
+    """Appends OCR stats as JSON lines: one "page" record per page, one "run" summary."""
+
+    MAX_BYTES = 5 * 1024 * 1024
+
+    def __init__(self, path: str = DEFAULT_OCR_STATS_LOG):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _append(self, record: dict):
+        record = {"ts": time.strftime("%Y-%m-%dT%H:%M:%S"), **record}
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                # Keep one previous generation instead of growing forever
+                if os.path.exists(self.path) and os.path.getsize(self.path) > self.MAX_BYTES:
+                    os.replace(self.path, self.path + ".1")
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError:
+                pass
+
+    def page(self, context: dict, stats: OCRPageStats):
+        self._append({"event": "page", **context, **stats.to_dict()})
+
+    def run(self, context: dict, summary: dict):
+        self._append({"event": "run", **context, **summary})
+
+
+# ─────────────────────────────────────────────
+# Text Layer Helpers
+# ─────────────────────────────────────────────
+
+def ocr_font(language: OCRLanguage) -> "fitz.Font":
+    """Return a font that supports the OCR language glyphs."""
+    if language == OCRLanguage.KOREAN_ENGLISH:
+        return fitz.Font("korea")
+    if language == OCRLanguage.JAPANESE_ENGLISH:
+        return fitz.Font("japan")
+    if language == OCRLanguage.CHINESE_ENGLISH:
+        return fitz.Font("china-s")
+    return fitz.Font("helv")
+
+
+def results_text(results: list) -> str:
+    return "\n".join(text for _bbox, text, _conf in results)
+
+
+def apply_text_layer(page: fitz.Page, results: list, language: OCRLanguage) -> str:
+    """Insert recognized text as an invisible layer and return the plain text.
+
+    `results` is [((x0, y0, x1, y1), text, conf), ...] in page coordinates,
+    as produced by OCRWorker / OCRPageCache.
+    """
+    tw = fitz.TextWriter(page.rect)
+    font = ocr_font(language)
+
+    for (x0, y0, _x1, y1), text, _conf in results:
+        fontsize = max((y1 - y0) * 0.8, 4)
+        try:
+            tw.append(fitz.Point(x0, y1), text, font=font, fontsize=fontsize)
+        except Exception:
+            pass
+
+    # render_mode=3 → invisible text (searchable but not visible)
+    try:
+        tw.write_text(page, render_mode=3)
+    except Exception:
+        pass
+
+    return results_text(results)
+
+
+def create_reader(lang_codes: list[str], model_dir: str = DEFAULT_OCR_MODEL_DIR):
+    """Build an EasyOCR Reader (downloads missing models on first run)."""
+    import easyocr
+
+    os.makedirs(model_dir, exist_ok=True)
+    return easyocr.Reader(
+        lang_codes,
+        gpu=False,
+        verbose=False,
+        model_storage_directory=model_dir,
+        download_enabled=True,
+    )
+
+
+# Set once the split detect()/recognize() path fails, so later pages don't
+# pay for a doomed detection pass before falling back to readtext().
+_split_api_failed = False
+
+
+def _read_image(reader, img_bytes: bytes, stats: Optional[OCRPageStats]) -> list:
+    """Run EasyOCR on an encoded image, timing detection and recognition separately.
+
+    Equivalent to `reader.readtext(img_bytes, detail=1, paragraph=False)`;
+    falls back to exactly that if the split detect()/recognize() API differs
+    in the installed EasyOCR version.
+    """
+    global _split_api_failed
+    if not _split_api_failed:
+        try:
+            from easyocr.utils import reformat_input
+
+            img, img_cv_grey = reformat_input(img_bytes)
+            t0 = time.perf_counter()
+            horizontal_list, free_list = reader.detect(img, reformat=False)
+            t1 = time.perf_counter()
+            raw = reader.recognize(
+                img_cv_grey, horizontal_list[0], free_list[0],
+                detail=1, paragraph=False, reformat=False,
+            )
+            t2 = time.perf_counter()
+            if stats is not None:
+                stats.detect_ms = (t1 - t0) * 1000
+                stats.recognize_ms = (t2 - t1) * 1000
+            return raw
+        except Exception:
+            _split_api_failed = True
+
+    t0 = time.perf_counter()
+    raw = reader.readtext(img_bytes, detail=1, paragraph=False)
+    if stats is not None:
+        stats.detect_ms = 0.0
+        stats.recognize_ms = (time.perf_counter() - t0) * 1000
+    return raw
+
+
+def recognize_page(reader, page: fitz.Page, scale: float = OCR_RENDER_SCALE,
+                   stats: Optional[OCRPageStats] = None) -> list:
+    """Render a page to image and run EasyOCR.
+
+    Returns [((x0, y0, x1, y1), text, conf), ...] in PDF page coordinates.
+    When `stats` is given, stage timings, box count and mean confidence are
+    recorded on it.
+    """
+    return recognize_image(reader, rasterize_page(page, scale, stats), scale, stats)
+
+
+def rasterize_page(page: fitz.Page, scale: float = OCR_RENDER_SCALE,
+                   stats: Optional[OCRPageStats] = None) -> bytes:
+    """First half of recognize_page: the page as PNG bytes (no reader needed)."""
+    t0 = time.perf_counter()
+    mat = fitz.Matrix(scale, scale)
+    pix = page.get_pixmap(matrix=mat, alpha=False)
+    t1 = time.perf_counter()
+    img_bytes = pix.tobytes("png")
+    t2 = time.perf_counter()
+    if stats is not None:
+        stats.dpi = round(72 * scale)
+        stats.rasterize_ms = (t1 - t0) * 1000
+        stats.encode_ms = (t2 - t1) * 1000
+    return img_bytes
+
+
+def recognize_image(reader, img_bytes: bytes, scale: float = OCR_RENDER_SCALE,
+                    stats: Optional[OCRPageStats] = None) -> list:
+    """Second half of recognize_page: EasyOCR on a rasterized page."""
+    # detail=1 returns bounding boxes: [([[x1,y1],...,[x4,y4]], text, conf), ...]
+    raw = _read_image(reader, img_bytes, stats)
+
+    results = []
+    for bbox, text, conf in raw:
+        text = text.strip()
+        if not text:
+            continue
+        # Convert image coords (at render scale) → PDF page coords
+        x0 = float(bbox[0][0]) / scale
+        y0 = float(bbox[0][1]) / scale
+        x1 = float(bbox[2][0]) / scale
+        y1 = float(bbox[2][1]) / scale
+        results.append(((x0, y0, x1, y1), text, float(conf)))
+
+    if stats is not None:
+        record_results(stats, results)
+    return results
+
+
+def record_results(stats: OCRPageStats, results: list):
+    """Fill box/char counts, mean confidence and memory high-water mark."""
+    stats.boxes = len(results)
+    stats.chars = len(results_text(results))
+    stats.avg_conf = (sum(conf for _b, _t, conf in results) / len(results)) if results else None
+    stats.peak_rss_mb = peak_rss_mb()
+
 
 # ─────────────────────────────────────────────
 # OCR Worker Thread
 # ─────────────────────────────────────────────
 
 class OCRWorker(QThread):
-    """Runs EasyOCR in a background thread."""
+    """Runs EasyOCR in a background thread.
+
+    The worker only recognizes; it never serializes a document. Results are
+    streamed back per page (`page_results`) so the caller can merge the
+    invisible text layers into its own live document as they complete
+    (see `apply_text_layer`).
+    """
 
-    # Emits (current_page, total_pages)
+    # Emits (current_step, total_steps) over the requested pages
     progress = pyqtSignal(int, int)
     # Emits status text for UI
     status = pyqtSignal(str)
     # Emits (page_index, recognized_text)
     page_done = pyqtSignal(int, str)
-    # Emits (total_char_count, doc_bytes) on completion
-    finished_ocr = pyqtSignal(int, bytes)
+    # Emits (page_index, results) as soon as a page is recognized or read from cache
+    page_results = pyqtSignal(int, object)
+    # Emits an OCRPageStats right after the matching page_results
+    page_stats = pyqtSignal(object)
+    # Emits (total_char_count, {page_index: results}) on completion
+    finished_ocr = pyqtSignal(int, object)
     # Emits error message on failure
     error = pyqtSignal(str)
 
@@ -66,12 +530,19 @@ class OCRWorker(QThread):
         file_path: str,
         language: OCRLanguage,
         model_dir: str = DEFAULT_OCR_MODEL_DIR,
+        cache: Optional[OCRPageCache] = None,
+        pages: Optional[list[int]] = None,
+        snapshot: Optional[DocumentSnapshot] = None,
         parent=None,
     ):
         super().__init__(parent)
         self._file_path = file_path
+        self._snapshot = snapshot  # reference owned by the worker
         self.language = language
         self._model_dir = model_dir
+        self._cache = cache
+        # None → every page. Pages that already carry text are always skipped.
+        self.pages = sorted(set(pages)) if pages is not None else None
         self._cancelled = False
 
     def cancel(self):
@@ -82,6 +553,10 @@ class OCRWorker(QThread):
             self._run_ocr()
         except Exception as e:
             self.error.emit(str(e))
+        finally:
+            if self._snapshot:
+                self._snapshot.release()
+                self._snapshot = None
 
     @staticmethod
     def _has_any_model_file(model_dir: str) -> bool:
@@ -93,10 +568,11 @@ class OCRWorker(QThread):
                 return True
         return False
 
-    def _run_ocr(self):
+    def _load_reader(self):
+        """Import EasyOCR and build a Reader. Emits `error` and returns None on failure."""
         # Lazy-import easyocr (slow to import, so do it here in the thread)
         try:
-            import easyocr
+            import easyocr  # noqa: F401  (availability check; create_reader builds it)
         except ImportError as e:
             detail = f"{type(e).__name__}: {e}"
             log_path = ""
@@ -123,9 +599,8 @@ class OCRWorker(QThread):
                     "pip install easyocr --break-system-packages\n"
                     "명령어로 설치해주세요."
                 )
-            return
+            return None
 
-        os.makedirs(self._model_dir, exist_ok=True)
         had_model_before = self._has_any_model_file(self._model_dir)
 
         # Reader() downloads missing models on first run.
@@ -135,13 +610,7 @@ class OCRWorker(QThread):
             self.status.emit("OCR 엔진 준비 중...")
 
         try:
-            reader = easyocr.Reader(
-                self.language.lang_codes,
-                gpu=False,
-                verbose=False,
-                model_storage_directory=self._model_dir,
-                download_enabled=True,
-            )
+            reader = create_reader(self.language.lang_codes, self._model_dir)
         except Exception as e:
             if not had_model_before:
                 self.error.emit(
@@ -151,94 +620,74 @@ class OCRWorker(QThread):
                 )
             else:
                 self.error.emit(f"OCR 초기화 실패: {e}")
-            return
+            return None
 
         if not had_model_before and self._has_any_model_file(self._model_dir):
             self.status.emit("OCR 모델 다운로드 완료")
+        return reader
 
+    def _run_ocr(self):
         # Open a worker-private document instance to avoid threading conflicts
-        doc = fitz.open(self._file_path)
+        doc = self._snapshot.open() if self._snapshot else fitz.open(self._file_path)
         try:
-            page_count = doc.page_count
+            if self.pages is None:
+                targets = list(range(doc.page_count))
+            else:
+                targets = [i for i in self.pages if 0 <= i < doc.page_count]
             total_chars = 0
+            collected: dict[int, list] = {}
+            # The reader is only built once a page actually misses the cache,
+            # so a fully cached rerun never pays the model load.
+            reader = None
 
-            for i in range(page_count):
+            for step, i in enumerate(targets, start=1):
                 if self._cancelled:
                     break
 
-                self.progress.emit(i + 1, page_count)
+                self.progress.emit(step, len(targets))
                 page = doc[i]
 
-                # Check if page already has extractable text
-                existing_text = page.get_text("text").strip()
-                if existing_text:
-                    self.page_done.emit(i, existing_text)
-                    total_chars += len(existing_text)
+                # Pages that already have extractable text are left untouched
+                # (re-OCR would stack a second invisible layer on top).
+                if page.get_text("text").strip():
                     continue
 
-                # Render page to image for OCR
-                try:
-                    text = self._ocr_page(reader, page)
-                    self.page_done.emit(i, text)
-                    total_chars += len(text)
-                except Exception:
-                    self.page_done.emit(i, "")
-
-            # OCR 텍스트가 삽입된 doc을 bytes로 직렬화하여 메인 스레드에 전달
-            doc_bytes = doc.tobytes()
-            self.finished_ocr.emit(total_chars, doc_bytes)
+                stats = OCRPageStats(page=i)
+                key = ""
+                results = None
+                if self._cache is not None:
+                    t0 = time.perf_counter()
+                    key = OCRPageCache.page_key(page, self.language.lang_codes)
+                    results = self._cache.get(key)
+                    stats.cache_ms = (time.perf_counter() - t0) * 1000
+
+                if results is None:
+                    if reader is None:
+                        reader = self._load_reader()
+                        if reader is None:
+                            return
+                    try:
+                        results = recognize_page(reader, page, stats=stats)
+                    except Exception:
+                        self.page_done.emit(i, "")
+                        continue
+                    if key:
+                        self._cache.put(key, results)
+                else:
+                    stats.source = "cache"
+                    record_results(stats, results)
+
+                text = results_text(results)
+                collected[i] = results
+                self.page_results.emit(i, results)
+                self.page_stats.emit(stats)
+                self.page_done.emit(i, text)
+                total_chars += len(text)
+
+            self.finished_ocr.emit(total_chars, collected)
         finally:
             doc.close()
 
-    def _get_font(self) -> "fitz.Font":
-        """Return a font that supports the OCR language glyphs."""
-        if self.language == OCRLanguage.KOREAN_ENGLISH:
-            return fitz.Font("korea")
-        if self.language == OCRLanguage.JAPANESE_ENGLISH:
-            return fitz.Font("japan")
-        if self.language == OCRLanguage.CHINESE_ENGLISH:
-            return fitz.Font("china-s")
-        return fitz.Font("helv")
-
-    def _ocr_page(self, reader, page: fitz.Page) -> str:
-        """Render a page to image, run EasyOCR, and insert invisible text layer."""
-        scale = 3.0
-        mat = fitz.Matrix(scale, scale)
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        img_bytes = pix.tobytes("png")
-
-        # detail=1 returns bounding boxes: [([[x1,y1],...,[x4,y4]], text, conf), ...]
-        results = reader.readtext(img_bytes, detail=1, paragraph=False)
-
-        texts = []
-        tw = fitz.TextWriter(page.rect)
-        font = self._get_font()
-
-        for bbox, text, _conf in results:
-            text = text.strip()
-            if not text:
-                continue
-            texts.append(text)
-
-            # Convert image coords (at 3x scale) → PDF page coords
-            x0 = bbox[0][0] / scale
-            y0 = bbox[0][1] / scale
-            y1 = bbox[2][1] / scale
-            fontsize = max((y1 - y0) * 0.8, 4)
-
-            try:
-                tw.append(fitz.Point(x0, y1), text, font=font, fontsize=fontsize)
-            except Exception:
-                pass
-
-        # render_mode=3 → invisible text (searchable but not visible)
-        try:
-            tw.write_text(page, render_mode=3)
-        except Exception:
-            pass
-
-        return "\n".join(texts)
-
 
 # ─────────────────────────────────────────────
 # OCR Manager (thin wrapper around OCRWorker)
@@ -249,22 +698,37 @@ class OCRManager:
     High-level OCR manager.
     Usage:
         mgr = OCRManager()
-        worker = mgr.start(doc, language)
+        worker = mgr.start(file_path, language, pages=[0, 3, 4])
         worker.progress.connect(...)
-        worker.finished_ocr.connect(...)
+        worker.finished_ocr.connect(...)   # merge with apply_text_layer()
+        worker.page_stats.connect(...)     # OCRPageStats → mgr.stats_log
     """
 
-    def __init__(self, model_dir: str = DEFAULT_OCR_MODEL_DIR):
+    def __init__(self, model_dir: str = DEFAULT_OCR_MODEL_DIR,
+                 cache_dir: str = DEFAULT_OCR_CACHE_DIR,
+                 stats_log_path: str = DEFAULT_OCR_STATS_LOG):
         self._current_worker: Optional[OCRWorker] = None
         self._model_dir = model_dir
-
-    def start(self, file_path: str, language: OCRLanguage) -> OCRWorker:
-        """Cancel any running OCR and start a new one. Returns the worker."""
+        self.cache = OCRPageCache(cache_dir)
+        self.stats_log = OCRStatsLog(stats_log_path)
+
+    def start(self, file_path: str, language: OCRLanguage,
+              pages: Optional[list[int]] = None,
+              snapshot: Optional[DocumentSnapshot] = None) -> OCRWorker:
+        """Cancel any running OCR and start a new one. Returns the worker.
+
+        `pages` limits recognition to those page indices (None = all pages);
+        `snapshot` (a reference handed to the worker) lets it read the current
+        in-memory edits.
+        """
         if self._current_worker and self._current_worker.isRunning():
             self._current_worker.cancel()
             self._current_worker.wait(msecs=2000)
 
-        worker = OCRWorker(file_path, language, model_dir=self._model_dir)
+        worker = OCRWorker(
+            file_path, language, model_dir=self._model_dir, cache=self.cache,
+            pages=pages, snapshot=snapshot,
+        )
         self._current_worker = worker
         worker.start()
         return worker
@@ -274,3 +738,269 @@ class OCRManager:
             self._current_worker.cancel()
             self._current_worker.wait(msecs=2000)
 
+
+# ─────────────────────────────────────────────
+# Batch OCR (headless, no GUI)
+# ─────────────────────────────────────────────
+
+@dataclass
+class BatchOCRResult:
+    src: str
+    dest: str
+    pages: int = 0
+    ocr_pages: int = 0      # pages recognized by the reader in this run
+    cached_pages: int = 0   # pages replayed from OCRPageCache
+    chars: int = 0
+    seconds: float = 0.0
+    skipped: bool = False   # output already existed
+    error: str = ""
+    stats: list = field(default_factory=list)   # OCRPageStats per processed page
+
+    @property
+    def pages_per_sec(self) -> float:
+        return self.pages / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def avg_conf(self) -> Optional[float]:
+        return summarize_stats(self.stats)["avg_conf"]
+
+
+class BatchOCRRunner:
+    """
+    OCR many PDFs into searchable copies in `output_dir`.
+
+    Files are scheduled on a bounded thread pool. All workers share one warm
+    EasyOCR reader (loaded once, on the first cache miss); recognition calls
+    are serialized on it while rasterizing, hashing and saving overlap in the
+    other workers. Uses the same cache and text-layer code as OCRWorker.
+    """
+
+    def __init__(
+        self,
+        language: OCRLanguage,
+        output_dir: str,
+        workers: int = 2,
+        model_dir: str = DEFAULT_OCR_MODEL_DIR,
+        cache: Optional[OCRPageCache] = None,
+        overwrite: bool = False,
+        log: Callable[[str], None] = print,
+        scale: float = OCR_RENDER_SCALE,
+        stats_log: Optional[OCRStatsLog] = None,
+        profile: Optional[SaveProfile] = None,
+    ):
+        self.language = language
+        self.output_dir = output_dir
+        self.workers = max(1, int(workers))
+        self.scale = scale
+        self.profile = profile or save_profile()
+        self._stats_log = stats_log
+        self._model_dir = model_dir
+        self._cache = cache
+        self._overwrite = overwrite
+        self._log = log
+        self._reader = None
+        self._reader_error: Optional[Exception] = None
+        self._reader_lock = threading.Lock()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    @staticmethod
+    def collect_inputs(paths: list[str]) -> list[str]:
+        """Expand directories (non-recursive) into their PDF files, keeping order."""
+        files: list[str] = []
+        for p in paths:
+            if os.path.isdir(p):
+                for name in sorted(os.listdir(p)):
+                    full = os.path.join(p, name)
+                    if os.path.isfile(full) and name.lower().endswith(".pdf"):
+                        files.append(full)
+            elif p.lower().endswith(".pdf") and os.path.isfile(p):
+                files.append(p)
+        unique: list[str] = []
+        seen: set[str] = set()
+        for f in files:
+            key = os.path.normcase(os.path.abspath(f))
+            if key not in seen:
+                seen.add(key)
+                unique.append(f)
+        return unique
+
+    def output_paths(self, files: list[str]) -> list[str]:
+        """Destination per input file: its name in output_dir, numbered when
+        several inputs share a name (a/x.pdf, b/x.pdf → x.pdf, x-2.pdf).
+        Deterministic for the same input list, so reruns find their outputs."""
+        taken: set[str] = set()
+        dests: list[str] = []
+        for src in files:
+            stem, ext = os.path.splitext(os.path.basename(src))
+            name, n = stem + ext, 1
+            while os.path.normcase(name) in taken:
+                n += 1
+                name = f"{stem}-{n}{ext}"
+            taken.add(os.path.normcase(name))
+            dests.append(os.path.join(self.output_dir, name))
+        return dests
+
+    def _get_reader(self):
+        with self._reader_lock:
+            # A failed model load is remembered so the remaining files fail
+            # fast instead of retrying the download once per file.
+            if self._reader_error is not None:
+                raise self._reader_error
+            if self._reader is None:
+                self._log("OCR 엔진 준비 중...")
+                try:
+                    self._reader = create_reader(self.language.lang_codes, self._model_dir)
+                except Exception as e:
+                    self._reader_error = e
+                    raise
+            return self._reader
+
+    def _recognize(self, page: fitz.Page, stats: OCRPageStats) -> list:
+        reader = self._get_reader()
+        # Rasterizing and PNG encoding run in parallel across workers;
+        # EasyOCR/torch inference is not re-entrant on one Reader.
+        img_bytes = rasterize_page(page, self.scale, stats)
+        t0 = time.perf_counter()
+        with self._reader_lock:
+            stats.wait_ms = (time.perf_counter() - t0) * 1000
+            return recognize_image(reader, img_bytes, self.scale, stats)
+
+    def _log_context(self, src: str) -> dict:
+        return {
+            "mode": "batch",
+            "file": os.path.basename(src),
+            "lang": self.language.lang_codes[0],
+            "workers": self.workers,
+        }
+
+    def _process_file(self, src: str, dest: str) -> BatchOCRResult:
+        result = BatchOCRResult(src=src, dest=dest)
+        if not self._overwrite and os.path.exists(dest):
+            result.skipped = True
+            return result
+
+        started = time.perf_counter()
+        doc = None
+        # Written next to the destination and renamed, so an interrupted
+        # batch never leaves a half-written "finished" file behind.
+        tmp_path = dest + ".part"
+        try:
+            doc = fitz.open(src)
+            result.pages = doc.page_count
+            for page in doc:
+                if self._cancelled:
+                    raise RuntimeError("취소됨")
+                if page.get_text("text").strip():
+                    continue
+                stats = OCRPageStats(page=page.number)
+                key = ""
+                results = None
+                if self._cache is not None:
+                    t0 = time.perf_counter()
+                    key = OCRPageCache.page_key(page, self.language.lang_codes, self.scale)
+                    results = self._cache.get(key)
+                    stats.cache_ms = (time.perf_counter() - t0) * 1000
+                if results is None:
+                    results = self._recognize(page, stats)
+                    result.ocr_pages += 1
+                    if key:
+                        self._cache.put(key, results)
+                else:
+                    stats.source = "cache"
+                    record_results(stats, results)
+                    result.cached_pages += 1
+                t0 = time.perf_counter()
+                result.chars += len(apply_text_layer(page, results, self.language))
+                stats.write_ms = (time.perf_counter() - t0) * 1000
+                result.stats.append(stats)
+                if self._stats_log is not None:
+                    self._stats_log.page(self._log_context(src), stats)
+
+            self.profile.save(doc, tmp_path)
+            doc.close()
+            doc = None
+            os.replace(tmp_path, dest)
+        except Exception as e:
+            result.error = str(e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        finally:
+            if doc:
+                doc.close()
+        result.seconds = time.perf_counter() - started
+        return result
+
+    def run(self, paths: list[str]) -> list[BatchOCRResult]:
+        files = self.collect_inputs(paths)
+        os.makedirs(self.output_dir, exist_ok=True)
+        results: list[BatchOCRResult] = []
+        if not files:
+            self._log("처리할 PDF가 없습니다.")
+            return results
+
+        started = time.perf_counter()
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            futures = [pool.submit(self._process_file, f, d)
+                       for f, d in zip(files, self.output_paths(files))]
+            for n, fut in enumerate(as_completed(futures), start=1):
+                r = fut.result()
+                results.append(r)
+                name = os.path.basename(r.src)
+                if r.error:
+                    self._log(f"[{n}/{len(files)}] {name} — 실패: {r.error}")
+                elif r.skipped:
+                    self._log(f"[{n}/{len(files)}] {name} — 건너뜀 (출력 파일 있음)")
+                else:
+                    conf = r.avg_conf
+                    self._log(
+                        f"[{n}/{len(files)}] {name} — {r.pages}p "
+                        f"(OCR {r.ocr_pages}, 캐시 {r.cached_pages}), "
+                        f"{r.chars}자, {r.seconds:.1f}s, {r.pages_per_sec:.2f} p/s"
+                        + (f", 신뢰도 {conf:.2f}" if conf is not None else "")
+                    )
+                    if self._stats_log is not None:
+                        self._stats_log.run(
+                            self._log_context(r.src), summarize_stats(r.stats, r.seconds)
+                        )
+        except KeyboardInterrupt:
+            self.cancel()
+            raise
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        elapsed = time.perf_counter() - started
+        done = [r for r in results if not r.error and not r.skipped]
+        total_pages = sum(r.pages for r in done)
+        rate = total_pages / elapsed if elapsed > 0 else 0.0
+        all_stats = [st for r in done for st in r.stats]
+        summary = summarize_stats(all_stats, elapsed)
+        stage_line = ""
+        if summary["ocr_pages"]:
+            stage_line = (
+                f"\n  페이지당 평균(ms): 래스터 {summary['avg_rasterize_ms']:.0f}, "
+                f"인코딩 {summary['avg_encode_ms']:.0f}, 검출 {summary['avg_detect_ms']:.0f}, "
+                f"인식 {summary['avg_recognize_ms']:.0f}, 대기 {summary['avg_wait_ms']:.0f}, "
+                f"쓰기 {summary['avg_write_ms']:.0f}"
+            )
+        self._log(
+            f"완료: {len(done)}개 파일, {total_pages}페이지, "
+            f"실패 {sum(1 for r in results if r.error)}개, "
+            f"{elapsed:.1f}s ({rate:.2f} p/s), 최대 메모리 {peak_rss_mb():.0f}MB"
+            + stage_line
+        )
+        if self._stats_log is not None:
+            self._stats_log.run(
+                {"mode": "batch", "file": "*", "lang": self.language.lang_codes[0],
+                 "workers": self.workers, "files": len(done)},
+                summary,
+            )
+        # Report in input order
+        order = {f: i for i, f in enumerate(files)}
+        results.sort(key=lambda r: order.get(r.src, 0))
+        return results
@@ -1,5 +1,5 @@
 """
-panels.py — Right panels: StampPanel, TextToolPanel, SearchResultsPanel
+panels.py — Right panels: StampPanel, TextToolPanel, SearchResultsPanel, OCRStatsPanel
 Windows version of PDFProTool (converted from PanelsView.swift)
 """
 
@@ -19,6 +19,7 @@ from PyQt6.QtWidgets import (
 
 from models import StampManager, StampEntry
 from ai_manager import AIManager
+from ocr_manager import OCRPageStats, summarize_stats
 
 
 # ─────────────────────────────────────────────
@@ -803,6 +804,125 @@ class SearchResultsPanel(QWidget):
             self.result_selected.emit(page, rect)
 
 
+# ─────────────────────────────────────────────
+# OCR Stats Panel
+# ─────────────────────────────────────────────
+
+class OCRStatsPanel(QWidget):
+    """Live per-page OCR timings, confidence and memory for the running job."""
+
+    closed = pyqtSignal()
+
+    def __init__(self, log_path: str = "", parent=None):
+        super().__init__(parent)
+        self.setObjectName("sidePanel")
+        self.setFixedWidth(280)
+        self._stats: list[OCRPageStats] = []
+        self._started = 0.0
+        self._elapsed = 0.0
+        self._log_path = log_path
+        self._build_ui()
+
+    def _build_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        # Header
+        header = QWidget()
+        header.setObjectName("panelHeader")
+        hl = QHBoxLayout(header)
+        hl.setContentsMargins(8, 6, 8, 6)
+
+        title = QLabel("OCR 통계")
+        title.setObjectName("panelTitle")
+        hl.addWidget(title)
+        hl.addStretch()
+
+        close_btn = QPushButton("x")
+        close_btn.setFixedSize(24, 24)
+        close_btn.setObjectName("panelCloseButton")
+        close_btn.clicked.connect(self.closed.emit)
+        hl.addWidget(close_btn)
+        layout.addWidget(header)
+
+        body = QWidget()
+        bl = QVBoxLayout(body)
+        bl.setContentsMargins(10, 8, 10, 8)
+        bl.setSpacing(4)
+
+        self._summary_label = QLabel("대기 중")
+        self._summary_label.setWordWrap(True)
+        bl.addWidget(self._summary_label)
+
+        self._stage_label = QLabel("")
+        self._stage_label.setObjectName("panelSubtle")
+        self._stage_label.setWordWrap(True)
+        bl.addWidget(self._stage_label)
+
+        if self._log_path:
+            log_label = QLabel(f"로그: {self._log_path}")
+            log_label.setObjectName("panelSubtle")
+            log_label.setWordWrap(True)
+            log_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+            bl.addWidget(log_label)
+        layout.addWidget(body)
+
+        # Per-page list
+        self._list = QListWidget()
+        self._list.setObjectName("searchResultsList")
+        layout.addWidget(self._list, 1)
+
+    def reset(self, started: float):
+        """Start a new run; `started` is a time.perf_counter() timestamp."""
+        self._stats = []
+        self._started = started
+        self._elapsed = 0.0
+        self._list.clear()
+        self._summary_label.setText("OCR 실행 중...")
+        self._stage_label.setText("")
+
+    def add_page(self, stats: OCRPageStats, now: float):
+        self._stats.append(stats)
+        self._elapsed = now - self._started
+
+        conf = f"{stats.avg_conf:.2f}" if stats.avg_conf is not None else "-"
+        if stats.source == "cache":
+            line = f"{stats.page + 1}p  캐시  {stats.total_ms:.0f}ms  신뢰도 {conf}"
+        else:
+            line = f"{stats.page + 1}p  {stats.total_ms:.0f}ms  신뢰도 {conf}"
+        item = QListWidgetItem(line)
+        item.setToolTip(
+            f"래스터 {stats.rasterize_ms:.0f}ms · 인코딩 {stats.encode_ms:.0f}ms\n"
+            f"검출 {stats.detect_ms:.0f}ms · 인식 {stats.recognize_ms:.0f}ms\n"
+            f"캐시 조회 {stats.cache_ms:.0f}ms · 텍스트 쓰기 {stats.write_ms:.0f}ms\n"
+            f"{stats.boxes}개 영역, {stats.chars}자, {stats.dpi or '-'} DPI"
+        )
+        self._list.addItem(item)
+        self._list.scrollToBottom()
+        self._refresh_summary()
+
+    def finish(self, now: float):
+        self._elapsed = now - self._started
+        self._refresh_summary()
+
+    def _refresh_summary(self):
+        s = summarize_stats(self._stats, self._elapsed)
+        conf = f"{s['avg_conf']:.2f}" if s["avg_conf"] is not None else "-"
+        self._summary_label.setText(
+            f"{s['pages']}페이지 (OCR {s['ocr_pages']}, 캐시 {s['cached_pages']})\n"
+            f"{s['pages_per_sec']:.2f} p/s · 평균 신뢰도 {conf}\n"
+            f"최대 메모리 {s['peak_rss_mb']:.0f}MB"
+        )
+        if s["ocr_pages"]:
+            self._stage_label.setText(
+                "페이지당 평균(ms)\n"
+                f"래스터 {s['avg_rasterize_ms']:.0f} · 인코딩 {s['avg_encode_ms']:.0f}\n"
+                f"검출 {s['avg_detect_ms']:.0f} · 인식 {s['avg_recognize_ms']:.0f} · "
+                f"쓰기 {s['avg_write_ms']:.0f}"
+            )
+
+
 class AIToolPanel(QWidget):
     """Panel offering AI assistant features (Summarize, Extract Table, OCR Correct)."""
     
@@ -14,6 +14,11 @@ import logging
 import math
 import os
 import tempfile
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate
 from typing import Optional, Callable
 
 # ── 텍스트 편집 디버그 로그 ─────────────────────────────
@@ -33,13 +38,18 @@ from PyQt6.QtGui import (
     QPainter, QPen, QPixmap, QWheelEvent,
 )
 from PyQt6.QtWidgets import (
-    QApplication, QInputDialog, QMenu, QScrollArea, QSizePolicy,
+    QApplication, QInputDialog, QMenu, QMessageBox, QScrollArea, QSizePolicy,
     QWidget,
 )
 from PyQt6.QtCore import QThreadPool, QRunnable, QObject, QThread
 
 from collections import OrderedDict
 
+from document_ops import StampImageCache, parse_page_ranges
+from perf_trace import PerfOverlay, perf_tracer
+from snapshots import DocumentSnapshot, edit_state, mark_edited, snapshot_service
+from tab_cache import image_bytes, tab_cache
+
 
 
 def _resolve_freetext_font(
@@ -129,58 +139,173 @@ def _resolve_freetext_font(
 
 class WorkerSignals(QObject):
     finished = pyqtSignal(QImage, bool)  # True if high-res, False if low-res
+    skipped = pyqtSignal()               # no longer wanted (zoom changed / scrolled away)
+
+# Estimated memory for cached display lists, all pages and documents together
+DISPLAY_LIST_BUDGET = 192 * 1024 * 1024
+
+
+class _DisplayListEntry:
+    __slots__ = ("dl", "lock", "nbytes")
+
+    def __init__(self, dl: fitz.DisplayList, nbytes: int):
+        self.dl = dl
+        self.lock = threading.Lock()   # replayed by one thread at a time
+        self.nbytes = nbytes
+
+
+class DisplayListCache:
+    """
+    MuPDF display lists of recently rendered pages, shared by render workers.
+
+    Interpreting the content stream is most of the work on vector-heavy
+    pages; a display list keeps the interpreted drawing operations, so
+    another zoom level (or the preview) only rasterizes. Entries are keyed by
+    an immutable source — snapshot version, or file path + mtime + size — so
+    an edited document never hits a stale list. The size of a list is
+    estimated from the decoded content stream; least recently used lists go
+    once the estimate exceeds the budget.
+    """
+
+    MIN_ENTRY_BYTES = 64 * 1024
+
+    def __init__(self, budget: int = DISPLAY_LIST_BUDGET):
+        self.budget = budget
+        self._entries: OrderedDict[tuple, _DisplayListEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def render(self, source: tuple, open_doc: Callable[[], fitz.Document],
+               page_index: int, matrix: fitz.Matrix) -> fitz.Pixmap:
+        key = (source, page_index)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if entry is None:
+            page = open_doc()[page_index]
+            dl = page.get_displaylist()
+            try:
+                nbytes = max(self.MIN_ENTRY_BYTES, 4 * len(page.read_contents()))
+            except Exception:
+                nbytes = self.MIN_ENTRY_BYTES
+            entry = _DisplayListEntry(dl, nbytes)
+            self._add(key, entry)
+        with entry.lock:
+            return entry.dl.get_pixmap(matrix=matrix, alpha=False)
+
+    def _add(self, key: tuple, entry: _DisplayListEntry):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            self._entries[key] = entry
+            self._bytes += entry.nbytes
+            while self._bytes > self.budget and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_display_lists = DisplayListCache()
+
+
+def display_lists() -> DisplayListCache:
+    """The display list cache shared by all RenderWorkers."""
+    return _display_lists
+
 
 class RenderWorker(QRunnable):
     """Background worker to render a PDF page (스레드 전용 doc 인스턴스 사용).
 
-    doc_bytes가 제공되면 메모리에서 열고 (수정된 doc),
+    snapshot이 주어지면 (수정된 doc) 이 스레드가 캐시한 스냅샷 문서로,
     없으면 file_path에서 열어 (원본 파일) 렌더링한다.
+    The snapshot reference passed in is released when the task ends.
     """
 
     def __init__(self, file_path: str, page_index: int, zoom: float,
                  is_valid_cb: Optional[callable] = None,
-                 doc_bytes: Optional[bytes] = None):
+                 snapshot: Optional[DocumentSnapshot] = None,
+                 want_preview: bool = True):
         super().__init__()
         self._file_path = file_path
-        self._doc_bytes = doc_bytes
+        self._snapshot = snapshot
         self.page_index = page_index
         self.zoom = zoom
+        # The viewer already has something to show for this page → full pass only
+        self.want_preview = want_preview
         self.is_valid_cb = is_valid_cb
         self.signals = WorkerSignals()
 
     def run(self):
-        if self.is_valid_cb and not self.is_valid_cb():
-            return
+        try:
+            if self.is_valid_cb and not self.is_valid_cb():
+                self.signals.skipped.emit()
+                return
+            self._render()
+        finally:
+            if self._snapshot:
+                self._snapshot.release()
+
+    def _source_key(self) -> tuple:
+        """Identifies the exact document bytes this task renders from."""
+        if self._snapshot:
+            return ("snapshot", self._snapshot.version)
+        st = os.stat(self._file_path)
+        return ("file", self._file_path, st.st_mtime_ns, st.st_size)
 
+    def _render(self):
         doc = None
-        try:
-            if self._doc_bytes:
-                doc = fitz.open(stream=self._doc_bytes, filetype="pdf")
-            else:
+
+        def open_doc() -> fitz.Document:
+            # Only needed when the page's display list is not cached yet
+            nonlocal doc
+            if self._snapshot:
+                # Parsed once per pool thread and snapshot version (see snapshots._SharedDocCache)
+                return self._snapshot.open_shared()
+            if doc is None:
                 doc = fitz.open(self._file_path)
+            return doc
+
+        try:
+            source = self._source_key()
             dpr = 2.0
 
-            # FAST PASS (Low Res Preview)
-            try:
-                page = doc[self.page_index]
-                low_mat = fitz.Matrix(self.zoom * dpr * 0.2, self.zoom * dpr * 0.2)
-                pix_low = page.get_pixmap(matrix=low_mat, alpha=False)
-                fmt = QImage.Format.Format_RGB888 if pix_low.n == 3 else QImage.Format.Format_RGBA8888
-                img_low = QImage(pix_low.samples, pix_low.width, pix_low.height, pix_low.stride, fmt)
-                img_low = img_low.copy()
-                img_low.setDevicePixelRatio(dpr * 0.2)
-                self.signals.finished.emit(img_low, False)
-            except Exception:
-                pass
+            # FAST PASS (zoom-independent preview, once per page)
+            if self.want_preview:
+                try:
+                    low_mat = fitz.Matrix(PREVIEW_SCALE, PREVIEW_SCALE)
+                    with perf_tracer().span("render preview", "render", page=self.page_index):
+                        pix_low = display_lists().render(source, open_doc, self.page_index, low_mat)
+                    fmt = QImage.Format.Format_RGB888 if pix_low.n == 3 else QImage.Format.Format_RGBA8888
+                    img_low = QImage(pix_low.samples, pix_low.width, pix_low.height, pix_low.stride, fmt)
+                    img_low = img_low.copy()
+                    self.signals.finished.emit(img_low, False)
+                except Exception:
+                    pass
 
-            if self.is_valid_cb and not self.is_valid_cb():
-                return
+                if self.is_valid_cb and not self.is_valid_cb():
+                    self.signals.skipped.emit()
+                    return
 
             # HIGH RES PASS
             try:
-                page = doc[self.page_index]
                 mat = fitz.Matrix(self.zoom * dpr, self.zoom * dpr)
-                pix = page.get_pixmap(matrix=mat, alpha=False)
+                with perf_tracer().span("render page", "render", page=self.page_index, zoom=self.zoom):
+                    pix = display_lists().render(source, open_doc, self.page_index, mat)
                 fmt = QImage.Format.Format_RGB888 if pix.n == 3 else QImage.Format.Format_RGBA8888
                 img = QImage(pix.samples, pix.width, pix.height, pix.stride, fmt)
                 img = img.copy()  # Detach from fitz memory
@@ -198,6 +323,24 @@ class RenderWorker(QRunnable):
 
 PAGE_GAP = 16  # pixels between pages
 
+# Page previews: one low-res image per page, whatever the zoom (pixels per point)
+PREVIEW_SCALE = 0.4
+PREVIEW_CACHE_PAGES = 300
+
+# Scroll prefetch: render the pages the viewport will reach within the
+# horizon at the current scroll speed, at most PREFETCH_MAX_PAGES ahead.
+PREFETCH_HORIZON_S = 0.5
+PREFETCH_MAX_PAGES = 12
+PREFETCH_READING_AHEAD = 2   # slow/no scrolling: next pages only
+PREFETCH_BEHIND = 1
+PREFETCH_SLOW_PX_S = 300     # below this the user is reading, not travelling
+
+# Documents with more pages start from an estimated uniform layout; the real
+# page sizes are filled in afterwards, PAGE_RECT_CHUNK pages at a time.
+LAZY_PAGE_RECTS_MIN = 300
+PAGE_RECT_CHUNK = 500
+PAGE_RECT_UI_CHUNK = 100   # when no file/snapshot exists, measured on the UI thread
+
 
 # ─────────────────────────────────────────────
 # Helper: character-level text wrapping
@@ -376,10 +519,90 @@ class SnippetOCRWorker(QThread):
             print("Snippet OCR failed:", e)
             self.finished_ocr.emit("")
 
+class PageRectWorker(QThread):
+    """Measures the page rects of a large document from its file or snapshot.
+
+    Works on its own parsed copy, so the UI document is never touched off the
+    UI thread. Chunks go out in page order starting at `start`.
+    """
+    chunk_ready = pyqtSignal(int, list)  # first page index, rects
+
+    def __init__(self, file_path: str, page_count: int, start: int = 0,
+                 snapshot: Optional[DocumentSnapshot] = None, parent=None):
+        super().__init__(parent)
+        self._file_path = file_path
+        self._snapshot = snapshot  # reference owned by the worker
+        self._page_count = page_count
+        self._start = start
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        doc = None
+        try:
+            doc = self._snapshot.open() if self._snapshot else fitz.open(self._file_path)
+            count = min(self._page_count, doc.page_count)
+            for start in range(self._start, count, PAGE_RECT_CHUNK):
+                if self._cancelled:
+                    return
+                end = min(start + PAGE_RECT_CHUNK, count)
+                self.chunk_ready.emit(start, [doc[i].rect for i in range(start, end)])
+        except Exception:
+            pass  # the estimated layout stays in place
+        finally:
+            if doc:
+                doc.close()
+            if self._snapshot:
+                self._snapshot.release()
+
+
+class ScrollVelocity:
+    """Smoothed scroll speed from scrollbar positions, in px/s (+ = downward)."""
+
+    def __init__(self, smoothing: float = 0.6, idle_after: float = 0.25):
+        self._smoothing = smoothing
+        self._idle_after = idle_after
+        self._last_t = 0.0
+        self._last_value = 0
+        self._velocity = 0.0
+
+    def add(self, value: int) -> float:
+        now = time.monotonic()
+        dt = now - self._last_t
+        delta = value - self._last_value
+        if dt <= 0 or dt > self._idle_after:
+            # First event of a gesture: direction only, speed builds from the next one
+            self._velocity = math.copysign(1.0, delta) if delta else 0.0
+        else:
+            sample = delta / dt
+            self._velocity += self._smoothing * (sample - self._velocity)
+        self._last_t = now
+        self._last_value = value
+        return self._velocity
+
+
 # ─────────────────────────────────────────────
 # Core PDF Widget
 # ─────────────────────────────────────────────
 
+@dataclass
+class _ParkedView:
+    """What PDFViewWidget keeps for a background tab (see set_document)."""
+    doc: fitz.Document
+    render_cache: OrderedDict
+    preview_cache: OrderedDict
+    page_rects: list
+    rects_exact: bool
+    snapshot: Optional[DocumentSnapshot]
+
+    def release(self):
+        if self.snapshot:
+            self.snapshot.release()
+            self.snapshot = None
+
+
 class PDFViewWidget(QWidget):
     """
     Renders a PDF document using PyMuPDF, continuous scroll, with full
@@ -390,6 +613,7 @@ class PDFViewWidget(QWidget):
     page_changed = pyqtSignal(int)
     zoom_changed = pyqtSignal(float)   # (중복 선언 제거됨)
     doc_modified = pyqtSignal()
+    content_removed = pyqtSignal()  # edit erased existing content (needs full-rewrite save)
     text_placed = pyqtSignal()
     text_copied = pyqtSignal(int)  # char count copied to clipboard
     status_message_requested = pyqtSignal(str)
@@ -416,18 +640,37 @@ class PDFViewWidget(QWidget):
 
         self._doc: Optional[fitz.Document] = None
         self._file_path: str = ""
-        self._doc_bytes_snapshot: Optional[bytes] = None  # 수정 후 렌더링용 스냅샷
+        self._snapshot: Optional[DocumentSnapshot] = None  # 수정 후 워커용 스냅샷
+        self._loading_preview: Optional[QImage] = None  # 여는 중인 문서의 첫 페이지
+        self._read_only: bool = False  # 저장 중: 스크롤·줌·텍스트 선택만 허용
         self._zoom: float = 1.0
-        self._page_offsets: list[int] = []   # y-pixel offset of each page top
-        self._page_heights: list[int] = []   # rendered height of each page
+        self._page_offsets = array("l")   # y-pixel offset of each page top
+        self._page_heights = array("l")   # rendered height of each page
         self._page_rects: list[fitz.Rect] = [] # cache of original page rects for fast zoom logic
+        # Page sizes in points, mirrored from _page_rects: a zoom change is a
+        # C-level multiply + running sum over these instead of a Python loop
+        self._page_w_pts = array("d")
+        self._page_h_pts = array("d")
+        # 대용량 문서: 추정 레이아웃으로 먼저 표시하고 실제 크기는 청크 단위로 채운다
+        self._rect_worker: Optional[PageRectWorker] = None
+        self._rect_ui_next = -1   # next page measured on the UI thread (-1: idle)
+        self._rect_timer = QTimer(self)
+        self._rect_timer.setSingleShot(True)
+        self._rect_timer.timeout.connect(self._measure_rects_chunk)
 
         # Async rendering state
         self._render_cache: OrderedDict[tuple[int, float], QPixmap] = OrderedDict()
-        self._low_res_cache: OrderedDict[tuple[int, float], QPixmap] = OrderedDict()
+        self._preview_cache: OrderedDict[int, QPixmap] = OrderedDict()  # page → preview, any zoom
         self._pending_renders: set[tuple[int, float]] = set()
+        self._cache_key: str = ""   # tab whose document is shown (see set_document)
+        self._doc_gen: int = 0      # bumped per set_document; stale render results are dropped
         self._page_render_gen: dict[int, int] = {}  # page_index → generation counter
         self._thread_pool = QThreadPool.globalInstance()
+        # Pages the scroll prefetch still wants (None: no restriction); queued
+        # renders outside it are skipped when a pool thread picks them up
+        self._prefetch_window: Optional[tuple[int, int]] = None
+        # What _get_page_pixmap could hand to paint (read by the perf overlay)
+        self._pixmap_lookups = {"exact": 0, "scaled": 0, "preview": 0, "blank": 0}
         # Optimize thread pool
         self._thread_pool.setMaxThreadCount(8)  # Increase count for background queueing
 
@@ -457,6 +700,8 @@ class PDFViewWidget(QWidget):
 
         # Overlay stamps (in-memory, burned on save)
         self._overlay_stamps: list[dict] = []  # {page, rect, path, id}
+        # Burned stamp images: one embedded xref per image file and document
+        self._stamp_images = StampImageCache()
 
         # Inline text editing
         self._inline_edit_widget: Optional[QWidget] = None
@@ -520,49 +765,203 @@ class PDFViewWidget(QWidget):
         return self._doc
 
     def set_document(self, doc: Optional[fitz.Document], file_path: str = "",
-                     keep_snapshot: bool = False):
+                     keep_snapshot: bool = False, page_rects: Optional[list] = None,
+                     cache_key: str = ""):
+        """`page_rects` — page sizes already measured off the UI thread (see
+        DocumentOpenWorker); measured here when omitted.
+
+        `cache_key` identifies the tab: switching to another key parks this
+        tab's renders, page sizes and snapshot in tab_cache() and picks up
+        whatever was parked for the new one. The same key again means the
+        document changed, and everything is rebuilt.
+        """
+        switching = cache_key != self._cache_key
+        if switching:
+            self._park_view_cache()
         self._doc = doc
         self._file_path = file_path
+        self._cache_key = cache_key
+        self._loading_preview = None
         if not keep_snapshot:
-            self._doc_bytes_snapshot = None  # 새 문서 로드 시 스냅샷 초기화
+            self._set_snapshot(None)  # 새 문서 로드 시 스냅샷 초기화
         self._render_cache.clear()
-        self._low_res_cache.clear()
+        self._preview_cache.clear()
+        self._pending_renders.clear()
+        self._doc_gen += 1  # renders still in flight belong to the previous document
         self._selected_annot = None
         self._selected_page = -1
         self._overlay_stamps.clear()
         self._search_rects.clear()
         self._page_rects.clear()
-        
+        self._stop_rect_measurement()
+
+        parked = tab_cache().take("viewer", cache_key) if switching and cache_key else None
+        if parked is not None:
+            if doc is not None and parked.doc is doc and len(parked.page_rects) == doc.page_count:
+                self._render_cache = parked.render_cache
+                self._preview_cache = parked.preview_cache
+                if page_rects is None and parked.rects_exact:
+                    page_rects = parked.page_rects
+                if not keep_snapshot:
+                    self._set_snapshot(parked.snapshot)
+                    parked.snapshot = None
+            if parked.snapshot:
+                parked.snapshot.release()
+
         if self._doc:
-            for i in range(self._doc.page_count):
-                self._page_rects.append(self._doc[i].rect)
+            count = self._doc.page_count
+            if page_rects is not None and len(page_rects) == count:
+                self._page_rects.extend(page_rects)
+            elif count < LAZY_PAGE_RECTS_MIN:
+                for i in range(count):
+                    self._page_rects.append(self._doc[i].rect)
+            else:
+                # Loading every page object here would block for seconds:
+                # lay out with the first page's size and correct it later.
+                first = self._doc[0].rect
+                self._page_rects.extend([first] * count)
+                self._start_rect_measurement()
+        self._page_w_pts = array("d", [r.width for r in self._page_rects])
+        self._page_h_pts = array("d", [r.height for r in self._page_rects])
 
         self._recalculate_layout()
         self.update()
 
-    def _recalculate_layout(self):
-        """Recalculate page positions based on zoom."""
-        self._page_offsets.clear()
-        self._page_heights.clear()
+    def _park_view_cache(self):
+        """Hand this tab's renders (and snapshot reference) to tab_cache()."""
+        if not self._doc or not self._cache_key:
+            return
+        parked = _ParkedView(
+            doc=self._doc,
+            render_cache=self._render_cache,
+            preview_cache=self._preview_cache,
+            page_rects=list(self._page_rects),
+            rects_exact=self._rect_worker is None and self._rect_ui_next < 0,
+            snapshot=self._snapshot,
+        )
+        nbytes = sum(image_bytes(p) for p in self._render_cache.values())
+        nbytes += sum(image_bytes(p) for p in self._preview_cache.values())
+        self._render_cache = OrderedDict()
+        self._preview_cache = OrderedDict()
+        self._snapshot = None  # the reference moves with the parked entry
+        tab_cache().park("viewer", self._cache_key, parked, nbytes, on_evict=_ParkedView.release)
+
+    # ── Lazy page rects ───────────────────────
+
+    def _start_rect_measurement(self, start: int = 1):
+        count = len(self._page_rects)
+        if self._snapshot:
+            source = dict(snapshot=self._snapshot.acquire())
+        elif self._doc_matches_file():
+            source = dict(snapshot=None)
+        else:
+            # No immutable copy of this state yet: small chunks between events
+            # (moves to a worker once a snapshot is set, see _set_snapshot)
+            self._rect_ui_next = start
+            self._rect_timer.start(0)
+            return
+        worker = PageRectWorker(self._file_path, count, start, parent=self, **source)
+        worker.chunk_ready.connect(
+            lambda start, rects, w=worker: self._apply_page_rects(w, start, rects))
+        worker.finished.connect(worker.deleteLater)
+        self._rect_worker = worker
+        worker.start()
+
+    def _doc_matches_file(self) -> bool:
+        """True when the document is the unchanged content of _file_path — not
+        e.g. a tab reopened from snapshot bytes that still names its file."""
+        name = self._doc.name if self._doc else None
+        if not name or not self._file_path or self._doc.is_dirty:
+            return False
+        try:
+            return os.path.samefile(name, self._file_path)
+        except OSError:
+            return False
+
+    def _stop_rect_measurement(self):
+        if self._rect_worker:
+            self._rect_worker.cancel()  # deleted when its run() returns
+            self._rect_worker = None
+        self._rect_ui_next = -1
+        self._rect_timer.stop()
+
+    def _measure_rects_chunk(self):
+        start = self._rect_ui_next
+        if not self._doc or start < 0:
+            return
+        end = min(start + PAGE_RECT_UI_CHUNK, len(self._page_rects), self._doc.page_count)
+        self._apply_page_rects(None, start, [self._doc[i].rect for i in range(start, end)])
+        if end < len(self._page_rects):
+            self._rect_ui_next = end
+            self._rect_timer.start(0)
+        else:
+            self._rect_ui_next = -1
+
+    def _apply_page_rects(self, worker: Optional[PageRectWorker], start: int, rects: list):
+        """Replace estimated rects with measured ones, keeping the viewport anchored."""
+        if worker is not self._rect_worker or start + len(rects) > len(self._page_rects):
+            return  # document changed since the measurement started
+        changed = [i for i, r in enumerate(rects, start) if r != self._page_rects[i]]
+        if not changed:
+            return
+        self._page_rects[start:start + len(rects)] = rects
+        self._page_w_pts[start:start + len(rects)] = array("d", [r.width for r in rects])
+        self._page_h_pts[start:start + len(rects)] = array("d", [r.height for r in rects])
+
+        # Anchor: the page at the top of the viewport and how far into it we are
+        vbar = self._vertical_scrollbar()
+        anchor, frac = -1, 0.0
+        if vbar and self._page_offsets:
+            top = vbar.value()
+            anchor = self.page_at_y(top)
+            frac = (top - self._page_offsets[anchor]) / max(1, self._page_heights[anchor])
+
+        self._recalculate_layout(changed[0])
+        # Cached renders of resized pages have the wrong size
+        for key in [k for k in self._render_cache if start <= k[0] < start + len(rects)]:
+            del self._render_cache[key]
+        for i in changed:
+            self._preview_cache.pop(i, None)
+
+        if anchor >= 0 and anchor >= changed[0]:
+            y = self._page_offsets[anchor] + int(frac * self._page_heights[anchor])
+            vbar.setValue(y)
+            QTimer.singleShot(0, lambda: vbar.setValue(y))  # after the range update
+        self.update()
+
+    def _vertical_scrollbar(self):
+        parent = self.parentWidget()
+        scroll_area = parent.parentWidget() if parent else None
+        if scroll_area and hasattr(scroll_area, "verticalScrollBar"):
+            return scroll_area.verticalScrollBar()
+        return None
+
+    def _recalculate_layout(self, start: int = 0):
+        """Recalculate page positions based on zoom (pages before `start` keep theirs)."""
+        self._prefetch_window = None  # page positions move; the next scroll sets it again
+        start = min(start, len(self._page_offsets))
+        del self._page_offsets[start:]
+        del self._page_heights[start:]
         if not self._doc:
             self.setMinimumSize(0, 0)
             return
-        y = PAGE_GAP
-        max_w = 0
+        y = self._page_offsets[-1] + self._page_heights[-1] + PAGE_GAP if start else PAGE_GAP
         if not self._page_rects:
             return
 
-        page_count = len(self._page_rects)
-        for i in range(page_count):
-            rect = self._page_rects[i]
-            w = int(rect.width * self._zoom)
-            h = int(rect.height * self._zoom)
-            self._page_offsets.append(y)
-            self._page_heights.append(h)
-            y += h + PAGE_GAP
-            max_w = max(max_w, w)
-
-        total_h = y
+        # heights = int(h * zoom); offsets = running sum of height + gap from y
+        heights = array("l", map(int, map(float(self._zoom).__mul__, self._page_h_pts[start:])))
+        if heights:
+            self._page_heights.extend(heights)
+            self._page_offsets.extend(
+                accumulate(map(PAGE_GAP.__add__, heights[:-1]), initial=y))
+        self._update_minimum_size()
+
+    def _update_minimum_size(self):
+        if not self._page_offsets:
+            return
+        max_w = int(max(self._page_w_pts) * self._zoom)
+        total_h = self._page_offsets[-1] + self._page_heights[-1] + PAGE_GAP
         # Center pages horizontally
         widget_w = max(max_w + 80, self.parent().width() if self.parent() else 800)
         self.setMinimumSize(widget_w, total_h)
@@ -617,6 +1016,7 @@ class PDFViewWidget(QWidget):
         """Called when user stops scrolling (150 ms debounce)."""
         if abs(self._zoom_target - self._zoom) > 0.001:
             self._lerp_timer.stop()
+            perf_tracer().animation_end()
 
             # The lerp animation has been co-animating the scroll bar using the
             # gesture-origin formula.  Compute the exact final scroll with the
@@ -671,10 +1071,13 @@ class PDFViewWidget(QWidget):
         스크롤바를 여기서 건드리지 않아도 시각적으로 커서 앵커 줌이 작동함.
         커밋 시(_on_zoom_finished)에만 스크롤바를 정확히 보정함.
         """
+        tracer = perf_tracer()
+        tracer.animation_tick(self._lerp_timer.interval() / 1000)
         diff = self._zoom_target - self._visual_zoom
         if abs(diff) < 0.0005:
             self._visual_zoom = self._zoom_target
             self._lerp_timer.stop()
+            tracer.animation_end()
         else:
             self._visual_zoom += diff * 0.22   # 0.35→0.22: 더 부드러운 ease-out
 
@@ -697,6 +1100,7 @@ class PDFViewWidget(QWidget):
         # Check exact cache (LRU access update)
         if key in self._render_cache:
             self._render_cache.move_to_end(key)
+            self._pixmap_lookups["exact"] += 1
             return self._render_cache[key]
 
         # If we reach here, we don't have the exact resolution pixmap yet.
@@ -704,81 +1108,155 @@ class PDFViewWidget(QWidget):
         if key not in self._pending_renders:
             self._start_render_task(page_index, key)
 
-        # Check for a low-res preview image for quick display
-        if key in self._low_res_cache:
-            return self._low_res_cache[key]
-
-        # Only show a blurry scaled fallback from another zoom level during active zoom transitions.
-        if self._is_zooming:
-            candidates = [(k, v) for k, v in self._render_cache.items() if k[0] == page_index]
-            if candidates:
-                _, best_pixmap = candidates[-1]
-                return best_pixmap
-
-        return None
+        # Fallbacks, scaled by QPainter: the same page rendered at another
+        # zoom (largest first — sharper than the preview), then the preview
+        other = self._best_other_zoom(page_index)
+        if other is not None:
+            self._pixmap_lookups["scaled"] += 1
+            return other
+        preview = self._preview_cache.get(page_index)
+        self._pixmap_lookups["preview" if preview is not None else "blank"] += 1
+        return preview
+
+    def _best_other_zoom(self, page_index: int) -> Optional[QPixmap]:
+        best = None
+        for k, pixmap in self._render_cache.items():
+            if k[0] == page_index and (best is None or pixmap.width() > best.width()):
+                best = pixmap
+        return best
 
     def _start_render_task(self, page_index: int, key: tuple[int, float]):
-        if not self._doc or (not self._file_path and not self._doc_bytes_snapshot):
+        if not self._doc or (not self._file_path and not self._snapshot):
             return
 
         self._pending_renders.add(key)
 
-        # Create worker — 수정된 doc이 있으면 bytes 스냅샷 사용, 없으면 원본 파일
-        gen = self._page_render_gen.get(page_index, 0)
+        # Create worker — 수정된 doc이 있으면 스냅샷 사용, 없으면 원본 파일
+        gen = (self._doc_gen, self._page_render_gen.get(page_index, 0))
         worker = RenderWorker(
             self._file_path, page_index, self._zoom,
             is_valid_cb=lambda z=self._zoom: self._is_render_valid(page_index, z),
-            doc_bytes=self._doc_bytes_snapshot,
+            snapshot=self._snapshot.acquire() if self._snapshot else None,
+            want_preview=(page_index not in self._preview_cache
+                          and self._best_other_zoom(page_index) is None),
         )
         # Signal emits QImage, is_high_res
         worker.signals.finished.connect(lambda img, is_high_res, idx=page_index, k=key, g=gen: self._on_render_finished(img, is_high_res, idx, k, g))
+        worker.signals.skipped.connect(lambda k=key, g=gen: self._on_render_skipped(k, g))
         self._thread_pool.start(worker)
 
-    def _on_render_finished(self, image: QImage, is_high_res: bool, page_index: int, key: tuple[int, float], gen: int = 0):
+    def _on_render_skipped(self, key: tuple[int, float], gen: tuple[int, int]):
+        if gen[0] == self._doc_gen:
+            self._pending_renders.discard(key)  # may be requested again later
+
+    def _on_render_finished(self, image: QImage, is_high_res: bool, page_index: int,
+                            key: tuple[int, float], gen: tuple[int, int] = (0, 0)):
         """Callback from background thread (via signal)."""
+        # Rendered from a document that has since been replaced (tab switch/reload)
+        if gen[0] != self._doc_gen:
+            return
         if is_high_res and key in self._pending_renders:
             self._pending_renders.remove(key)
 
+        # Discard stale renders: page was invalidated (edited) after this render started.
+        if gen[1] != self._page_render_gen.get(page_index, 0) or image.isNull():
+            return
+
+        if not is_high_res:
+            # Previews do not depend on zoom: keep it even if the zoom moved on
+            self._store_preview(page_index, QPixmap.fromImage(image))
+            self.update()
+            return
+
         # Discard stale renders: zoom changed while this worker was rendering.
         current_key = (page_index, round(self._zoom, 3))
         if key != current_key:
             return
 
-        # Discard stale renders: page was invalidated (edited) after this render started.
-        if gen != self._page_render_gen.get(page_index, 0):
-            return
+        # Convert QImage to QPixmap on the main thread
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(image.devicePixelRatio())
+        self._render_cache[key] = pixmap
+        self._render_cache.move_to_end(key)
 
-        if not image.isNull():
-            # Convert QImage to QPixmap on the main thread
-            pixmap = QPixmap.fromImage(image)
-            pixmap.setDevicePixelRatio(image.devicePixelRatio())
+        # Enforce cache size limit (30 pages ≈ 150–450MB at zoom 1.0 DPR 2.0)
+        while len(self._render_cache) > 30:
+            self._render_cache.popitem(last=False)
 
-            if is_high_res:
-                self._render_cache[key] = pixmap
-                self._render_cache.move_to_end(key)
-                
-                # We can remove the low-res version once high-res is ready
-                if key in self._low_res_cache:
-                    del self._low_res_cache[key]
+        # No preview yet (this render skipped it): derive one by downscaling,
+        # so later zoom levels never rasterize a preview for this page
+        if page_index not in self._preview_cache and page_index < len(self._page_rects):
+            w = max(1, int(self._page_rects[page_index].width * PREVIEW_SCALE))
+            self._store_preview(page_index, QPixmap.fromImage(image.scaledToWidth(
+                w, Qt.TransformationMode.SmoothTransformation)))
 
-                # Enforce cache size limit (30 pages ≈ 150–450MB at zoom 1.0 DPR 2.0)
-                while len(self._render_cache) > 30:
-                    self._render_cache.popitem(last=False)
-            else:
-                self._low_res_cache[key] = pixmap
-                while len(self._low_res_cache) > 150:
-                    self._low_res_cache.popitem(last=False)
+        # Redraw
+        self.update()
 
-            # Redraw
-            self.update()
+    def _store_preview(self, page_index: int, pixmap: QPixmap):
+        self._preview_cache[page_index] = pixmap
+        self._preview_cache.move_to_end(page_index)
+        while len(self._preview_cache) > PREVIEW_CACHE_PAGES:
+            self._preview_cache.popitem(last=False)
 
     def _is_render_valid(self, page_index: int, zoom: float) -> bool:
         """Checks if a background render is still valid for the current view state."""
-        return abs(self._zoom - zoom) < 0.001
+        if abs(self._zoom - zoom) >= 0.001:
+            return False
+        window = self._prefetch_window
+        return window is None or window[0] <= page_index <= window[1]
 
     def paintEvent(self, event):
+        tracer = perf_tracer()
+        if not tracer.enabled:
+            self._paint(event)
+            return
+        t0 = time.perf_counter()
+        self._paint(event)
+        tracer.paint(t0, time.perf_counter() - t0, self._lerp_timer.interval() / 1000,
+                     {"animating": self._lerp_timer.isActive(),
+                      "zoom": round(self._visual_zoom, 3)})
+
+    def perf_sample(self) -> dict[str, dict]:
+        """Counter tracks for the perf overlay / trace (see perf_trace.PerfOverlay)."""
+        lookups = self._pixmap_lookups
+        total = sum(lookups.values()) or 1
+        dl = display_lists()
+        dl_total = (dl.hits + dl.misses) or 1
+        mb = 1024 * 1024
+        pixmap_bytes = sum(image_bytes(p) for p in self._render_cache.values())
+        preview_bytes = sum(image_bytes(p) for p in self._preview_cache.values())
+        return {
+            "렌더 대기열": {
+                "pending": len(self._pending_renders),
+                "active": self._thread_pool.activeThreadCount(),
+            },
+            "캐시 적중 %": {
+                "exact": round(100 * lookups["exact"] / total, 1),
+                "scaled": round(100 * lookups["scaled"] / total, 1),
+                "preview": round(100 * lookups["preview"] / total, 1),
+                "displaylist": round(100 * dl.hits / dl_total, 1),
+            },
+            "메모리 MB": {
+                "renders": round(pixmap_bytes / mb, 1),
+                "previews": round(preview_bytes / mb, 1),
+                "parked": round(tab_cache().total_bytes / mb, 1),
+                "displaylists": round(dl.total_bytes / mb, 1),
+            },
+        }
+
+    def reset_perf_counters(self):
+        for k in self._pixmap_lookups:
+            self._pixmap_lookups[k] = 0
+        dl = display_lists()
+        dl.hits = dl.misses = 0
+
+    def _paint(self, event):
         if not self._doc:
-            self._draw_drop_zone()
+            if self._loading_preview is not None:
+                self._draw_loading_preview()
+            else:
+                self._draw_drop_zone()
             return
 
         try:
@@ -920,6 +1398,21 @@ class PDFViewWidget(QWidget):
         painter.fillRect(self.rect(), QColor("#444"))
         painter.end()
 
+    def show_loading_preview(self, image: Optional[QImage]):
+        """Show the first page of a document that is still opening (None clears it)."""
+        self._loading_preview = image
+        self.update()
+
+    def _draw_loading_preview(self):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.fillRect(self.rect(), QColor("#444444"))
+        img = self._loading_preview
+        w, h = int(img.width() * self._zoom), int(img.height() * self._zoom)
+        x = max(0, (self.width() - w) // 2)
+        painter.drawImage(QRectF(x, PAGE_GAP, w, h), img)
+        painter.end()
+
     def _draw_overlay_stamps(self, painter: QPainter, page_index: int, px: int, py: int):
         for s in self._overlay_stamps:
             if s["page"] != page_index:
@@ -976,7 +1469,8 @@ class PDFViewWidget(QWidget):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._recalculate_layout()
+        # Offsets depend on zoom only; a resize just re-fits the width
+        self._update_minimum_size()
 
     def page_at_y(self, y: int) -> int:
         """Returns the page index at the given y position (binary search, O(log n))."""
@@ -1102,6 +1596,12 @@ class PDFViewWidget(QWidget):
             self._text_sel_words = []
             self.update()
 
+        if self._read_only:
+            if event.button() == Qt.MouseButton.LeftButton:
+                self._start_text_selection(pos)
+            self.update()
+            return
+
         if self.mode == self.MODE_TEXT_PLACEMENT:
             self._place_text_at(pos)
             return
@@ -1197,23 +1697,38 @@ class PDFViewWidget(QWidget):
                 s["selected"] = False
 
             # Start text selection drag
-            if event.button() == Qt.MouseButton.LeftButton and self._doc:
-                page_index = self.page_at_y(int(pos.y()))
-                if 0 <= page_index < self._doc.page_count:
-                    self._text_sel_start = pos
-                    self._text_sel_page = page_index
-                    self._text_sel_rects = []
-                    self._text_sel_text = ""
-                    # Cache words for the page (x0, y0, x1, y1, word, block, line, word_no)
-                    try:
-                        self._text_sel_words = self._doc[page_index].get_text("words")
-                    except Exception:
-                        self._text_sel_words = []
+            if event.button() == Qt.MouseButton.LeftButton:
+                self._start_text_selection(pos)
 
             self.update()
 
+    def _start_text_selection(self, pos: QPointF):
+        if not self._doc:
+            return
+        page_index = self.page_at_y(int(pos.y()))
+        if 0 <= page_index < self._doc.page_count:
+            self._text_sel_start = pos
+            self._text_sel_page = page_index
+            self._text_sel_rects = []
+            self._text_sel_text = ""
+            # Cache words for the page (x0, y0, x1, y1, word, block, line, word_no)
+            try:
+                self._text_sel_words = self._doc[page_index].get_text("words")
+            except Exception:
+                self._text_sel_words = []
+
+    def set_read_only(self, read_only: bool):
+        """Block editing interactions (used while a save serializes the document)."""
+        self._read_only = read_only
+        self._drag_annot = None
+        self._is_resizing = False
+        if read_only:
+            self.setCursor(Qt.CursorShape.ArrowCursor)
+
     def mouseDoubleClickEvent(self, event: QMouseEvent):
         """Handle double-click for inline text editing."""
+        if self._read_only:
+            return
         pos = QPointF(event.position())
         hit = self._hit_test_annot(pos)
         if hit and hit.match_type == "annot" and hit.corner == AnnotHit.BODY:
@@ -1226,18 +1741,21 @@ class PDFViewWidget(QWidget):
     def mouseMoveEvent(self, event: QMouseEvent):
         pos = QPointF(event.position())
 
-        if self.mode == self.MODE_TEXT_PLACEMENT:
+        # Edit modes stay armed while read-only but ignore the pointer
+        editing = not self._read_only
+
+        if editing and self.mode == self.MODE_TEXT_PLACEMENT:
             self.setCursor(Qt.CursorShape.CrossCursor)
             return
             
-        if self.mode == self.MODE_CROP:
+        if editing and self.mode == self.MODE_CROP:
             self.setCursor(Qt.CursorShape.CrossCursor)
             if self._crop_start_pos:
                 self._crop_current_pos = pos
                 self.update()
             return
 
-        if self.mode == self.MODE_TEXT_EDIT:
+        if editing and self.mode == self.MODE_TEXT_EDIT:
             self._handle_text_edit_hover(pos)
             return
 
@@ -1513,7 +2031,7 @@ class PDFViewWidget(QWidget):
                 else:
                     self._drag_annot.update()
             self._invalidate_page(self._drag_page)
-            self._snapshot_doc_bytes()
+            self._refresh_snapshot()
             self.doc_modified.emit()
             self._drag_annot = None
             self._drag_annot_pixmap = None
@@ -1547,27 +2065,45 @@ class PDFViewWidget(QWidget):
             pass
         return info
 
-    def _snapshot_doc_bytes(self):
-        """doc이 수정된 후 호출 — RenderWorker가 최신 내용을 렌더링하도록 bytes 스냅샷 갱신."""
+    def _refresh_snapshot(self):
+        """doc이 수정된 후 호출 — 워커들이 최신 내용을 읽도록 새 스냅샷 버전을 발행."""
         if self._doc:
+            mark_edited(self._doc)
             try:
-                self._doc_bytes_snapshot = self._doc.tobytes(deflate=True)
+                self._set_snapshot(snapshot_service().publish(self._doc))
             except Exception as e:
-                _log.error(f"_snapshot_doc_bytes FAILED: {e}")
-                # Fallback: try without deflate
-                try:
-                    self._doc_bytes_snapshot = self._doc.tobytes()
-                except Exception as e2:
-                    _log.error(f"_snapshot_doc_bytes fallback ALSO FAILED: {e2}")
+                _log.error(f"_refresh_snapshot FAILED: {e}")
+
+    def _ensure_snapshot(self):
+        """Give workers a snapshot of the document as it is now; publishes only
+        if it was edited since the newest snapshot (e.g. while in the background)."""
+        if not self._doc:
+            return
+        if self._snapshot and self._snapshot.state == edit_state(self._doc):
+            return
+        try:
+            self._set_snapshot(snapshot_service().current_or_publish(self._doc))
+        except Exception as e:
+            _log.error(f"_ensure_snapshot FAILED: {e}")
+
+    def _set_snapshot(self, snapshot: Optional[DocumentSnapshot]):
+        """Adopt `snapshot` (already holding a reference) and drop ours on the old one."""
+        old, self._snapshot = self._snapshot, snapshot
+        if old:
+            old.release()
+        if snapshot and self._rect_ui_next > 0:
+            # Page sizes were being measured on the UI thread for lack of a
+            # snapshot: continue from it on a worker
+            start = self._rect_ui_next
+            self._stop_rect_measurement()
+            self._start_rect_measurement(start)
 
     def _invalidate_page(self, page_index: int):
         """Remove cached render for a page (to force re-render)."""
         keys_to_remove = [k for k in self._render_cache if k[0] == page_index]
         for k in keys_to_remove:
             del self._render_cache[k]
-        keys_low = [k for k in self._low_res_cache if k[0] == page_index]
-        for k in keys_low:
-            del self._low_res_cache[k]
+        self._preview_cache.pop(page_index, None)
         # Increment generation so in-flight renders with old data are discarded
         self._page_render_gen[page_index] = self._page_render_gen.get(page_index, 0) + 1
         # Clear pending flags so new renders can be started
@@ -1575,15 +2111,49 @@ class PDFViewWidget(QWidget):
         for k in keys_pending:
             self._pending_renders.discard(k)
 
-    def _prerender_near_pages(self, center_page: int, lookahead: int = 10, lookbehind: int = 4):
-        """Pre-render pages near center_page so they're ready before scrolling to them."""
-        if not self._doc:
+    def prefetch_for_scroll(self, velocity: float):
+        """Pre-render the pages the viewport is heading into.
+
+        The distance ahead follows the scroll speed (what is reached within
+        PREFETCH_HORIZON_S); slow reading only looks at the next pages. New
+        tasks are limited to what the render pool can take right now, and
+        queued ones that fall outside the new window are skipped.
+        """
+        vbar = self._vertical_scrollbar()
+        if not self._doc or not self._page_offsets or vbar is None:
             return
         page_count = len(self._page_offsets)
-        for i in range(max(0, center_page - lookbehind), min(page_count, center_page + lookahead + 1)):
-            key = (i, round(self._zoom, 3))
+        top = vbar.value()
+        bottom = top + vbar.pageStep()
+        first, last = self.page_at_y(top), self.page_at_y(bottom)
+
+        down = velocity >= 0
+        speed = abs(velocity)
+        if speed < PREFETCH_SLOW_PX_S:
+            ahead = PREFETCH_READING_AHEAD
+        else:
+            reach = int(speed * PREFETCH_HORIZON_S)
+            edge = last if down else first
+            target = self.page_at_y(bottom + reach) if down else self.page_at_y(top - reach)
+            ahead = max(PREFETCH_READING_AHEAD, min(PREFETCH_MAX_PAGES, abs(target - edge)))
+
+        if down:
+            lo, hi = max(0, first - PREFETCH_BEHIND), min(page_count - 1, last + ahead)
+            order = list(range(first, hi + 1)) + list(range(first - 1, lo - 1, -1))
+        else:
+            lo, hi = max(0, first - ahead), min(page_count - 1, last + PREFETCH_BEHIND)
+            order = list(range(last, lo - 1, -1)) + list(range(last + 1, hi + 1))
+        self._prefetch_window = (lo, hi)
+
+        capacity = self._thread_pool.maxThreadCount() * 2 - len(self._pending_renders)
+        zoom_key = round(self._zoom, 3)
+        for i in order:
+            if capacity <= 0:
+                break
+            key = (i, zoom_key)
             if key not in self._render_cache and key not in self._pending_renders:
                 self._start_render_task(i, key)
+                capacity -= 1
 
     def wheelEvent(self, event: QWheelEvent):
         if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
@@ -1718,7 +2288,7 @@ class PDFViewWidget(QWidget):
         self._selected_annot = annot
         self._selected_page = page_index
         self.exit_text_placement_mode()
-        self._snapshot_doc_bytes()
+        self._refresh_snapshot()
         self.doc_modified.emit()
         self.text_placed.emit()
         self.update()
@@ -1767,7 +2337,7 @@ class PDFViewWidget(QWidget):
         self._invalidate_page(page_index)
         self._selected_annot = annot
         self._selected_page = page_index
-        self._snapshot_doc_bytes()
+        self._refresh_snapshot()
         self.doc_modified.emit()
         self.update()
 
@@ -1828,7 +2398,7 @@ class PDFViewWidget(QWidget):
             annot.update()
             self._annot_raw_text[annot.xref] = new_text
             self._invalidate_page(page_index)
-            self._snapshot_doc_bytes()
+            self._refresh_snapshot()
             self.doc_modified.emit()
 
         widget.hide()
@@ -2310,17 +2880,19 @@ class PDFViewWidget(QWidget):
             import traceback
             _log.error(f"EXCEPTION: {e}\n{traceback.format_exc()}")
 
-        # 수정된 doc 상태를 bytes로 스냅샷 → RenderWorker가 최신 내용 렌더링
-        old_snapshot_id = id(self._doc_bytes_snapshot)
-        self._snapshot_doc_bytes()
-        new_snapshot_id = id(self._doc_bytes_snapshot)
-        _log.info(f"snapshot changed={old_snapshot_id != new_snapshot_id}  "
-                  f"has_bytes={self._doc_bytes_snapshot is not None}  edit_ok={edit_ok}")
+        # 수정된 doc 상태를 스냅샷 → RenderWorker가 최신 내용 렌더링
+        old_version = self._snapshot.version if self._snapshot else 0
+        self._refresh_snapshot()
+        new_version = self._snapshot.version if self._snapshot else 0
+        _log.info(f"snapshot changed={old_version != new_version}  "
+                  f"version={new_version}  edit_ok={edit_ok}")
 
         # Invalidate caches so the page re-renders
         if page_index in self._text_edit_lines_cache:
             del self._text_edit_lines_cache[page_index]
         self._invalidate_page(page_index)
+        # The redacted original text would survive in an appended update
+        self.content_removed.emit()
         self.doc_modified.emit()
         self.update()
 
@@ -3120,7 +3692,7 @@ class PDFViewWidget(QWidget):
             "path": image_path,
         })
 
-        self._snapshot_doc_bytes()
+        self._refresh_snapshot()
         self.doc_modified.emit()
         self.update()
 
@@ -3141,8 +3713,12 @@ class PDFViewWidget(QWidget):
             hit.annot["selected"] = True
             self.update()
 
-            delete_action = menu.addAction("삭제")
             stamp_ref = hit.annot
+            menu.addAction("여러 페이지에 적용...").triggered.connect(
+                lambda: self._repeat_stamp_dialog(stamp_ref)
+            )
+            menu.addSeparator()
+            delete_action = menu.addAction("삭제")
             delete_action.triggered.connect(lambda: self._delete_stamp(stamp_ref))
         else:
             self._selected_annot = hit.annot
@@ -3161,13 +3737,56 @@ class PDFViewWidget(QWidget):
 
         menu.exec(global_pos)
 
+    def _repeat_stamp_dialog(self, stamp: dict):
+        if not self._doc:
+            return
+        n = self._doc.page_count
+        text, ok = QInputDialog.getText(
+            self, "여러 페이지에 직인 적용",
+            f"적용할 페이지 (예: 1-{n}, 3, 5-8):", text=f"1-{n}",
+        )
+        if not ok:
+            return
+        try:
+            parts = parse_page_ranges(text, n)
+        except ValueError as e:
+            QMessageBox.warning(self, "알림", str(e))
+            return
+        pages = sorted({p for part in parts for p in range(part.start, part.end + 1)})
+        self.repeat_stamp(stamp, pages)
+
+    def repeat_stamp(self, stamp: dict, pages: list[int]):
+        """Copy an overlay stamp to the same position on other pages (one edit)."""
+        from uuid import uuid4 as _uuid4
+        taken = {s["page"] for s in self._overlay_stamps
+                 if s["path"] == stamp["path"] and s["rect"] == stamp["rect"]}
+        added = 0
+        for pno in pages:
+            if pno in taken or pno >= self._doc.page_count:
+                continue
+            rect = fitz.Rect(stamp["rect"])
+            pr = self._doc[pno].rect
+            # 작은 페이지에서는 페이지 안쪽으로 밀어 넣는다
+            dx = min(0, pr.x1 - rect.x1) or max(0, pr.x0 - rect.x0)
+            dy = min(0, pr.y1 - rect.y1) or max(0, pr.y0 - rect.y0)
+            self._overlay_stamps.append({
+                "id": str(_uuid4()),
+                "page": pno,
+                "rect": rect + (dx, dy, dx, dy),
+                "path": stamp["path"],
+            })
+            added += 1
+        if added:
+            self.doc_modified.emit()
+            self.update()
+
     def _delete_stamp(self, stamp: dict):
         """Remove an overlay stamp."""
         if stamp in self._overlay_stamps:
             self._overlay_stamps.remove(stamp)
         self._selected_annot = None
         self._selected_page = -1
-        self._snapshot_doc_bytes()
+        self._refresh_snapshot()
         self.doc_modified.emit()
         self.update()
 
@@ -3179,7 +3798,7 @@ class PDFViewWidget(QWidget):
         self._selected_annot = None
         self._selected_page = -1
         self._invalidate_page(page_index)
-        self._snapshot_doc_bytes()
+        self._refresh_snapshot()
         self.doc_modified.emit()
         self.update()
 
@@ -3211,7 +3830,7 @@ class PDFViewWidget(QWidget):
         self._selected_annot = new_annot
         self._selected_page = page_index
         self._invalidate_page(page_index)
-        self._snapshot_doc_bytes()
+        self._refresh_snapshot()
         self.doc_modified.emit()
         self.update()
 
@@ -3252,25 +3871,42 @@ class PDFViewWidget(QWidget):
             return self.page_at_y(viewport_center)
         return 0
 
+    def visible_pages(self) -> list[int]:
+        """Page indices that intersect the viewport (no prerender buffer)."""
+        parent = self.parentWidget()
+        scroll_area = parent.parentWidget() if parent else None
+        from PyQt6.QtWidgets import QScrollArea
+        if not isinstance(scroll_area, QScrollArea) or not self._page_offsets:
+            return []
+        top = scroll_area.verticalScrollBar().value()
+        bottom = top + scroll_area.viewport().height()
+        first = self.page_at_y(top)
+        last = self.page_at_y(bottom)
+        return list(range(first, last + 1))
+
     # ── Overlay Stamp burn-in ─────────────────
 
     def burn_overlay_stamps(self):
         """Burn in-memory stamps into the PDF document."""
         if not self._doc:
             return
+        if self._overlay_stamps:
+            mark_edited(self._doc)
         for s in self._overlay_stamps:
             if s["page"] < self._doc.page_count:
                 page = self._doc[s["page"]]
                 try:
-                    page.insert_image(s["rect"], filename=s["path"])
+                    self._stamp_images.insert(page, s["rect"], s["path"])
                 except Exception:
                     pass
         self._overlay_stamps.clear()
         self._render_cache.clear()
+        self._preview_cache.clear()
         self.update()
 
     def invalidate_all_pages(self):
         self._render_cache.clear()
+        self._preview_cache.clear()
         self.update()
 
 
@@ -3284,6 +3920,7 @@ class PDFScrollView(QScrollArea):
     page_changed = pyqtSignal(int)
     zoom_changed = pyqtSignal(float)
     doc_modified = pyqtSignal()
+    content_removed = pyqtSignal()
     annot_edit_requested = pyqtSignal(object, int)  # (annot, page_index)
 
     def __init__(self, parent=None):
@@ -3299,20 +3936,31 @@ class PDFScrollView(QScrollArea):
         self._pdf_widget.page_changed.connect(self.page_changed)
         self._pdf_widget.zoom_changed.connect(self.zoom_changed)
         self._pdf_widget.doc_modified.connect(self.doc_modified)
+        self._pdf_widget.content_removed.connect(self.content_removed)
         self._pdf_widget.annot_edit_requested.connect(self.annot_edit_requested)
         self._pdf_widget.text_placed.connect(lambda: self.parent().window()._clear_right_panel() if self.parent() and hasattr(self.parent().window(), '_clear_right_panel') else None)
 
-        # Track scroll to update current page
+        # Track scroll to update current page (and how fast it is moving, for prefetch)
+        self._scroll_velocity = ScrollVelocity()
         self.verticalScrollBar().valueChanged.connect(self._on_scroll)
 
         self.setAcceptDrops(True)
 
+        # Frame/cache read-out while a performance trace is recorded
+        self._perf_overlay = PerfOverlay(self._pdf_widget.perf_sample, self)
+
+    def set_perf_overlay(self, active: bool):
+        if active:
+            self._pdf_widget.reset_perf_counters()
+        self._perf_overlay.set_active(active)
+
     @property
     def pdf_widget(self) -> PDFViewWidget:
         return self._pdf_widget
 
-    def set_document(self, doc, file_path: str = ""):
-        self._pdf_widget.set_document(doc, file_path)
+    def set_document(self, doc, file_path: str = "", page_rects: Optional[list] = None,
+                     cache_key: str = ""):
+        self._pdf_widget.set_document(doc, file_path, page_rects=page_rects, cache_key=cache_key)
 
     def set_zoom(self, z: float):
         old_zoom = self._pdf_widget.zoom
@@ -3356,7 +4004,7 @@ class PDFScrollView(QScrollArea):
         visible = self._pdf_widget.visible_page()
         self.page_changed.emit(visible)
         # Pre-render pages about to scroll into view so they're cached before they appear
-        self._pdf_widget._prerender_near_pages(visible)
+        self._pdf_widget.prefetch_for_scroll(self._scroll_velocity.add(value))
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
@@ -0,0 +1,264 @@
+"""
+perf_trace.py — Opt-in frame timing and render statistics
+Records paintEvent durations, zoom-animation frame drops, render spans and
+periodic counters (render queue, cache hits, pixmap memory) while enabled,
+and exports them as Chrome trace JSON (chrome://tracing, ui.perfetto.dev).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import Callable, Optional
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QLabel, QWidget
+
+
+# Events kept while recording (oldest dropped first) — roughly 30 min of busy use
+MAX_TRACE_EVENTS = 200_000
+# Paint durations kept for the overlay's average / maximum
+FRAME_WINDOW = 120
+# Overlay refresh and counter sampling interval
+PERF_SAMPLE_MS = 250
+
+
+# ─────────────────────────────────────────────
+# Tracer
+# ─────────────────────────────────────────────
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_cat", "_args", "_t0")
+
+    def __init__(self, tracer: "PerfTracer", name: str, cat: str, args: dict):
+        self._tracer = tracer
+        self._name = name
+        self._cat = cat
+        self._args = args
+
+    def __enter__(self):
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._tracer.complete(self._name, self._t0, time.perf_counter() - self._t0,
+                              self._cat, self._args)
+        return False
+
+
+class PerfTracer:
+    """
+    In-memory trace of one recording session; does nothing until `start()`.
+
+    Callers check `enabled` (or use `span()`, a no-op context while disabled)
+    so the instrumentation costs one attribute read when nobody is recording.
+    Events may be added from any thread. Times are `time.perf_counter()`
+    seconds; the export converts them to microseconds since `start()`.
+    """
+
+    def __init__(self, max_events: int = MAX_TRACE_EVENTS):
+        self.enabled = False
+        self._events: deque[dict] = deque(maxlen=max_events)
+        self._thread_names: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._t0 = 0.0
+        self._paint_ms: deque[float] = deque(maxlen=FRAME_WINDOW)
+        self.frames = 0
+        self.slow_frames = 0       # paints longer than the animation frame budget
+        self.anim_ticks = 0
+        self.dropped_frames = 0
+        self._last_tick: Optional[float] = None
+
+    def start(self):
+        with self._lock:
+            self._events.clear()
+            self._thread_names.clear()
+        self._paint_ms.clear()
+        self.frames = self.slow_frames = 0
+        self.anim_ticks = self.dropped_frames = 0
+        self._last_tick = None
+        self._t0 = time.perf_counter()
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+
+    @property
+    def event_count(self) -> int:
+        return len(self._events)
+
+    # ── Recording ─────────────────────────────
+
+    def _add(self, event: dict):
+        tid = threading.get_ident()
+        event["tid"] = tid
+        with self._lock:
+            if tid not in self._thread_names:
+                self._thread_names[tid] = threading.current_thread().name
+            self._events.append(event)
+
+    def complete(self, name: str, start: float, duration: float,
+                 cat: str = "app", args: Optional[dict] = None):
+        """A finished span (`start` and `duration` in perf_counter seconds)."""
+        if not self.enabled:
+            return
+        event = {"name": name, "cat": cat, "ph": "X", "ts": start, "dur": duration}
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    def instant(self, name: str, cat: str = "app", args: Optional[dict] = None):
+        if not self.enabled:
+            return
+        event = {"name": name, "cat": cat, "ph": "i", "s": "t", "ts": time.perf_counter()}
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    def counter(self, name: str, values: dict):
+        """One sample of a counter track; `values` maps series name → number."""
+        if not self.enabled:
+            return
+        self._add({"name": name, "cat": "counter", "ph": "C",
+                   "ts": time.perf_counter(), "args": values})
+
+    def span(self, name: str, cat: str = "app", **args):
+        """`with tracer.span("name"):` — records a complete event on exit."""
+        if not self.enabled:
+            return nullcontext()
+        return _Span(self, name, cat, args)
+
+    # ── Frames ────────────────────────────────
+
+    def paint(self, start: float, duration: float, budget: float, args: Optional[dict] = None):
+        """A paintEvent; counted as slow when it alone overruns the frame budget."""
+        if not self.enabled:
+            return
+        self._paint_ms.append(duration * 1000)
+        self.frames += 1
+        if duration > budget:
+            self.slow_frames += 1
+        self.complete("paintEvent", start, duration, "frame", args)
+
+    def animation_tick(self, interval: float):
+        """
+        One timer tick of a running animation with the given frame interval.
+
+        A tick arriving more than 1.5 intervals after the previous one means
+        the event loop was busy; every interval it missed is a dropped frame.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.anim_ticks += 1
+        last, self._last_tick = self._last_tick, now
+        if last is None:
+            return
+        gap = now - last
+        if gap > interval * 1.5:
+            missed = max(1, round(gap / interval) - 1)
+            self.dropped_frames += missed
+            self.complete("dropped frames", last, gap, "frame",
+                          {"missed": missed, "gap_ms": round(gap * 1000, 2)})
+
+    def animation_end(self):
+        """The animation stopped; the pause until the next one is not a drop."""
+        self._last_tick = None
+
+    def paint_stats(self) -> tuple[float, float, float]:
+        """(last, average, maximum) paint duration in ms over the recent window."""
+        if not self._paint_ms:
+            return 0.0, 0.0, 0.0
+        ms = list(self._paint_ms)
+        return ms[-1], sum(ms) / len(ms), max(ms)
+
+    # ── Export ────────────────────────────────
+
+    def export_chrome_trace(self, path: str) -> int:
+        """Write the recorded events as Chrome trace JSON; returns the event count."""
+        with self._lock:
+            events = list(self._events)
+            names = dict(self._thread_names)
+        pid = os.getpid()
+        t0 = self._t0
+        out = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                "args": {"name": "PDF Pro Tool"}}]
+        out.extend({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                    "args": {"name": name}} for tid, name in names.items())
+        for e in events:
+            e = dict(e, pid=pid, ts=round((e["ts"] - t0) * 1e6, 1))
+            if "dur" in e:
+                e["dur"] = round(e["dur"] * 1e6, 1)
+            out.append(e)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": out, "displayTimeUnit": "ms"}, f)
+        os.replace(tmp, path)
+        return len(events)
+
+
+_tracer = PerfTracer()
+
+
+def perf_tracer() -> PerfTracer:
+    """The process-wide PerfTracer."""
+    return _tracer
+
+
+# ─────────────────────────────────────────────
+# Overlay
+# ─────────────────────────────────────────────
+
+class PerfOverlay(QLabel):
+    """
+    Small read-out in the corner of a view while recording.
+
+    Every PERF_SAMPLE_MS it calls `sample()` — which returns counter tracks,
+    {track: {series: value}} — records them in the trace and shows the
+    latest values together with the frame statistics.
+    """
+
+    def __init__(self, sample: Callable[[], dict[str, dict]], parent: QWidget):
+        super().__init__(parent)
+        self._sample = sample
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setStyleSheet(
+            "QLabel { background: rgba(20,24,30,0.82); color: #d8f5d0; border-radius: 6px;"
+            " padding: 6px 8px; font-family: Consolas, monospace; font-size: 11px; }"
+        )
+        self._timer = QTimer(self)
+        self._timer.setInterval(PERF_SAMPLE_MS)
+        self._timer.timeout.connect(self._refresh)
+        self.hide()
+
+    def set_active(self, active: bool):
+        if active:
+            self._refresh()
+            self.move(8, 8)
+            self.show()
+            self.raise_()
+            self._timer.start()
+        else:
+            self._timer.stop()
+            self.hide()
+
+    def _refresh(self):
+        tracer = perf_tracer()
+        tracks = self._sample()
+        for name, values in tracks.items():
+            tracer.counter(name, values)
+        last, avg, peak = tracer.paint_stats()
+        lines = [
+            f"프레임  {last:5.1f} ms  (평균 {avg:.1f} / 최대 {peak:.1f})",
+            f"느린 프레임 {tracer.slow_frames}/{tracer.frames}  "
+            f"줌 드롭 {tracer.dropped_frames} 프레임 ({tracer.anim_ticks} 틱 중)",
+        ]
+        for name, values in tracks.items():
+            lines.append(f"{name}: " + "  ".join(f"{k} {v:g}" for k, v in values.items()))
+        lines.append(f"기록 {tracer.event_count:,} 이벤트")
+        self.setText("\n".join(lines))
+        self.adjustSize()
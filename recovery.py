@@ -0,0 +1,213 @@
+"""
+recovery.py — Autosave recovery journal for unsaved tabs
+Snapshots of modified documents are written in the background so a crash
+never loses more than the last few seconds of edits.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
+
+from models import StampManager
+
+if TYPE_CHECKING:
+    from snapshots import DocumentSnapshot
+
+
+# ─────────────────────────────────────────────
+# Journal Storage
+# ─────────────────────────────────────────────
+
+@dataclass
+class RecoveryEntry:
+    tab_id: str
+    file_path: str      # original file ("" if the document was never saved)
+    title: str
+    current_page: int
+    saved_at: float
+    pid: int            # process that wrote the entry
+    pdf_path: str       # journaled document snapshot
+
+    @property
+    def display_name(self) -> str:
+        return self.title or (Path(self.file_path).name if self.file_path else "새 문서")
+
+
+def pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    if pid == os.getpid():
+        return True
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+            STILL_ACTIVE = 259
+            kernel32 = ctypes.WinDLL("kernel32")
+            handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+            if not handle:
+                return False
+            try:
+                code = ctypes.c_ulong()
+                ok = kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+                return bool(ok) and code.value == STILL_ACTIVE
+            finally:
+                kernel32.CloseHandle(handle)
+        except Exception:
+            return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+class RecoveryJournal:
+    """
+    One snapshot per tab in config_dir()/recovery:
+        <tab_id>.pdf   — serialized document state
+        <tab_id>.json  — manifest, written last (an entry without it is ignored)
+
+    Entries are removed when the tab is saved or closed normally, so whatever
+    is left at startup (from a process that is no longer running) is what a
+    crash would otherwise have lost.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.dir = Path(directory) if directory else StampManager.config_dir() / "recovery"
+        self.dir.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, tab_id: str) -> tuple[Path, Path]:
+        return self.dir / f"{tab_id}.pdf", self.dir / f"{tab_id}.json"
+
+    def write(self, tab_id: str, snapshot: DocumentSnapshot, meta: dict):
+        """Store a snapshot atomically (safe to call from a worker thread)."""
+        pdf_path, meta_path = self._paths(tab_id)
+        tmp_pdf = pdf_path.with_suffix(".pdf.tmp")
+        snapshot.copy_to(str(tmp_pdf))
+        with open(tmp_pdf, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_pdf, pdf_path)
+
+        manifest = {
+            "tab_id": tab_id,
+            "file_path": meta.get("file_path", ""),
+            "title": meta.get("title", ""),
+            "current_page": int(meta.get("current_page", 0)),
+            "saved_at": time.time(),
+            "pid": os.getpid(),
+        }
+        tmp_meta = meta_path.with_suffix(".json.tmp")
+        tmp_meta.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_meta, meta_path)
+
+    def discard(self, tab_id: str):
+        for p in self._paths(tab_id):
+            try:
+                p.unlink()
+            except OSError:
+                pass
+
+    def pending(self) -> list[RecoveryEntry]:
+        """Entries left behind by processes that are no longer running, newest first."""
+        entries: list[RecoveryEntry] = []
+        for meta_path in self.dir.glob("*.json"):
+            try:
+                d = json.loads(meta_path.read_text(encoding="utf-8"))
+                pdf_path, _ = self._paths(d["tab_id"])
+                if not pdf_path.exists():
+                    continue
+                entry = RecoveryEntry(
+                    tab_id=d["tab_id"],
+                    file_path=d.get("file_path", ""),
+                    title=d.get("title", ""),
+                    current_page=int(d.get("current_page", 0)),
+                    saved_at=float(d.get("saved_at", 0)),
+                    pid=int(d.get("pid", 0)),
+                    pdf_path=str(pdf_path),
+                )
+            except Exception:
+                continue
+            # Another running instance still owns this entry
+            if pid_alive(entry.pid):
+                continue
+            entries.append(entry)
+        entries.sort(key=lambda e: e.saved_at, reverse=True)
+        return entries
+
+
+# ─────────────────────────────────────────────
+# Background Writer & Scheduler
+# ─────────────────────────────────────────────
+
+class JournalWriteWorker(QThread):
+    """Copies one published snapshot into the journal (releases it when done)."""
+    finished_write = pyqtSignal(str, bool)  # tab_id, ok
+
+    def __init__(self, journal: RecoveryJournal, tab_id: str, snapshot: DocumentSnapshot, meta: dict):
+        super().__init__()
+        self._journal = journal
+        self._tab_id = tab_id
+        self._snapshot = snapshot
+        self._meta = meta
+
+    def run(self):
+        try:
+            self._journal.write(self._tab_id, self._snapshot, self._meta)
+            ok = True
+        except Exception:
+            ok = False
+        finally:
+            self._snapshot.release()
+        self.finished_write.emit(self._tab_id, ok)
+
+
+class AutosaveScheduler(QObject):
+    """
+    Decides *when* to journal; the window decides *how* (see flush_due).
+
+    A journal is due once edits have paused for `idle_ms`. While edits keep
+    coming, the idle timer keeps restarting, so a forced flush happens at most
+    every `max_interval_ms`. Bursts of edits therefore cost one snapshot,
+    not one per edit.
+    """
+
+    flush_due = pyqtSignal(list)  # tab ids with unjournaled edits
+
+    def __init__(self, idle_ms: int = 4000, max_interval_ms: int = 60000, parent=None):
+        super().__init__(parent)
+        self._dirty: dict[str, float] = {}   # tab_id → time of first unjournaled edit
+        self._max_interval = max_interval_ms / 1000
+        self._idle = QTimer(self)
+        self._idle.setSingleShot(True)
+        self._idle.setInterval(idle_ms)
+        self._idle.timeout.connect(self._flush)
+
+    def note_edit(self, tab_id: str):
+        first = self._dirty.setdefault(tab_id, time.monotonic())
+        if time.monotonic() - first >= self._max_interval:
+            self._flush()
+        else:
+            self._idle.start()
+
+    def forget(self, tab_id: str):
+        self._dirty.pop(tab_id, None)
+
+    def _flush(self):
+        self._idle.stop()
+        if self._dirty:
+            ids = list(self._dirty)
+            self._dirty.clear()
+            self.flush_due.emit(ids)
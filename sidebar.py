@@ -19,7 +19,9 @@ from PyQt6.QtWidgets import (
     QVBoxLayout, QWidget,
 )
 
-from models import BookmarkManager
+from models import BookmarkManager, save_profile
+from snapshots import DocumentSnapshot, hold
+from tab_cache import image_bytes, tab_cache
 from icons import icon as svg_icon
 
 
@@ -35,10 +37,10 @@ class ThumbnailWorker(QThread):
     done = pyqtSignal(int, QImage)
 
     def __init__(self, file_path: str, page_indices: list, size: int = 120,
-                 doc_bytes: Optional[bytes] = None):
+                 snapshot: Optional[DocumentSnapshot] = None):
         super().__init__()
         self._file_path = file_path
-        self._doc_bytes = doc_bytes
+        self._snapshot = snapshot  # reference owned by the worker
         self.page_indices = list(page_indices)
         self.size = size
         self._cancelled = False
@@ -47,12 +49,20 @@ class ThumbnailWorker(QThread):
         self._cancelled = True
 
     def run(self):
-        if not self._file_path and not self._doc_bytes:
+        try:
+            self._render_all()
+        finally:
+            if self._snapshot:
+                self._snapshot.release()
+                self._snapshot = None
+
+    def _render_all(self):
+        if not self._file_path and not self._snapshot:
             return
         doc = None
         try:
-            if self._doc_bytes:
-                doc = fitz.open(stream=self._doc_bytes, filetype="pdf")
+            if self._snapshot:
+                doc = self._snapshot.open()
             else:
                 doc = fitz.open(self._file_path)
             for page_index in self.page_indices:
@@ -213,7 +223,7 @@ class _DraggableThumbList(QListWidget):
 
             tmp_dir = tempfile.mkdtemp(prefix="pdfpro_")
             tmp_path = os.path.join(tmp_dir, f"{prefix}pages_{len(selected_rows)}.pdf")
-            new_doc.save(tmp_path, garbage=3, deflate=True)
+            save_profile().save(new_doc, tmp_path)
             new_doc.close()
         except Exception as e:
             print(f"Drag export error: {e}")
@@ -356,11 +366,13 @@ class ThumbnailPanel(QWidget):
 
         self._doc: Optional[fitz.Document] = None
         self._file_path: str = ""
+        self._snapshot: Optional[DocumentSnapshot] = None
         self._current_page: int = 0
         self._bookmark_pages: set[int] = set()
         self._workers: list[ThumbnailWorker] = []
         self._thumb_size = QSize(THUMB_W, THUMB_H)
         self._thumb_images: dict[int, QImage] = {}
+        self._cache_key: str = ""  # tab whose thumbnails are shown (see load_document)
         self._list.setIconSize(self._thumb_size)
         self._refresh_header()
 
@@ -432,10 +444,23 @@ class ThumbnailPanel(QWidget):
         self._list.setGridSize(QSize(viewport_w, item_h))
 
     def load_document(self, doc: Optional[fitz.Document], bookmarks: set[int] = set(),
-                      file_path: str = "", doc_bytes: Optional[bytes] = None):
+                      file_path: str = "", snapshot: Optional[DocumentSnapshot] = None,
+                      cache_key: str = ""):
+        """`cache_key` identifies the tab: thumbnails of the tab being left are
+        parked in tab_cache() and reused when it comes back (same key = reload)."""
+        switching = cache_key != self._cache_key
+        if switching and self._doc is not None and self._cache_key and self._thumb_images:
+            images = self._thumb_images
+            tab_cache().park("thumbs", self._cache_key, (self._doc, images),
+                             sum(image_bytes(img) for img in images.values()))
+            self._thumb_images = {}
+        self._cache_key = cache_key
         self._list.clear()
         self._list.set_doc(doc)
         self._thumb_images.clear()
+        parked = tab_cache().take("thumbs", cache_key) if switching and cache_key else None
+        if parked is not None and doc is not None and parked[0] is doc:
+            self._thumb_images = {i: img for i, img in parked[1].items() if i < doc.page_count}
 
         for w in self._workers:
             w.cancel()
@@ -445,7 +470,7 @@ class ThumbnailPanel(QWidget):
 
         self._doc = doc
         self._file_path = file_path
-        self._doc_bytes = doc_bytes
+        self._snapshot = hold(self._snapshot, snapshot)
         self._bookmark_pages = bookmarks
         self._refresh_header()
 
@@ -457,7 +482,9 @@ class ThumbnailPanel(QWidget):
 
         for i in range(doc.page_count):
             bm = "★ " if i in bookmarks else ""
-            item = QListWidgetItem(placeholder_icon, f"{bm}{i + 1}")
+            image = self._thumb_images.get(i)
+            icon = self._icon_from_image(image) if image is not None else placeholder_icon
+            item = QListWidgetItem(icon, f"{bm}{i + 1}")
             item.setSizeHint(QSize(self._thumb_size.width(), self._thumb_size.height() + THUMB_LABEL_H))
             item.setTextAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom)
             self._list.addItem(item)
@@ -477,9 +504,12 @@ class ThumbnailPanel(QWidget):
                     indices.append(idx)
             if len(indices) >= doc.page_count:
                 break
+        indices = [i for i in indices if i not in self._thumb_images]
+        if not indices:
+            return  # every thumbnail came back from the parked cache
 
         worker = ThumbnailWorker(self._file_path, indices, size=int(round(THUMB_W * THUMB_MAX_SCALE * 6)),
-                                 doc_bytes=self._doc_bytes)
+                                 snapshot=self._snapshot.acquire() if self._snapshot else None)
         worker.done.connect(self._on_thumbnail_done)
         self._workers.append(worker)
         worker.start()
@@ -628,6 +658,9 @@ class ThumbnailPanel(QWidget):
             )
         menu.exec(self._list.mapToGlobal(pos))
 
+    def selected_pages(self) -> list[int]:
+        return sorted(set(idx.row() for idx in self._list.selectedIndexes()))
+
     def refresh_bookmarks(self, bookmarks: set[int]):
         self._bookmark_pages = bookmarks
         for i in range(self._list.count()):
@@ -841,6 +874,8 @@ class SidebarWidget(QWidget):
         self._bookmark_mgr = bookmark_mgr
         self._file_path: str = ""
         self._doc: Optional[fitz.Document] = None
+        self._snapshot: Optional[DocumentSnapshot] = None
+        self._cache_key: str = ""
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -915,19 +950,24 @@ class SidebarWidget(QWidget):
         return ThumbnailPanel.maximum_sidebar_width()
 
     def load_document(self, doc: Optional[fitz.Document], file_path: str = "",
-                      doc_bytes: Optional[bytes] = None):
+                      snapshot: Optional[DocumentSnapshot] = None, cache_key: str = ""):
         self._doc = doc
         self._file_path = file_path
-        self._doc_bytes = doc_bytes
+        self._cache_key = cache_key
+        self._snapshot = hold(self._snapshot, snapshot)
         bookmarks_set = set(self._bookmark_mgr.pages(file_path))
         self._thumb_panel.load_document(doc, bookmarks_set, file_path=file_path,
-                                        doc_bytes=doc_bytes)
+                                        snapshot=snapshot, cache_key=cache_key)
         self._bm_panel.refresh(self._bookmark_mgr.pages(file_path))
         self._outline_panel.load_toc(doc)
 
     def set_current_page(self, page: int):
         self._thumb_panel.set_current_page(page)
 
+    def selected_pages(self) -> list[int]:
+        """Page indices currently selected in the thumbnail list."""
+        return self._thumb_panel.selected_pages()
+
     def _set_panel_index(self, index: int):
         self._stack.setCurrentIndex(index)
         btn = self._nav_group.button(index)
@@ -940,15 +980,16 @@ class SidebarWidget(QWidget):
             self._bm_panel.refresh(pages)
             self._thumb_panel.refresh_bookmarks(set(pages))
 
-    def reload_thumbnails(self, doc_bytes: Optional[bytes] = None):
+    def reload_thumbnails(self, snapshot: Optional[DocumentSnapshot] = None):
         """Reload thumbnails after page structure changes."""
         if self._doc:
-            if doc_bytes is not None:
-                self._doc_bytes = doc_bytes
+            if snapshot is not None:
+                self._snapshot = hold(self._snapshot, snapshot)
             bookmarks_set = set(self._bookmark_mgr.pages(self._file_path))
             self._thumb_panel.load_document(self._doc, bookmarks_set,
                                             file_path=self._file_path,
-                                            doc_bytes=self._doc_bytes)
+                                            snapshot=self._snapshot,
+                                            cache_key=self._cache_key)
 
 
 # ─────────────────────────────────────────────
@@ -982,10 +1023,11 @@ class PageGridView(QWidget):
 
         self._doc: Optional[fitz.Document] = None
         self._file_path: str = ""
+        self._snapshot: Optional[DocumentSnapshot] = None
         self._workers: list[ThumbnailWorker] = []
 
     def load_document(self, doc: Optional[fitz.Document], current_page: int = 0,
-                      file_path: str = "", doc_bytes: Optional[bytes] = None):
+                      file_path: str = "", snapshot: Optional[DocumentSnapshot] = None):
         self._list.clear()
 
         for w in self._workers:
@@ -996,7 +1038,7 @@ class PageGridView(QWidget):
 
         self._doc = doc
         self._file_path = file_path
-        self._doc_bytes = doc_bytes
+        self._snapshot = hold(self._snapshot, snapshot)
         if not doc:
             return
 
@@ -1015,7 +1057,8 @@ class PageGridView(QWidget):
             self._list.scrollToItem(self._list.item(current_page))
 
         worker = ThumbnailWorker(self._file_path, list(range(doc.page_count)),
-                                 size=GRID_VIEW_THUMB_W * 2, doc_bytes=self._doc_bytes)
+                                 size=GRID_VIEW_THUMB_W * 2,
+                                 snapshot=self._snapshot.acquire() if self._snapshot else None)
         worker.done.connect(self._on_thumbnail_done)
         self._workers.append(worker)
         worker.start()
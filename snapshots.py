@@ -0,0 +1,304 @@
+"""
+snapshots.py — Versioned read-only document snapshots shared by background workers
+The UI thread publishes the current state of a modified document once; every
+worker (render, thumbnails, search, OCR, save, AI context) opens that same
+immutable file instead of receiving its own bytes copy.
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import fitz  # PyMuPDF
+from PyQt6.QtCore import QThread
+
+from recovery import pid_alive
+
+_log = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────
+# Snapshot
+# ─────────────────────────────────────────────
+
+class DocumentSnapshot:
+    """
+    One serialized document state, stored in a temp file and never modified.
+
+    Reference counted: whoever hands a snapshot to a worker acquires it
+    first, the worker releases it when done; the file is deleted when the
+    last reference goes. Workers read it with `open()` (private parsed copy)
+    or `open_shared()` (one parsed copy per version and thread, reused across
+    tasks — MuPDF loads objects from the file lazily, and the OS page cache
+    holds the bytes once for every reader).
+    """
+
+    def __init__(self, service: "SnapshotService", version: int, path: str,
+                 state: tuple[int, int] = (0, 0)):
+        self.version = version
+        self.path = path
+        self.state = state   # edit_state() of the document it was published from
+        self.size = os.path.getsize(path)
+        self._service = service
+        self._refs = 1
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<DocumentSnapshot v{self.version} refs={self._refs} {self.size}B>"
+
+    @property
+    def refs(self) -> int:
+        return self._refs
+
+    def acquire(self) -> "DocumentSnapshot":
+        with self._lock:
+            if self._refs <= 0:
+                raise RuntimeError(f"snapshot v{self.version} already released")
+            self._refs += 1
+        return self
+
+    def release(self):
+        with self._lock:
+            self._refs -= 1
+            last = self._refs == 0
+        if last:
+            self._service._discard(self)
+
+    def open(self) -> fitz.Document:
+        """A parsed copy owned by the caller (close it before releasing)."""
+        return fitz.open(self.path)
+
+    def open_shared(self) -> fitz.Document:
+        """This thread's cached parsed copy; do not close it.
+
+        Only valid while the caller holds a reference: the copy is closed
+        when the last reference is released.
+        """
+        return _shared_docs.get(self)
+
+    def read_bytes(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def copy_to(self, dest: str):
+        shutil.copyfile(self.path, dest)
+
+
+# ─────────────────────────────────────────────
+# Edit tracking
+# ─────────────────────────────────────────────
+
+_doc_tokens = itertools.count(1)
+
+
+def edit_state(doc: fitz.Document) -> tuple[int, int]:
+    """(document token, edit count): identifies one state of one open document."""
+    token = getattr(doc, "_snapshot_token", 0)
+    if not token:
+        token = next(_doc_tokens)
+        doc._snapshot_token = token
+    return token, getattr(doc, "_snapshot_edits", 0)
+
+
+def mark_edited(doc: fitz.Document):
+    """Record that `doc` changed; snapshots published before no longer count as current."""
+    doc._snapshot_edits = edit_state(doc)[1] + 1
+
+
+def hold(current: Optional[DocumentSnapshot],
+         new: Optional[DocumentSnapshot]) -> Optional[DocumentSnapshot]:
+    """For long-lived holders (panels): reference `new`, drop the one on `current`."""
+    if new is current:
+        return current
+    if new is not None:
+        new.acquire()
+    if current is not None:
+        current.release()
+    return new
+
+
+class _SharedDocCache:
+    """
+    Parsed snapshot documents keyed by (version, thread id).
+
+    Module-level rather than thread-local: QThreadPool clears thread-local
+    storage after every QRunnable, which would reparse the snapshot for each
+    render task. A fitz.Document is only ever used by the thread that opened
+    it. Entries hold no snapshot reference; they are closed when the
+    snapshot's last reference goes (nobody can be using them then), when
+    their thread opens more than MAX_DOCS_PER_THREAD other versions, or once
+    their thread has finished (idle pool threads expire after 30 s).
+    """
+
+    MAX_DOCS_PER_THREAD = 2   # e.g. viewer + grid view rendering different tabs on one pool thread
+
+    def __init__(self):
+        self._docs: OrderedDict[tuple[int, int], tuple[fitz.Document, QThread]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, snap: DocumentSnapshot) -> fitz.Document:
+        tid = threading.get_ident()
+        key = (snap.version, tid)
+        with self._lock:
+            entry = self._docs.get(key)
+            if entry is not None:
+                self._docs.move_to_end(key)
+                return entry[0]
+        doc = snap.open()   # parse outside the lock; only this thread uses the key
+        with self._lock:
+            self._docs[key] = (doc, QThread.currentThread())
+            mine = [k for k in self._docs if k[1] == tid]
+            # This thread's own copies of other versions, and copies of exited threads
+            stale = mine[:-self.MAX_DOCS_PER_THREAD]
+            stale += [k for k, (_, th) in self._docs.items() if k[1] != tid and _finished(th)]
+            docs = [self._docs.pop(k)[0] for k in stale]
+        for old in docs:
+            try:
+                old.close()
+            except Exception:
+                pass
+        return doc
+
+    def discard(self, version: int):
+        """Close every thread's copy of a version (its last reference is gone)."""
+        with self._lock:
+            docs = [self._docs.pop(k)[0] for k in [k for k in self._docs if k[0] == version]]
+        for doc in docs:
+            try:
+                doc.close()
+            except Exception:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+
+def _finished(thread: QThread) -> bool:
+    try:
+        return thread.isFinished()
+    except RuntimeError:   # QThread object already deleted
+        return True
+
+
+_shared_docs = _SharedDocCache()
+
+
+# ─────────────────────────────────────────────
+# Snapshot Service
+# ─────────────────────────────────────────────
+
+class SnapshotService:
+    """
+    Publishes DocumentSnapshots into a per-process temp directory.
+
+    Versions increase monotonically across all documents. Files of versions
+    nobody holds any more are deleted immediately; a file still open
+    elsewhere (Windows refuses to delete it) is retried on later releases and
+    at exit. Directories left by crashed processes are removed on start.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        root = root or tempfile.gettempdir()
+        self.dir = os.path.join(root, f"PDFProTool-snapshots-{os.getpid()}")
+        os.makedirs(self.dir, exist_ok=True)
+        self._versions = itertools.count(1)
+        self._live: dict[int, DocumentSnapshot] = {}
+        self._latest: dict[int, DocumentSnapshot] = {}   # document token → newest snapshot
+        self._undeleted: list[str] = []
+        self._lock = threading.Lock()
+        self._remove_stale_dirs(root)
+
+    def publish(self, doc: fitz.Document) -> DocumentSnapshot:
+        """Serialize `doc` (UI thread) → snapshot holding one reference for the caller.
+
+        Written as-is, without garbage collection or recompression: that is
+        several times faster for freshly drawn content, and whoever writes a
+        real file from the snapshot (FileSaveWorker) applies the save profile.
+        """
+        state = edit_state(doc)
+        version = next(self._versions)
+        path = os.path.join(self.dir, f"v{version}.pdf")
+        tmp = path + ".tmp"
+        doc.save(tmp)
+        os.replace(tmp, path)  # readers never see a partial file
+        snap = DocumentSnapshot(self, version, path, state)
+        with self._lock:
+            self._live[version] = snap
+            self._latest[state[0]] = snap
+        return snap
+
+    def current(self, doc: fitz.Document) -> Optional[DocumentSnapshot]:
+        """The snapshot of `doc` published since its last edit (with a reference for
+        the caller), or None if it changed since — then publish() a new one."""
+        state = edit_state(doc)
+        with self._lock:
+            snap = self._latest.get(state[0])
+        if snap is None or snap.state != state:
+            return None
+        try:
+            return snap.acquire()
+        except RuntimeError:  # released in the meantime
+            return None
+
+    def current_or_publish(self, doc: fitz.Document) -> DocumentSnapshot:
+        return self.current(doc) or self.publish(doc)
+
+    def live_snapshots(self) -> list[DocumentSnapshot]:
+        with self._lock:
+            return list(self._live.values())
+
+    def _discard(self, snap: DocumentSnapshot):
+        _shared_docs.discard(snap.version)   # close parsed copies before deleting the file
+        with self._lock:
+            self._live.pop(snap.version, None)
+            if self._latest.get(snap.state[0]) is snap:
+                del self._latest[snap.state[0]]
+            pending = self._undeleted + [snap.path]
+            self._undeleted = []
+        for path in pending:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                with self._lock:
+                    self._undeleted.append(path)
+
+    def shutdown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    @staticmethod
+    def _remove_stale_dirs(root: str):
+        try:
+            names = os.listdir(root)
+        except OSError:
+            return
+        for name in names:
+            if not name.startswith("PDFProTool-snapshots-"):
+                continue
+            try:
+                pid = int(name.rsplit("-", 1)[1])
+            except ValueError:
+                continue
+            if not pid_alive(pid):
+                shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+_service: Optional[SnapshotService] = None
+
+
+def snapshot_service() -> SnapshotService:
+    """The process-wide SnapshotService (created on first use)."""
+    global _service
+    if _service is None:
+        _service = SnapshotService()
+        atexit.register(_service.shutdown)
+    return _service
@@ -0,0 +1,91 @@
+"""
+tab_cache.py — Render and thumbnail caches of background tabs
+When a tab is left, the viewer and the thumbnail panel park what they had
+rendered for it here; switching back takes it out again instead of
+re-rendering. Everything parked shares one byte budget.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from PyQt6.QtGui import QImage, QPixmap
+
+
+# Parked caches of all tabs together (the active tab's caches are not counted)
+TAB_CACHE_BUDGET = 512 * 1024 * 1024
+
+
+def image_bytes(image) -> int:
+    """Approximate memory held by a QImage or QPixmap."""
+    if isinstance(image, QImage):
+        return image.sizeInBytes()
+    if isinstance(image, QPixmap):
+        return image.width() * image.height() * max(image.depth(), 8) // 8
+    return 0
+
+
+class TabCacheStore:
+    """
+    Parked per-tab cache entries, keyed by (owner, tab key).
+
+    `owner` names the component ("viewer", "thumbs") so several can park for
+    the same tab. Entries leave in least-recently-parked order when the
+    budget is exceeded; `on_evict` runs for entries that leave without being
+    taken back (e.g. to release a held snapshot).
+    """
+
+    def __init__(self, budget: int = TAB_CACHE_BUDGET):
+        self.budget = budget
+        self._entries: OrderedDict[tuple[str, str], tuple[Any, int, Optional[Callable]]] = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def park(self, owner: str, key: str, data: Any, nbytes: int,
+             on_evict: Optional[Callable[[Any], None]] = None):
+        self._drop((owner, key))
+        if nbytes > self.budget:
+            if on_evict:
+                on_evict(data)
+            return
+        self._entries[(owner, key)] = (data, nbytes, on_evict)
+        self._bytes += nbytes
+        while self._bytes > self.budget:
+            self._drop(next(iter(self._entries)))
+
+    def take(self, owner: str, key: str) -> Any:
+        """Remove and return the entry (None if absent); the caller owns it again."""
+        entry = self._entries.pop((owner, key), None)
+        if entry is None:
+            return None
+        self._bytes -= entry[1]
+        return entry[0]
+
+    def forget(self, key: str):
+        """Drop every component's entry for a tab (closed, hibernated or edited)."""
+        for k in [k for k in self._entries if k[1] == key]:
+            self._drop(k)
+
+    def _drop(self, k: tuple[str, str]):
+        entry = self._entries.pop(k, None)
+        if entry is None:
+            return
+        data, nbytes, on_evict = entry
+        self._bytes -= nbytes
+        if on_evict:
+            on_evict(data)
+
+
+_store: Optional[TabCacheStore] = None
+
+
+def tab_cache() -> TabCacheStore:
+    """The process-wide TabCacheStore."""
+    global _store
+    if _store is None:
+        _store = TabCacheStore()
+    return _store
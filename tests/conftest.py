@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Modules live flat in the repository root; Qt classes are used without a display.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
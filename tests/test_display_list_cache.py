@@ -0,0 +1,74 @@
+import fitz
+import pytest
+
+from pdf_viewer import DisplayListCache
+
+MIN = DisplayListCache.MIN_ENTRY_BYTES
+
+
+@pytest.fixture
+def doc():
+    d = fitz.open()
+    for i in range(4):
+        page = d.new_page(width=100, height=100)
+        page.draw_rect(fitz.Rect(10, 10, 10 + 10 * (i + 1), 50), color=(1, 0, 0))
+    yield d
+    d.close()
+
+
+def render(cache, doc, pno, zoom=1.0, source=("v", 1)):
+    return cache.render(source, lambda: doc, pno, fitz.Matrix(zoom, zoom))
+
+
+def test_second_zoom_of_a_page_hits(doc):
+    cache = DisplayListCache(budget=10 * MIN)
+    render(cache, doc, 0, 1.0)
+    pix = render(cache, doc, 0, 2.0)
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert (pix.width, pix.height) == (200, 200)
+
+
+def test_replay_matches_direct_render(doc):
+    cache = DisplayListCache(budget=10 * MIN)
+    render(cache, doc, 2)
+    cached = render(cache, doc, 2, 1.5)
+    direct = doc[2].get_pixmap(matrix=fitz.Matrix(1.5, 1.5), alpha=False)
+    assert cached.samples == direct.samples
+
+
+def test_sources_are_kept_apart(doc):
+    cache = DisplayListCache(budget=10 * MIN)
+    render(cache, doc, 0, source=("v", 1))
+    render(cache, doc, 0, source=("v", 2))
+    assert (cache.misses, cache.hits) == (2, 0)
+
+
+def test_budget_evicts_least_recently_used(doc):
+    cache = DisplayListCache(budget=2 * MIN)
+    render(cache, doc, 0)
+    render(cache, doc, 1)
+    render(cache, doc, 0)          # page 0 becomes most recent
+    render(cache, doc, 2)          # evicts page 1
+    assert cache.total_bytes <= cache.budget
+    misses = cache.misses
+    render(cache, doc, 0)
+    assert cache.misses == misses
+    render(cache, doc, 1)
+    assert cache.misses == misses + 1
+
+
+def test_single_entry_over_budget_is_kept(doc):
+    cache = DisplayListCache(budget=MIN // 2)
+    render(cache, doc, 0)
+    render(cache, doc, 0)
+    assert cache.hits == 1
+    assert cache.total_bytes == MIN
+
+
+def test_clear_resets_size(doc):
+    cache = DisplayListCache(budget=10 * MIN)
+    render(cache, doc, 0)
+    cache.clear()
+    assert cache.total_bytes == 0
+    render(cache, doc, 0)
+    assert cache.misses == 2
@@ -0,0 +1,60 @@
+import fitz
+import pytest
+
+from document_ops import ImageImporter, ImportCancelled
+
+
+@pytest.fixture
+def images(tmp_path):
+    paths = []
+    for i in range(5):
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 40, 30), False)
+        pix.set_rect(pix.irect, (40 * i, 120, 200))
+        path = tmp_path / f"img{i}.png"
+        pix.save(str(path))
+        paths.append(str(path))
+    return paths
+
+
+def leftovers(tmp_path):
+    return sorted(p.name for p in tmp_path.iterdir() if ".part" in p.name)
+
+
+def test_streamed_import_writes_every_page(tmp_path, images):
+    dest = str(tmp_path / "out.pdf")
+    importer = ImageImporter(images, dest, workers=2, flush_every=2)
+    assert importer.run() == dest
+    with fitz.open(dest) as doc:
+        assert doc.page_count == 5
+        assert all(doc[i].get_images() for i in range(5))
+    assert leftovers(tmp_path) == []
+
+
+def test_cancel_keeps_existing_destination(tmp_path, images):
+    dest = tmp_path / "out.pdf"
+    dest.write_bytes(b"previous")
+    done = []
+
+    def progress(n, total, label):
+        done.append(n)
+        if n == 3:
+            importer.cancel()
+
+    importer = ImageImporter(images, str(dest), workers=1, flush_every=2, progress=progress)
+    with pytest.raises(ImportCancelled):
+        importer.run()
+    assert done[-1] == 3           # cancelled after a flush had been written
+    assert dest.read_bytes() == b"previous"
+    assert leftovers(tmp_path) == []
+
+
+def test_failed_import_leaves_nothing(tmp_path):
+    dest = tmp_path / "out.pdf"
+    bad = tmp_path / "bad.png"
+    bad.write_bytes(b"not an image")
+    importer = ImageImporter([str(bad)], str(dest), workers=1)
+    with pytest.raises(ValueError):
+        importer.run()
+    assert importer.skipped
+    assert not dest.exists()
+    assert leftovers(tmp_path) == []
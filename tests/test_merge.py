@@ -0,0 +1,68 @@
+import fitz
+import pytest
+
+import document_ops
+from document_ops import PDFMerger, flush_to_disk
+
+
+@pytest.fixture
+def sources(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"src{i}.pdf"
+        with fitz.open() as doc:
+            doc.new_page().insert_text((72, 72), f"source {i}")
+            doc.save(path)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Every document document_ops opens from a temporary merge file."""
+    docs = []
+    real_open = fitz.open
+
+    def tracking_open(*args, **kwargs):
+        doc = real_open(*args, **kwargs)
+        if args and str(args[0]).endswith(".pdf.tmp"):
+            docs.append(doc)
+        return doc
+
+    monkeypatch.setattr(document_ops.fitz, "open", tracking_open)
+    return docs
+
+
+def test_flush_to_disk_reopens_after_every_flush(tmp_path):
+    path = str(tmp_path / "out.pdf")
+    doc = fitz.open()
+    doc.new_page()
+    first = flush_to_disk(doc, path)
+    assert doc.is_closed
+    first.new_page()
+    second = flush_to_disk(first, path)
+    assert first.is_closed and second is not first
+    assert second.page_count == 2
+    second.close()
+
+
+def test_streaming_merge_reopens_between_batches(tmp_path, sources, opened):
+    dest = str(tmp_path / "merged.pdf")
+    merger = PDFMerger(sources, dest, batch_size=2)
+    assert merger.run() == dest
+    # Batches [0, 1] [2, 3] [4]: two flushes, each followed by a fresh document
+    assert len(opened) == 2
+    assert len({id(doc) for doc in opened}) == 2
+    assert all(doc.is_closed for doc in opened)
+    with fitz.open(dest) as doc:
+        assert [doc[i].get_text().strip() for i in range(doc.page_count)] == \
+            [f"source {i}" for i in range(5)]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_small_merge_is_not_streamed(tmp_path, sources, opened):
+    dest = str(tmp_path / "merged.pdf")
+    PDFMerger(sources[:2], dest, batch_size=2).run()
+    assert opened == []
+    with fitz.open(dest) as doc:
+        assert doc.page_count == 2
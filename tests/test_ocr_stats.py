@@ -0,0 +1,43 @@
+import pytest
+
+from ocr_manager import OCRPageStats, summarize_stats
+
+
+def test_empty_run():
+    summary = summarize_stats([])
+    assert summary["pages"] == 0
+    assert summary["pages_per_sec"] == 0.0
+    assert summary["avg_total_ms"] == 0.0
+    assert summary["avg_conf"] is None
+
+
+def test_stage_means_cover_recognized_pages_only():
+    stats = [
+        OCRPageStats(0, rasterize_ms=10, recognize_ms=100, chars=5),
+        OCRPageStats(1, rasterize_ms=30, recognize_ms=300, chars=7),
+        OCRPageStats(2, source="cache", cache_ms=2, chars=9),
+    ]
+    summary = summarize_stats(stats, seconds=2.0)
+    assert summary["pages"] == 3
+    assert summary["ocr_pages"] == 2
+    assert summary["cached_pages"] == 1
+    assert summary["chars"] == 21
+    assert summary["pages_per_sec"] == 1.5
+    assert summary["avg_rasterize_ms"] == 20
+    assert summary["avg_recognize_ms"] == 200
+    assert summary["avg_cache_ms"] == 0
+    assert summary["avg_total_ms"] == 220
+
+
+def test_confidence_is_weighted_by_boxes():
+    stats = [
+        OCRPageStats(0, boxes=1, avg_conf=0.2),
+        OCRPageStats(1, boxes=9, avg_conf=0.9),
+        OCRPageStats(2, boxes=0, avg_conf=None),
+    ]
+    assert summarize_stats(stats)["avg_conf"] == pytest.approx(0.83)
+
+
+def test_peak_memory_is_the_maximum():
+    stats = [OCRPageStats(0, peak_rss_mb=120.04), OCRPageStats(1, peak_rss_mb=340.06)]
+    assert summarize_stats(stats)["peak_rss_mb"] == 340.1
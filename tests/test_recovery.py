@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from recovery import RecoveryJournal, pid_alive
+
+
+@pytest.fixture(scope="module")
+def dead_pid():
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def add_entry(journal, tab_id, pid, saved_at, pdf=True, **extra):
+    if pdf:
+        (journal.dir / f"{tab_id}.pdf").write_bytes(b"%PDF-1.7\n")
+    manifest = {"tab_id": tab_id, "title": tab_id, "saved_at": saved_at, "pid": pid, **extra}
+    (journal.dir / f"{tab_id}.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+
+def test_pid_alive(dead_pid):
+    assert pid_alive(os.getpid())
+    assert not pid_alive(dead_pid)
+    assert not pid_alive(0)
+
+
+def test_pending_lists_entries_of_dead_processes_newest_first(tmp_path, dead_pid):
+    journal = RecoveryJournal(tmp_path)
+    add_entry(journal, "old", dead_pid, 100.0, file_path="/x/old.pdf", current_page=3)
+    add_entry(journal, "new", dead_pid, 200.0)
+    entries = journal.pending()
+    assert [e.tab_id for e in entries] == ["new", "old"]
+    old = entries[1]
+    assert old.file_path == "/x/old.pdf"
+    assert old.current_page == 3
+    assert old.display_name == "old"
+    assert old.pdf_path == str(tmp_path / "old.pdf")
+
+
+def test_pending_skips_entries_of_running_processes(tmp_path, dead_pid):
+    journal = RecoveryJournal(tmp_path)
+    add_entry(journal, "mine", os.getpid(), 100.0)
+    add_entry(journal, "crashed", dead_pid, 100.0)
+    assert [e.tab_id for e in journal.pending()] == ["crashed"]
+
+
+def test_pending_skips_incomplete_entries(tmp_path, dead_pid):
+    journal = RecoveryJournal(tmp_path)
+    add_entry(journal, "no_pdf", dead_pid, 100.0, pdf=False)
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+    (tmp_path / "manifestless.pdf").write_bytes(b"%PDF-1.7\n")
+    assert journal.pending() == []
+
+
+def test_discard_removes_entry(tmp_path, dead_pid):
+    journal = RecoveryJournal(tmp_path)
+    add_entry(journal, "gone", dead_pid, 100.0)
+    journal.discard("gone")
+    assert journal.pending() == []
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,73 @@
+import fitz
+import pytest
+
+from document_ops import ResourceDeduper
+
+
+def png(value, size=16):
+    return fitz.Pixmap(fitz.csRGB, size, size, bytes([value, 0, 0]) * size * size, False).tobytes("png")
+
+
+LOGO = png(200)
+
+
+@pytest.fixture
+def doc():
+    d = fitz.open()
+    for i in range(3):
+        page = d.new_page()
+        page.insert_image(fitz.Rect(0, 0, 300, 300), stream=png(i, size=40 + i))  # one-off scans
+        page.insert_image(fitz.Rect(10, 10, 60, 60), stream=LOGO)
+    yield d
+    d.close()
+
+
+def insert_logo_page(doc):
+    src = fitz.open()
+    src.new_page().insert_image(fitz.Rect(10, 10, 60, 60), stream=LOGO)
+    first_xref, start = doc.xref_length(), doc.page_count
+    doc.insert_pdf(src)
+    return range(start, doc.page_count), first_xref
+
+
+def hashed_streams(monkeypatch):
+    hashed = []
+    real = ResourceDeduper._hash
+
+    def tracking(doc, xref, text):
+        if doc.xref_is_stream(xref):
+            hashed.append((xref, len(doc.xref_stream_raw(xref))))
+        return real(doc, xref, text)
+
+    monkeypatch.setattr(ResourceDeduper, "_hash", staticmethod(tracking))
+    return hashed
+
+
+def test_inserted_logo_reuses_existing_image(doc):
+    logo_xref = next(x for x, *_ in doc[0].get_images(full=True) if doc.xref_get_key(x, "Width")[1] == "16")
+    pages, first_xref = insert_logo_page(doc)
+    dd = ResourceDeduper(doc, verify=True)
+    dd.dedupe_inserted(doc, pages, first_xref)
+    assert dd.merged >= 1
+    assert [x for x, *_ in doc[3].get_images(full=True)] == [logo_xref]
+
+
+def test_only_streams_of_matching_length_are_hashed(doc, monkeypatch):
+    pages, first_xref = insert_logo_page(doc)
+    hashed = hashed_streams(monkeypatch)
+    ResourceDeduper(doc, verify=True).dedupe_inserted(doc, pages, first_xref)
+    old = {x for x, _ in hashed if x < first_xref}
+    assert old                                # logo and its ICC profile
+    assert {n for x, n in hashed if x < first_xref} <= {n for x, n in hashed if x >= first_xref}
+    scans = {doc[p].get_images(full=True)[0][0] for p in range(3)}
+    assert not scans & old
+
+
+def test_changed_canonical_is_not_reused(doc):
+    logo_xref = doc[0].get_images(full=True)[1][0]
+    pages, first_xref = insert_logo_page(doc)
+    dd = ResourceDeduper(doc, verify=True)
+    dd.index_pages(doc, range(3))
+    doc.update_stream(logo_xref, png(10), compress=False)   # edited after indexing
+    dd.dedupe_pages(doc, pages, first_xref)
+    assert doc[3].get_images(full=True)[0][0] != logo_xref
@@ -0,0 +1,61 @@
+import pytest
+
+import pdf_viewer
+from pdf_viewer import ScrollVelocity
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(pdf_viewer.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_first_event_gives_direction_only(clock):
+    v = ScrollVelocity()
+    v.add(0)
+    clock[0] += 1.0            # longer than idle_after: a new gesture
+    assert v.add(500) == 1.0
+    clock[0] += 1.0
+    assert v.add(200) == -1.0
+
+
+def test_no_movement_on_first_event_is_zero(clock):
+    v = ScrollVelocity()
+    assert v.add(0) == 0.0
+
+
+def test_steady_scroll_converges_to_speed(clock):
+    v = ScrollVelocity(smoothing=0.6)
+    v.add(0)
+    value = 0
+    for _ in range(30):
+        clock[0] += 0.01
+        value += 10            # 1000 px/s
+        speed = v.add(value)
+    assert speed == pytest.approx(1000, rel=1e-3)
+
+
+def test_smoothing_weights_each_sample(clock):
+    v = ScrollVelocity(smoothing=0.5)
+    v.add(0)
+    clock[0] += 0.1
+    assert v.add(100) == pytest.approx(0.5 * 1000)
+
+
+def test_pause_resets_to_new_gesture(clock):
+    v = ScrollVelocity(idle_after=0.25)
+    v.add(0)
+    for i in range(1, 10):
+        clock[0] += 0.01
+        v.add(i * 20)
+    clock[0] += 0.3
+    assert v.add(0) == -1.0
+
+
+def test_zero_interval_does_not_divide(clock):
+    v = ScrollVelocity()
+    v.add(0)
+    clock[0] += 0.05
+    v.add(50)
+    assert v.add(80) == 1.0    # same timestamp: treated as a fresh start
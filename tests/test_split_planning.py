@@ -0,0 +1,50 @@
+import pytest
+
+from document_ops import SplitPart, parse_page_ranges, split_every
+
+
+def spans(parts):
+    return [(p.start, p.end) for p in parts]
+
+
+def test_parse_page_ranges_items_are_one_based_and_inclusive():
+    assert spans(parse_page_ranges("1-3, 5, 8-", 10)) == [(0, 2), (4, 4), (7, 9)]
+
+
+def test_parse_page_ranges_open_start_tilde_and_semicolons():
+    assert spans(parse_page_ranges("-2; 4~6 ,, 7", 7)) == [(0, 1), (3, 5), (6, 6)]
+
+
+@pytest.mark.parametrize("text", ["0", "3-2", "1-11", "11"])
+def test_parse_page_ranges_rejects_out_of_range(text):
+    with pytest.raises(ValueError):
+        parse_page_ranges(text, 10)
+
+
+@pytest.mark.parametrize("text", ["a", "1-2-3", "1..3"])
+def test_parse_page_ranges_rejects_malformed(text):
+    with pytest.raises(ValueError):
+        parse_page_ranges(text, 10)
+
+
+def test_parse_page_ranges_requires_a_range():
+    with pytest.raises(ValueError):
+        parse_page_ranges(" , ", 10)
+
+
+def test_split_every_covers_all_pages_with_short_tail():
+    parts = split_every(3, 8)
+    assert spans(parts) == [(0, 2), (3, 5), (6, 7)]
+    assert [p.pages for p in parts] == [3, 3, 2]
+
+
+def test_split_every_clamps_part_size_to_one():
+    assert spans(split_every(0, 2)) == [(0, 0), (1, 1)]
+
+
+def test_split_every_empty_document():
+    assert split_every(5, 0) == []
+
+
+def test_split_part_defaults_to_unnamed():
+    assert SplitPart(0, 4) == SplitPart(0, 4, "")
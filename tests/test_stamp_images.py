@@ -0,0 +1,50 @@
+import fitz
+import pytest
+
+from document_ops import StampImageCache
+
+
+@pytest.fixture
+def seal(tmp_path):
+    path = tmp_path / "seal.png"
+    fitz.Pixmap(fitz.csRGB, 24, 24, bytes([180, 20, 20]) * 576, False).save(str(path))
+    return str(path)
+
+
+def test_same_file_is_embedded_once_per_document(seal):
+    doc = fitz.open()
+    for _ in range(3):
+        doc.new_page()
+    cache = StampImageCache()
+    xrefs = {cache.insert(doc[i], fitz.Rect(10, 10, 50, 50), seal) for i in range(3)}
+    assert len(xrefs) == 1
+    assert all(doc[i].get_images()[0][0] in xrefs for i in range(3))
+
+
+def test_reopened_document_reuses_identical_page_image(seal, tmp_path):
+    path = tmp_path / "stamped.pdf"
+    with fitz.open() as doc:
+        doc.new_page()
+        doc.new_page()
+        StampImageCache().insert(doc[0], fitz.Rect(10, 10, 50, 50), seal)
+        doc.save(path, garbage=3)
+    doc = fitz.open(path)
+    existing = doc[0].get_images()[0][0]
+    assert StampImageCache().insert(doc[1], fitz.Rect(10, 10, 50, 50), seal) == existing
+    doc.close()
+
+
+def test_only_page_images_are_compared(seal, tmp_path, monkeypatch):
+    path = tmp_path / "orphan.pdf"
+    with fitz.open() as doc:
+        doc.new_page()
+        doc.new_page().insert_image(fitz.Rect(0, 0, 10, 10), filename=seal)
+        doc.delete_page(1)         # the image object stays, no page shows it
+        doc.save(path)
+    compared = []
+    real = StampImageCache._same_image.__func__
+    monkeypatch.setattr(StampImageCache, "_same_image", classmethod(
+        lambda cls, doc, xref, other, oxref: compared.append(xref) or real(cls, doc, xref, other, oxref)))
+    with fitz.open(path) as doc:
+        StampImageCache().insert(doc[0], fitz.Rect(10, 10, 50, 50), seal)
+    assert compared == []
@@ -0,0 +1,79 @@
+from PyQt6.QtGui import QImage
+
+from tab_cache import TabCacheStore, image_bytes
+
+
+def test_take_returns_entry_once():
+    store = TabCacheStore(budget=100)
+    store.park("viewer", "a", "data", 10)
+    assert store.total_bytes == 10
+    assert store.take("viewer", "a") == "data"
+    assert store.take("viewer", "a") is None
+    assert store.total_bytes == 0
+
+
+def test_owners_park_separately_for_one_tab():
+    store = TabCacheStore(budget=100)
+    store.park("viewer", "a", "v", 10)
+    store.park("thumbs", "a", "t", 20)
+    assert store.take("thumbs", "a") == "t"
+    assert store.take("viewer", "a") == "v"
+
+
+def test_least_recently_parked_is_evicted_over_budget():
+    evicted = []
+    store = TabCacheStore(budget=100)
+    for key in "abc":
+        store.park("viewer", key, key, 40, on_evict=evicted.append)
+    assert evicted == ["a"]
+    assert store.total_bytes == 80
+    assert store.take("viewer", "a") is None
+    assert store.take("viewer", "b") == "b"
+
+
+def test_reparking_moves_entry_to_the_back():
+    evicted = []
+    store = TabCacheStore(budget=100)
+    store.park("viewer", "a", "a1", 40, on_evict=evicted.append)
+    store.park("viewer", "b", "b", 40, on_evict=evicted.append)
+    store.park("viewer", "a", "a2", 40, on_evict=evicted.append)
+    assert evicted == ["a1"]            # replaced, not taken back
+    store.park("viewer", "c", "c", 40, on_evict=evicted.append)
+    assert evicted == ["a1", "b"]
+    assert store.take("viewer", "a") == "a2"
+
+
+def test_entry_larger_than_budget_is_not_kept():
+    evicted = []
+    store = TabCacheStore(budget=100)
+    store.park("viewer", "a", "small", 10, on_evict=evicted.append)
+    store.park("viewer", "b", "huge", 101, on_evict=evicted.append)
+    assert evicted == ["huge"]
+    assert store.total_bytes == 10
+    assert store.take("viewer", "a") == "small"
+
+
+def test_taken_entry_is_not_evicted():
+    evicted = []
+    store = TabCacheStore(budget=100)
+    store.park("viewer", "a", "a", 10, on_evict=evicted.append)
+    store.take("viewer", "a")
+    store.forget("a")
+    assert evicted == []
+
+
+def test_forget_drops_every_owner_of_a_tab():
+    evicted = []
+    store = TabCacheStore(budget=100)
+    store.park("viewer", "a", "va", 10, on_evict=evicted.append)
+    store.park("thumbs", "a", "ta", 10, on_evict=evicted.append)
+    store.park("viewer", "b", "vb", 10, on_evict=evicted.append)
+    store.forget("a")
+    assert sorted(evicted) == ["ta", "va"]
+    assert store.total_bytes == 10
+
+
+def test_image_bytes_of_qimage():
+    image = QImage(10, 20, QImage.Format.Format_RGB32)
+    assert image_bytes(image) == 10 * 20 * 4
+    assert image_bytes(None) == 0